@@ -0,0 +1,17 @@
+# benchmarks/__init__.py
+"""
+Microbenchmarks for pymaestro's own overhead.
+
+The suite times the orchestration hot paths (dispatching, job creation, the registry,
+the wrappers around `execute`, serialization and pool start-up) with no user code of
+any cost, so that a regression in pymaestro itself is not hidden by the jobs it runs.
+
+Run it from the root of the repository. It needs no network access:
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --baseline benchmarks/baseline.json --threshold 0.25
+"""
+
+from .harness import BENCHMARKS, Benchmark, benchmark, compare, run_benchmarks
+
+__all__ = ["BENCHMARKS", "Benchmark", "benchmark", "compare", "run_benchmarks"]
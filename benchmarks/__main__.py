@@ -0,0 +1,54 @@
+# benchmarks/__main__.py
+"""
+Command line entry point of the benchmark suite:
+
+    python -m benchmarks [--filter REGEX] [--quick] [--output FILE] [--baseline FILE] [--threshold 0.25]
+
+Results are written as JSON to `--output` (or stdout). With `--baseline`, the run is compared
+against a stored run and the exit status is 1 when any benchmark regressed beyond `--threshold`.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from . import suite  # noqa: F401  (registers the benchmarks)
+from .harness import compare, run_benchmarks
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n\n")[0])
+    parser.add_argument("-k", "--filter", help="Run only the benchmarks whose name matches this regular expression.")
+    parser.add_argument("--quick", action="store_true", help="Skip the slow benchmarks and take a single sample.")
+    parser.add_argument("-o", "--output", type=Path, help="Write the results to this JSON file instead of stdout.")
+    parser.add_argument("-b", "--baseline", type=Path, help="Compare the results against this JSON file.")
+    parser.add_argument(
+        "-t", "--threshold", type=float, default=0.25, help="Allowed slowdown against the baseline (default: 0.25)."
+    )
+    options = parser.parse_args(argv)
+
+    results = run_benchmarks(options.filter, quick=options.quick)
+    report = json.dumps(results, indent=2)
+    if options.output:
+        options.output.write_text(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
+
+    if options.baseline is None:
+        return 0
+
+    rows = compare(results, json.loads(options.baseline.read_text()), options.threshold)
+    width = max((len(row["name"]) for row in rows), default=0)
+    for row in rows:
+        verdict = "REGRESSED" if row["regressed"] else "ok"
+        sys.stderr.write(
+            f"{row['name']:<{width}}  {row['baseline'] * 1e6:>12.2f}us  {row['current'] * 1e6:>12.2f}us"
+            f"  x{row['ratio']:.2f}  {verdict}\n"
+        )
+
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
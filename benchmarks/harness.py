@@ -0,0 +1,145 @@
+# benchmarks/harness.py
+"""
+A minimal timing harness built on `timeit`: a registry of benchmarks, a runner that
+reports the best time per operation, and the comparison against a stored baseline.
+"""
+
+import platform
+import re
+import statistics
+import sys
+import timeit
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable
+
+__all__ = ["BENCHMARKS", "Benchmark", "benchmark", "run_benchmarks", "compare"]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    A named measurement.
+
+    Attributes:
+        name (str): A unique, dotted name, e.g. "registry.append[10000]".
+        setup (Callable[[], Callable[[], Any]]): Prepares the state outside the timing and returns
+            the operation to time.
+        number (int | None): The number of operations per sample. Chosen with `Timer.autorange` when None.
+        repeat (int): The number of samples.
+        self_timed (bool): The operation measures itself and returns the elapsed seconds, for
+            latencies that exclude some of the work of the call (e.g. shutting a pool down).
+        slow (bool): Skipped by `--quick` runs.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    number: int | None = None
+    repeat: int = 5
+    self_timed: bool = False
+    slow: bool = False
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, *, number: int | None = None, repeat: int = 5, self_timed: bool = False, slow: bool = False
+) -> Callable[[Callable[[], Callable[[], Any]]], Callable[[], Callable[[], Any]]]:
+    """Decorator factory that registers a setup function as the benchmark `name`."""
+
+    def decorator(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark '{name}' is already registered.")
+
+        BENCHMARKS[name] = Benchmark(name, setup, number, repeat, self_timed, slow)
+        return setup
+
+    return decorator
+
+
+def measure(bench: Benchmark, repeat: int | None = None) -> dict[str, Any]:
+    """Run one benchmark and return its best and median time per operation, in seconds."""
+    operation = bench.setup()
+    repeat = repeat or bench.repeat
+    if bench.self_timed:
+        number = 1
+        samples = [operation() for _ in range(repeat)]
+    else:
+        timer = timeit.Timer(operation)
+        number = bench.number or timer.autorange()[0]
+        samples = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+
+    return {
+        "seconds": min(samples),
+        "median": statistics.median(samples),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run_benchmarks(pattern: str | None = None, quick: bool = False) -> dict[str, Any]:
+    """
+    Run the registered benchmarks whose name matches the regular expression `pattern`.
+
+    With `quick`, slow benchmarks are skipped and every benchmark takes a single sample.
+
+    Returns:
+        dict[str, Any]: The environment of the run under "meta" and the results by name under "benchmarks".
+    """
+    selected = [
+        bench
+        for name, bench in BENCHMARKS.items()
+        if (pattern is None or re.search(pattern, name)) and not (quick and bench.slow)
+    ]
+    return {
+        "meta": _environment(),
+        "benchmarks": {bench.name: measure(bench, repeat=1 if quick else None) for bench in selected},
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.25) -> list[dict[str, Any]]:
+    """
+    Compare the results of a run against a baseline run.
+
+    A benchmark regresses when its best time exceeds the baseline by more than `threshold`
+    (a fraction, 0.25 meaning 25% slower). Benchmarks missing from either run are ignored.
+
+    Returns:
+        list[dict[str, Any]]: One row per common benchmark, with its times, ratio and verdict.
+    """
+    rows = []
+    for name, current in results["benchmarks"].items():
+        reference = baseline["benchmarks"].get(name)
+        if reference is None:
+            continue
+
+        ratio = current["seconds"] / reference["seconds"] if reference["seconds"] else float("inf")
+        rows.append(
+            {
+                "name": name,
+                "baseline": reference["seconds"],
+                "current": current["seconds"],
+                "ratio": ratio,
+                "regressed": ratio > 1 + threshold,
+            }
+        )
+
+    return rows
+
+
+def _environment() -> dict[str, Any]:
+    try:
+        package_version = version("python-maestro")
+    except PackageNotFoundError:
+        package_version = None
+
+    return {
+        "pymaestro": package_version,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
@@ -0,0 +1,284 @@
+# benchmarks/suite.py
+"""
+The benchmarks of pymaestro's hot paths.
+
+Every job runs `noop`, so that the measured time is the orchestration overhead only.
+Registry benchmarks are repeated at 1k, 10k and 100k jobs to expose non-linear costs.
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from pymaestro.job_registry import JobRegistry
+from pymaestro.jobs import CallableJob, Job, JobPool, create_job, create_jobs
+from pymaestro.utils import DependsOn, Dispatcher
+from pymaestro.utils.deserialize import deserialize
+from pymaestro.utils.registry_codec import dump_registry, load_registry
+from pymaestro.utils.registry_snapshot import dump_snapshot, load_snapshot
+from pymaestro.utils.serialize import serialize
+
+from .harness import benchmark
+
+REGISTRY_SIZES = (1_000, 10_000, 100_000)
+GROUP_SIZE = 8  # every other unit of the generated registries is a parallel group of this many jobs
+
+
+def noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+def make_jobs(n: int) -> list[Job]:
+    """Create `n` callable jobs, alternating single jobs with parallel groups of `GROUP_SIZE` jobs."""
+    jobs = []
+    for i in range(n):
+        unit, offset = divmod(i, GROUP_SIZE + 1)
+        parallel_group = f"group-{unit}" if offset else None
+        jobs.append(create_job("callable", name=f"job-{i}", executable=noop, parallel_group=parallel_group, args=(i,)))
+
+    return jobs
+
+
+# ---------------------------------------------------------------------------
+#  Dispatcher
+# ---------------------------------------------------------------------------
+
+
+def make_dispatcher(**options: Any) -> Dispatcher:
+    @Dispatcher(**options)
+    def dispatch(*args: Any, **kwargs: Any) -> None:
+        return None
+
+    dispatch.register(int if options.get("by_type") else "key")(noop)
+    return dispatch
+
+
+@benchmark("dispatcher.call")
+def bench_dispatcher_call() -> Callable[[], Any]:
+    dispatch = make_dispatcher()
+    return lambda: dispatch("key", 1)
+
+
+@benchmark("dispatcher.call.key_generator")
+def bench_dispatcher_call_key_generator() -> Callable[[], Any]:
+    dispatch = make_dispatcher(key_generator=lambda obj: obj.get("type"))
+    obj = {"type": "key", "value": 1}
+    return lambda: dispatch(obj)
+
+
+@benchmark("dispatcher.call.by_type")
+def bench_dispatcher_call_by_type() -> Callable[[], Any]:
+    dispatch = make_dispatcher(by_type=True)
+    return lambda: dispatch(True)  # resolved through the MRO of bool, then cached
+
+
+@benchmark("dispatcher.extract_key.index")
+def bench_extract_key_index() -> Callable[[], Any]:
+    dispatch = make_dispatcher()
+    args, kwargs = ("key", 1), {}
+    return lambda: dispatch.extract_key(args, kwargs)
+
+
+@benchmark("dispatcher.extract_key.names")
+def bench_extract_key_names() -> Callable[[], Any]:
+    dispatch = make_dispatcher(key_names="kind")
+    args, kwargs = (), {"kind": "key", "value": 1}
+    return lambda: dispatch.extract_key(args, kwargs)
+
+
+# ---------------------------------------------------------------------------
+#  Jobs
+# ---------------------------------------------------------------------------
+
+
+@benchmark("create_job.callable")
+def bench_create_callable_job() -> Callable[[], Any]:
+    return lambda: create_job("callable", name="job", executable=noop, args=(1,), kwargs={"x": 1})
+
+
+@benchmark("create_jobs.callable[1000]", number=1)
+def bench_create_callable_jobs() -> Callable[[], Any]:
+    rows = [{"name": f"job-{i}", "executable": noop, "args": (i,), "kwargs": {"x": 1}} for i in range(1_000)]
+    return lambda: create_jobs("callable", rows)
+
+
+@benchmark("execute.wrapped")
+def bench_execute_wrapped() -> Callable[[], Any]:
+    """`execute` through the wrapper compiled from `is_completed`, `cached` and `inject_dependencies`."""
+    job = create_job("callable", name="job", executable=noop, args=(1,), kwargs={"x": 1})
+
+    def operation() -> None:
+        job.is_completed = False
+        job.execute()
+
+    return operation
+
+
+class WraptCallableJob(CallableJob, plain_wrappers=False):
+    """A CallableJob wrapped by the `wrapt` layers, as the jobs defined without `plain_wrappers` are."""
+
+
+@benchmark("execute.wrapt")
+def bench_execute_wrapt() -> Callable[[], Any]:
+    """`execute` through the `is_completed`, `cached` and `inject_dependencies` wrapt layers."""
+    job = WraptCallableJob(name="job", executable=noop, args=(1,), kwargs={"x": 1})
+
+    def operation() -> None:
+        job.is_completed = False
+        job.execute()
+
+    return operation
+
+
+@benchmark("execute.unwrapped")
+def bench_execute_unwrapped() -> Callable[[], Any]:
+    """The same work as `execute.wrapped` without the wrappers, as a reference for their overhead."""
+    job = create_job("callable", name="job", executable=noop, args=(1,), kwargs={"x": 1})
+
+    def operation() -> None:
+        job.is_completed = False
+        job.executable(*job.args, **job.kwargs)
+        job.is_completed = True
+
+    return operation
+
+
+# ---------------------------------------------------------------------------
+#  JobRegistry
+# ---------------------------------------------------------------------------
+
+
+def bench_registry_append(n: int) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        jobs = make_jobs(n)
+
+        def operation() -> None:
+            registry = JobRegistry()
+            for job in jobs:
+                registry.append(job)
+
+        return operation
+
+    return setup
+
+
+def bench_registry_append_cached(n: int) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        jobs = [create_job("callable", name=f"job-{i}", executable=noop, parallel_group="group") for i in range(n)]
+
+        def operation() -> Any:
+            # Every job joins a parallel group that is already part of the cached plan
+            registry = JobRegistry(jobs[:1])
+            registry.group_jobs_by_parallel_name()
+            for job in jobs[1:]:
+                registry.append(job)
+            return registry.grouped_jobs
+
+        return operation
+
+    return setup
+
+
+def bench_registry_extend_bulk(n: int) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        jobs = make_jobs(n)
+        return lambda: JobRegistry().extend_bulk(jobs)
+
+    return setup
+
+
+def bench_registry_grouped_jobs(n: int) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        registry = JobRegistry(make_jobs(n))
+
+        def operation() -> Any:
+            registry.reset_cached()
+            return registry.grouped_jobs
+
+        return operation
+
+    return setup
+
+
+def bench_registry_index(n: int) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        registry = JobRegistry(make_jobs(n))
+        last = registry[-1].name
+        return lambda: registry.index(last)
+
+    return setup
+
+
+for size in REGISTRY_SIZES:
+    benchmark(f"registry.append[{size}]", number=1, repeat=3, slow=size > 10_000)(bench_registry_append(size))
+    benchmark(f"registry.append_cached[{size}]", number=1, repeat=3, slow=size > 10_000)(
+        bench_registry_append_cached(size)
+    )
+    benchmark(f"registry.extend_bulk[{size}]", number=1, repeat=3, slow=size > 10_000)(bench_registry_extend_bulk(size))
+    benchmark(f"registry.grouped_jobs[{size}]", number=1, repeat=3, slow=size > 10_000)(
+        bench_registry_grouped_jobs(size)
+    )
+    benchmark(f"registry.index[{size}]", slow=size > 10_000)(bench_registry_index(size))
+
+
+# ---------------------------------------------------------------------------
+#  Serialization
+# ---------------------------------------------------------------------------
+
+
+@benchmark("serialize.round_trip[1000]", number=1)
+def bench_serialize_round_trip() -> Callable[[], Any]:
+    jobs = make_jobs(1_000)
+    for previous, job in zip(jobs, jobs[1:], strict=False):
+        job.kwargs["upstream"] = DependsOn(previous.name)
+
+    registry = JobRegistry(jobs)
+    return lambda: json.loads(json.dumps(registry, default=serialize), object_hook=deserialize)
+
+
+@benchmark("serialize.stream_round_trip[1000]", number=1)
+def bench_serialize_stream_round_trip() -> Callable[[], Any]:
+    jobs = make_jobs(1_000)
+    for previous, job in zip(jobs, jobs[1:], strict=False):
+        job.kwargs["upstream"] = DependsOn(previous.name)
+
+    directory = tempfile.TemporaryDirectory()  # removed when the benchmark is garbage collected
+    path = Path(directory.name) / "registry.jsonl"
+    return lambda: (directory, load_registry(dump_registry(jobs, path)))
+
+
+@benchmark("serialize.snapshot_load[10000]", number=1)
+def bench_serialize_snapshot_load() -> Callable[[], Any]:
+    """Loading a binary snapshot, which indexes the jobs without building them."""
+    directory = tempfile.TemporaryDirectory()
+    path = dump_snapshot(make_jobs(10_000), Path(directory.name) / "registry.bin")
+    return lambda: (directory, load_snapshot(path))
+
+
+# ---------------------------------------------------------------------------
+#  JobPool
+# ---------------------------------------------------------------------------
+
+
+def bench_pool_first_result(backend: str) -> Callable[[], Callable[[], float]]:
+    """The latency from starting a pool of 4 jobs on a new executor to receiving its first result."""
+
+    def setup() -> Callable[[], float]:
+        def operation() -> float:
+            pool = JobPool(*(create_job("callable", f"job-{i}", noop, parallel_group="pool") for i in range(4)))
+            start = time.perf_counter()
+            results = pool.execute_iter(max_workers=2, executor=backend)
+            next(results)
+            elapsed = time.perf_counter() - start
+            results.close()  # shutting the executor down is not part of the latency
+            return elapsed
+
+        return operation
+
+    return setup
+
+
+for backend in ("inline", "thread", "asyncio", "process"):
+    benchmark(f"pool.first_result[{backend}]", repeat=5, self_timed=True)(bench_pool_first_result(backend))
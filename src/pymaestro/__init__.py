@@ -1,8 +1,60 @@
 # src/pymaestro/__init__.py
-from .jobs import SUPPORTED_JOB_TYPES, Job
-from .maestro import Maestro
-from .utils import DependsOn, Resource
-from .utils.deserialize import deserialize
-from .utils.serialize import serialize
+"""
+pymaestro
+=========
 
-__all__ = ["Maestro", "DependsOn", "Resource", "Job", "SUPPORTED_JOB_TYPES", "deserialize", "serialize"]
+The public names are imported from their submodules on first access, so that `import pymaestro`
+(and the start of the `maestro` CLI) does not import the executors, asyncio or wrapt until they
+are needed. The import time is kept within `IMPORT_TIME_BUDGET_MS`, checked by the test suite.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+__all__ = [
+    "Maestro",
+    "DependsOn",
+    "Resource",
+    "Broadcast",
+    "Job",
+    "SUPPORTED_JOB_TYPES",
+    "deserialize",
+    "serialize",
+]
+
+# The maximum cumulative time of `import pymaestro` and `import pymaestro.cli`, as reported by `python -X importtime`
+IMPORT_TIME_BUDGET_MS = 30
+
+# The submodule that defines each public name
+_SUBMODULES = {
+    "Maestro": ".maestro",
+    "DependsOn": ".utils",
+    "Resource": ".utils",
+    "Broadcast": ".utils",
+    "Job": ".jobs",
+    "SUPPORTED_JOB_TYPES": ".jobs",
+    "deserialize": ".utils.deserialize",
+    "serialize": ".utils.serialize",
+}
+
+if TYPE_CHECKING:
+    from .jobs import SUPPORTED_JOB_TYPES, Job
+    from .maestro import Maestro
+    from .utils import Broadcast, DependsOn, Resource
+    from .utils.deserialize import deserialize
+    from .utils.serialize import serialize
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        submodule = _SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value  # later accesses skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,242 @@
+# src/pymaestro/cache.py
+"""
+pymaestro.cache
+===============
+
+A content-addressed, on-disk cache for the results of callable jobs.
+
+A job's cache key is a stable hash of:
+- the import path of its executable,
+- the source code of its executable (so that editing the function invalidates its entries),
+- its pickled arguments, after `DependsOn` markers have been resolved. A `Broadcast` is
+  pickled as the digest of its value, so that computing a key does not share it with workers.
+
+Entries are single files, written atomically, so that many `JobPool` workers can read
+and write the same cache directory at the same time. The cache is bounded by the total
+size of its entries, evicting the least recently used ones first, and entries may
+expire after a time-to-live.
+"""
+
+import hashlib
+import inspect
+import io
+import os
+import pickle
+import struct
+import sys
+import time
+from pathlib import Path
+from types import BuiltinFunctionType, FunctionType, MethodType
+from typing import Any
+
+from .utils.files import atomic_write
+
+__all__ = ["ResultCache", "DEFAULT_CACHE_DIR"]
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "pymaestro"
+
+# Every entry starts with its creation time, so that expiration can be checked without unpickling the result
+_HEADER = struct.Struct("<d")
+_SUFFIX = ".result"
+
+
+class ResultCache:
+    """
+    Cache the results of `CallableJob`s in a local directory.
+
+    Attach a cache to Maestro to skip jobs whose executable and arguments did not change
+    since their last run:
+
+        maestro = Maestro(cache=ResultCache(".maestro_cache", max_bytes=2**30, ttl=24 * 3600))
+
+    Attributes:
+        directory (Path): The directory that stores the entries.
+        max_bytes (int | None): The maximum total size of the entries. Unbounded by default.
+        ttl (float | None): The number of seconds after which an entry expires. Never by default.
+    """
+
+    def __init__(
+        self, directory: str | Path = DEFAULT_CACHE_DIR, max_bytes: int | None = None, ttl: float | None = None
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+    def key(self, job: Any) -> str | None:
+        """
+        Return the cache key of `job`, or None when the job cannot be cached.
+
+        Only jobs with `args` and `kwargs` (callable jobs) are cached. Jobs whose executable
+        or arguments cannot be pickled are never cached.
+        """
+        if not (hasattr(job, "args") and hasattr(job, "kwargs") and callable(job.executable)):
+            return None
+
+        executable = job.executable
+        is_function = isinstance(executable, (FunctionType, MethodType, BuiltinFunctionType))
+        target = executable if is_function else type(executable)
+
+        try:
+            source = inspect.getsource(target)
+        except (OSError, TypeError):
+            source = ""
+
+        try:
+            # Functions are pickled by reference, callable objects together with their state
+            arguments = _dumps_key((job.args, job.kwargs, None if is_function else executable))
+        except Exception:
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(f"{type(job).__qualname__}:{target.__module__}.{target.__qualname__}".encode())
+        digest.update(source.encode())
+        digest.update(arguments)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """
+        Look up an entry.
+
+        Returns:
+            tuple[bool, Any]: `(True, result)` on a hit, `(False, None)` on a miss.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                (created_at,) = _HEADER.unpack(f.read(_HEADER.size))
+                if self._is_expired(created_at):
+                    raise FileNotFoundError(path)
+
+                value = pickle.load(f)
+        except (FileNotFoundError, EOFError, struct.error, pickle.UnpicklingError):
+            return False, None
+
+        # Refresh the modification time, which orders the entries for the LRU eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        return True, value
+
+    def put(self, key: str, value: Any) -> bool:
+        """
+        Store `value` under `key`. Returns False when the value cannot be pickled.
+        """
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+
+        atomic_write(self._path(key), _HEADER.pack(time.time()), payload)
+
+        if self.max_bytes is not None:
+            self.evict()
+
+        return True
+
+    def evict(self) -> int:
+        """
+        Remove expired entries, then the least recently used entries until the cache fits in `max_bytes`.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        entries = []
+        removed = 0
+        for path, stat in self._entries():
+            if self.ttl is not None and self._is_expired(self._created_at(path)):
+                removed += self._remove(path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        if self.max_bytes is not None:
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_bytes <= self.max_bytes:
+                    break
+
+                removed += self._remove(path)
+                total_bytes -= size
+
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        """Return the number of entries, their total size and the number of expired entries."""
+        entries = list(self._entries())
+        expired = 0
+        if self.ttl is not None:
+            expired = sum(1 for path, _ in entries if self._is_expired(self._created_at(path)))
+
+        return {
+            "directory": str(self.directory),
+            "entries": len(entries),
+            "bytes": sum(stat.st_size for _, stat in entries),
+            "expired": expired,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+        }
+
+    def clear(self) -> int:
+        """Remove every entry. Returns the number of removed entries."""
+        return sum(self._remove(path) for path, _ in list(self._entries()))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def _entries(self):
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(_SUFFIX):
+                        try:
+                            yield Path(entry.path), entry.stat()
+                        except FileNotFoundError:  # removed by a concurrent writer
+                            continue
+        except FileNotFoundError:
+            return
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    @staticmethod
+    def _created_at(path: Path) -> float:
+        try:
+            with open(path, "rb") as f:
+                return _HEADER.unpack(f.read(_HEADER.size))[0]
+        except (FileNotFoundError, struct.error):
+            return 0.0
+
+    @staticmethod
+    def _remove(path: Path) -> int:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return 0
+        return 1
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}"
+            f"(directory={str(self.directory)!r},"
+            f" max_bytes={self.max_bytes!r},"
+            f" ttl={self.ttl!r})"
+        )
+
+
+class _KeyPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, broadcast_type: type | tuple[()]) -> None:
+        super().__init__(file, protocol=5)
+        self.broadcast_type = broadcast_type
+
+    def persistent_id(self, obj: Any) -> Any:
+        # Pickling a Broadcast would write its value to a shared memory segment
+        return ("Broadcast", obj.digest) if isinstance(obj, self.broadcast_type) else None
+
+
+def _dumps_key(value: Any) -> bytes:
+    # There is no Broadcast to look for until its module is imported, which the cache does not need otherwise
+    wrappers = sys.modules.get(f"{__package__}.utils.wrappers")
+    stream = io.BytesIO()
+    _KeyPickler(stream, wrappers.Broadcast if wrappers is not None else ()).dump(value)
+    return stream.getvalue()
@@ -0,0 +1,103 @@
+# src/pymaestro/checkpoint.py
+"""
+pymaestro.checkpoint
+====================
+
+Persist the progress of a run, so that an interrupted run can be resumed.
+
+Every job that finishes is written to the checkpoint of its run right away, as a
+single file holding the job's name and result. Resuming a run loads those files,
+marks the jobs as completed with their stored results, and executes only the rest.
+"""
+
+import hashlib
+import pickle
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from .utils.files import atomic_write
+
+__all__ = ["CheckpointStore", "DEFAULT_CHECKPOINT_DIR"]
+
+DEFAULT_CHECKPOINT_DIR = Path(".maestro") / "runs"
+
+_SUFFIX = ".checkpoint"
+
+
+class CheckpointStore:
+    """
+    The completion state and results of the jobs of one run.
+
+    Start a run with a new store, and pass a store with the same `run_id` to resume it:
+
+        checkpoint = CheckpointStore()
+        maestro.execute(checkpoint=checkpoint)  # interrupted
+        maestro.execute(checkpoint=CheckpointStore(checkpoint.run_id))  # only runs the remaining jobs
+
+    Attributes:
+        run_id (str): The identifier of the run. Defaults to a new, timestamped identifier.
+        directory (Path): The directory holding the checkpoints of all runs.
+    """
+
+    def __init__(self, run_id: str | None = None, directory: str | Path = DEFAULT_CHECKPOINT_DIR) -> None:
+        self.run_id = run_id or f"{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        self.directory = Path(directory)
+
+    @property
+    def path(self) -> Path:
+        """The directory holding the checkpoint of this run."""
+        return self.directory / self.run_id
+
+    def save(self, name: str, result: Any) -> bool:
+        """
+        Record that the job `name` completed with `result`.
+
+        Returns False when the result cannot be pickled. Such jobs are executed again on resume.
+        """
+        try:
+            payload = pickle.dumps((name, result), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+
+        atomic_write(self._path(name), payload)
+        return True
+
+    def load(self) -> dict[str, Any]:
+        """Return the results of the completed jobs of the run, by job name."""
+        completed = {}
+        for path in self._entries():
+            with open(path, "rb") as f:
+                name, result = pickle.load(f)
+            completed[name] = result
+
+        return completed
+
+    def clear(self) -> None:
+        """Remove the checkpoint of this run."""
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+
+        if self.path.exists():
+            self.path.rmdir()
+
+    @classmethod
+    def runs(cls, directory: str | Path = DEFAULT_CHECKPOINT_DIR) -> list[str]:
+        """Return the identifiers of the runs with a checkpoint in `directory`, oldest first."""
+        directory = Path(directory)
+        if not directory.is_dir():
+            return []
+
+        return sorted(path.name for path in directory.iterdir() if path.is_dir())
+
+    def _path(self, name: str) -> Path:
+        # Job names may contain characters that are not valid in file names
+        return self.path / f"{hashlib.sha256(name.encode()).hexdigest()[:32]}{_SUFFIX}"
+
+    def _entries(self) -> Iterator[Path]:
+        if self.path.is_dir():
+            yield from self.path.glob(f"*{_SUFFIX}")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(run_id={self.run_id!r}, directory={str(self.directory)!r})"
@@ -1,10 +1,41 @@
 # src/pymaestro/cli.py
 import shlex
 from pathlib import Path
+from typing import Any
 
-from pymaestro import Maestro
+# Maestro and the modules used by the subcommands are imported by the subcommand that runs,
+# so that the CLI starts without importing the executors, asyncio or wrapt
+_maestro = None
+_journal_dir: Path | None = None
 
-maestro = Maestro()
+
+def get_maestro() -> Any:
+    """
+    Return the Maestro of the CLI, created on first use.
+    With `--journal`, its registry is loaded from the journal, and changes to it are recorded there.
+    """
+    global _maestro
+    if _maestro is None:
+        from pymaestro import Maestro
+
+        if _journal_dir is None:
+            _maestro = Maestro()
+        else:
+            from pymaestro.journal import RegistryJournal
+            from pymaestro.utils.imports import lazy_executables
+
+            # Jobs import their executables when they run, not to be listed
+            with lazy_executables():
+                _maestro = Maestro(journal=RegistryJournal(_journal_dir))
+
+    return _maestro
+
+
+def __getattr__(name: str) -> Any:
+    if name == "maestro":
+        return get_maestro()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main():  # noqa: C901
@@ -15,127 +46,414 @@ def main():  # noqa: C901
             "Click is required for the CLI. Install Maestro with CLI support:\n\n    pip install python-maestro[cli]\n"
         ) from None
 
-    @click.group()
-    def cli():
-        pass
-
-    @click.command
-    @click.argument("executable", required=True)
-    @click.argument(
-        "_type",
-        required=True,
-        metavar="TYPE",
-        type=click.Choice(["script", "callable", "async_callable"], case_sensitive=True),
-    )
-    @click.option("-n", "--name", default=None)
-    @click.option("-p", "--parallel_group", default=None)
-    @click.option("-a", "--args", type=str, multiple=True, default=None)
-    def add(
-        executable: str, _type: str, name: str | None, parallel_group: str | None, args: tuple[str, ...] | None
-    ) -> None:
-        """Add a new job"""
-        if name is None and _type in ("callable", "async_callable"):
-            name = executable.rsplit(".", maxsplit=1)[1]
-        elif name is None and _type == "script":
-            name = executable
-
-        maestro.add(executable, job_type=_type, name=name, parallel_group=parallel_group, args=args)
-        click.echo(f"Added job '{name}' ({_type}) from '{executable}'.")
-
-    @click.command
-    @click.argument("name_or_idx", required=True)
-    @click.option(
-        "--by-index", is_flag=True, default=False, help="Treat the argument as a job index instead of a name."
-    )
-    def remove(name_or_idx: str, by_index: bool) -> None:
-        """Remove a scheduled job by name or index."""
-        if by_index:
-            maestro.registry.pop(int(float(name_or_idx)))
-            click.echo(f"Removed job at position {name_or_idx}.")
-        else:
-            maestro.registry.remove(name_or_idx)
-            click.echo(f"Removed job '{name_or_idx}'.")
-
-    @click.command
-    @click.option("-n", "--name", default=None)
-    def show(name: str | None) -> None:
-        """List scheduled jobs"""
-        if name:
-            job_idx = maestro.registry.index(name)
-            job = maestro.registry[job_idx]
-            click.echo(f"Job: {str(job.name)}\nInsertion Order: {job_idx}")
-        else:
-            grouped_jobs = maestro.registry.grouped_jobs.items()
-            output = ""
-            for job, priority in grouped_jobs:
-                output += f"{priority}: {str(job)}\n"
-                output += "--" * 10 + "\n"
-
-            click.echo(output)
-
-    @click.command
-    def execute():
-        """Execute all the scheduled job"""
-        results = maestro.execute()
-        click.echo("Results: ")
-        for result in results:
-            click.echo(f"  > {result}")
-
-    @click.command
-    @click.option("-p", "--path", default=None, help="Path to write the json string of JobRegistry. Default to console")
-    def serialize_command(path: str | None) -> str | None:
-        """
-        Serialize the current state of JobRegistry
-        """
-        json_str = maestro.serialize(path)
-        click.echo(json_str)
-
-    @click.command
-    @click.argument("path", type=click.Path(exists=True, dir_okay=False, readable=True, path_type=Path), required=True)
-    def deserialize_command(path: str | None) -> None:
-        """
-        Initialize the current state of JobRegistry from a JSON string
-        """
-        maestro.deserialize(path)
-        click.echo(maestro.registry.grouped_jobs)
-
-    @click.command()
-    def shell():
-        """
-        Open an interactive Maestro shell to allow chaining multiple commands.
-        Type 'exit' or 'quit' to leave the shell.
-        """
-        import sys
-        from pathlib import Path
-
-        cwd = Path.cwd()
-        sys.path.insert(0, str(cwd))
-        click.echo("Entering Maestro shell. Type 'exit' or 'quit' to terminate the session.")
-        while True:
+    class LazyGroup(click.Group):
+        """A group whose subcommands are built, together with their imports, when they are first invoked."""
+
+        def __init__(self, *args, builders=None, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            self.builders = builders or {}
+
+        def list_commands(self, ctx) -> list[str]:
+            return sorted({*super().list_commands(ctx), *self.builders})
+
+        def get_command(self, ctx, name: str):
+            if name not in self.commands and name in self.builders:
+                self.add_command(self.builders[name](), name)
+
+            return super().get_command(ctx, name)
+
+    def build_add():
+        from pymaestro.executors import SUPPORTED_EXECUTORS
+
+        maestro = get_maestro()
+
+        @click.command
+        @click.argument("executable", required=True)
+        @click.argument(
+            "_type",
+            required=True,
+            metavar="TYPE",
+            type=click.Choice(["script", "callable", "async_callable"], case_sensitive=True),
+        )
+        @click.option("-n", "--name", default=None)
+        @click.option("-p", "--parallel_group", default=None)
+        @click.option("-a", "--args", type=str, multiple=True, default=None)
+        @click.option(
+            "-e",
+            "--executor",
+            default=None,
+            type=click.Choice(sorted(SUPPORTED_EXECUTORS), case_sensitive=True),
+            help="Executor backend of the job's parallel group. Defaults to 'process'.",
+        )
+        @click.option(
+            "--isolated",
+            is_flag=True,
+            default=False,
+            help="Run a script in its own interpreter (a subprocess) instead of in a worker.",
+        )
+        @click.option(
+            "--output",
+            "outputs",
+            multiple=True,
+            help="A variable of the script returned as part of the job's result. Repeat for several variables.",
+        )
+        def add(
+            executable: str,
+            _type: str,
+            name: str | None,
+            parallel_group: str | None,
+            args: tuple[str, ...] | None,
+            executor: str | None,
+            isolated: bool,
+            outputs: tuple[str, ...],
+        ) -> None:
+            """Add a new job"""
+            if name is None and _type in ("callable", "async_callable"):
+                name = executable.rsplit(".", maxsplit=1)[1]
+            elif name is None and _type == "script":
+                name = executable
+
+            if isolated and _type != "script":
+                raise click.BadParameter("Only scripts can be isolated.", param_hint="--isolated")
+
+            if outputs and (_type != "script" or isolated):
+                raise click.BadParameter(
+                    "Only scripts that are not isolated can declare outputs.", param_hint="--output"
+                )
+
+            maestro.add(
+                executable,
+                job_type=_type,
+                name=name,
+                parallel_group=parallel_group,
+                args=args,
+                executor=executor,
+                isolated=isolated,
+                outputs=list(outputs) or None,
+            )
+            click.echo(f"Added job '{name}' ({_type}) from '{executable}'.")
+
+        return add
+
+    def build_remove():
+        maestro = get_maestro()
+
+        @click.command
+        @click.argument("name_or_idx", required=True)
+        @click.option(
+            "--by-index", is_flag=True, default=False, help="Treat the argument as a job index instead of a name."
+        )
+        def remove(name_or_idx: str, by_index: bool) -> None:
+            """Remove a scheduled job by name or index."""
+            if by_index:
+                maestro.registry.pop(int(float(name_or_idx)))
+                click.echo(f"Removed job at position {name_or_idx}.")
+            else:
+                maestro.registry.remove(name_or_idx)
+                click.echo(f"Removed job '{name_or_idx}'.")
+
+        return remove
+
+    def build_show():
+        maestro = get_maestro()
+
+        @click.command
+        @click.option("-n", "--name", default=None)
+        def show(name: str | None) -> None:
+            """List scheduled jobs"""
+            if name:
+                job_idx = maestro.registry.index(name)
+                job = maestro.registry[job_idx]
+                click.echo(f"Job: {str(job.name)}\nInsertion Order: {job_idx}")
+            else:
+                grouped_jobs = maestro.registry.grouped_jobs.items()
+                output = ""
+                for job, priority in grouped_jobs:
+                    output += f"{priority}: {str(job)}\n"
+                    output += "--" * 10 + "\n"
+
+                click.echo(output)
+
+        return show
+
+    def build_execute():
+        from pymaestro.cache import ResultCache
+        from pymaestro.checkpoint import DEFAULT_CHECKPOINT_DIR, CheckpointStore
+        from pymaestro.metrics import Metrics, StatsdSink
+        from pymaestro.tracing import Tracer
+
+        maestro = get_maestro()
+
+        @click.command
+        @click.option(
+            "-s",
+            "--schedule",
+            default="priority",
+            type=click.Choice(["priority", "graph"], case_sensitive=True),
+            help="Run jobs in priority order, or as soon as their dependencies have finished.",
+        )
+        @click.option("--stream", is_flag=True, default=False, help="Print each result as soon as its job finishes.")
+        @click.option(
+            "--cache-dir",
+            default=None,
+            type=click.Path(file_okay=False, path_type=Path),
+            help="Cache the results of callable jobs in this directory and reuse them on the next run.",
+        )
+        @click.option(
+            "--checkpoint",
+            is_flag=True,
+            default=False,
+            help="Persist each job's result, so that the run can be resumed.",
+        )
+        @click.option(
+            "--resume",
+            "run_id",
+            default=None,
+            help="Resume the run with this id: completed jobs are skipped and their stored results reused.",
+        )
+        @click.option(
+            "--checkpoint-dir",
+            default=str(DEFAULT_CHECKPOINT_DIR),
+            show_default=True,
+            type=click.Path(file_okay=False, path_type=Path),
+            help="The directory holding the checkpoints of the runs.",
+        )
+        @click.option(
+            "--trace",
+            "trace_path",
+            default=None,
+            type=click.Path(dir_okay=False, path_type=Path),
+            help="Record the spans of the run and write them to this file.",
+        )
+        @click.option(
+            "--trace-format",
+            default="chrome",
+            show_default=True,
+            type=click.Choice(["chrome", "otlp"], case_sensitive=True),
+            help="The format of the trace file: Chrome trace events (Perfetto) or OTLP-JSON.",
+        )
+        @click.option(
+            "--metrics-file",
+            default=None,
+            type=click.Path(dir_okay=False, path_type=Path),
+            help="Write the metrics of the run to this file in the Prometheus text format.",
+        )
+        @click.option(
+            "--statsd",
+            default=None,
+            metavar="HOST[:PORT]",
+            callback=parse_address,
+            help="Send the metrics of the run to a statsd daemon (port 8125 by default).",
+        )
+        def execute(
+            schedule: str,
+            stream: bool,
+            cache_dir: Path | None,
+            checkpoint: bool,
+            run_id: str | None,
+            checkpoint_dir: Path,
+            trace_path: Path | None,
+            trace_format: str,
+            metrics_file: Path | None,
+            statsd: tuple[str, int] | None,
+        ) -> None:
+            """Execute all the scheduled job"""
+            maestro.cache = ResultCache(cache_dir) if cache_dir else None
+            maestro.tracer = Tracer() if trace_path else None
+            sinks = [StatsdSink(*statsd)] if statsd else []
+            maestro.metrics = Metrics(sinks=sinks) if metrics_file or sinks else None
+
             try:
-                user_input = click.prompt("> maestro", prompt_suffix=" ").strip()
-                if not user_input:
-                    continue
-                if user_input in ("exit", "quit"):
-                    break
-
-                args = shlex.split(user_input)
-
-                cli.main(args=args, standalone_mode=False)
-            except click.ClickException as e:
-                e.show()
-            except Exception as e:
-                click.secho(f"Unexpected error: {e}", fg="red")
-
-        click.echo("Exiting Maestro shell...")
-
-    cli.add_command(shell)
-    cli.add_command(add)
-    cli.add_command(remove)
-    cli.add_command(show)
-    cli.add_command(execute)
-    cli.add_command(serialize_command)
-    cli.add_command(deserialize_command)
+                run(schedule, stream, checkpoint, run_id, checkpoint_dir)
+            finally:
+                if maestro.tracer is not None:
+                    export = maestro.tracer.export_chrome if trace_format == "chrome" else maestro.tracer.export_otlp
+                    click.echo(f"Trace: {export(trace_path)}")
+                if metrics_file is not None:
+                    click.echo(f"Metrics: {maestro.metrics.export_prometheus(metrics_file)}")
+                if maestro.metrics is not None:
+                    maestro.metrics.close()
+
+        def run(schedule: str, stream: bool, checkpoint: bool, run_id: str | None, checkpoint_dir: Path) -> None:
+            checkpoint_store = CheckpointStore(run_id, checkpoint_dir) if checkpoint or run_id else None
+            if checkpoint_store is not None:
+                click.echo(f"Run id: {checkpoint_store.run_id}")
+
+            if stream:
+                events = maestro.execute_iter(schedule=schedule, mode="as_completed", checkpoint=checkpoint_store)
+                for name, result in events:
+                    click.echo(f"  > {name}: {result}")
+                return
+
+            results = maestro.execute(schedule=schedule, checkpoint=checkpoint_store)
+            click.echo("Results: ")
+            for result in results:
+                click.echo(f"  > {result}")
+
+        return execute
+
+    def build_serialize():
+        maestro = get_maestro()
+
+        @click.command
+        @click.option(
+            "-p", "--path", default=None, help="Path to write the json string of JobRegistry. Default to console"
+        )
+        @click.option(
+            "--stream",
+            is_flag=True,
+            default=False,
+            help="Write the jobs one per line (JSON Lines) to --path, without building the whole document in memory.",
+        )
+        @click.option(
+            "--binary",
+            is_flag=True,
+            default=False,
+            help="Write a binary snapshot to --path, which is loaded without decoding every job up front.",
+        )
+        def serialize_command(path: str | None, stream: bool, binary: bool) -> str | None:
+            """
+            Serialize the current state of JobRegistry
+            """
+            if stream or binary:
+                if path is None:
+                    raise click.BadParameter("A path is required to write the registry to a file.", param_hint="--path")
+                elif stream and binary:
+                    raise click.BadParameter("Choose one of --stream and --binary.", param_hint="--binary")
+                click.echo(f"Wrote {len(maestro.registry)} jobs to '{maestro.dump(path, binary=binary)}'.")
+                return
+
+            json_str = maestro.serialize(path)
+            click.echo(json_str)
+
+        return serialize_command
+
+    def build_deserialize():
+        maestro = get_maestro()
+
+        @click.command
+        @click.argument(
+            "path", type=click.Path(exists=True, dir_okay=False, readable=True, path_type=Path), required=True
+        )
+        def deserialize_command(path: str | None) -> None:
+            """
+            Initialize the current state of JobRegistry from a JSON string
+            """
+            # Jobs import their executables when they run, not to be listed
+            maestro.deserialize(path, lazy=True)
+            click.echo(maestro.registry.grouped_jobs)
+
+        return deserialize_command
+
+    def build_cache():
+        from pymaestro.cache import DEFAULT_CACHE_DIR, ResultCache
+
+        @click.group()
+        def cache():
+            """Inspect or clear the result cache"""
+            pass
+
+        cache_dir_option = click.option(
+            "-d",
+            "--dir",
+            "directory",
+            default=str(DEFAULT_CACHE_DIR),
+            show_default=True,
+            type=click.Path(file_okay=False, path_type=Path),
+            help="The cache directory.",
+        )
+
+        @cache.command
+        @cache_dir_option
+        def stats(directory: Path) -> None:
+            """Show the number of entries and the size of the cache"""
+            for key, value in ResultCache(directory).stats().items():
+                click.echo(f"{key}: {value}")
+
+        @cache.command
+        @cache_dir_option
+        def clear(directory: Path) -> None:
+            """Remove every entry of the cache"""
+            removed = ResultCache(directory).clear()
+            click.echo(f"Removed {removed} entries from '{directory}'.")
+
+        return cache
+
+    def build_shell():
+
+        @click.command()
+        def shell():
+            """
+            Open an interactive Maestro shell to allow chaining multiple commands.
+            Type 'exit' or 'quit' to leave the shell.
+            """
+            import sys
+            from pathlib import Path
+
+            cwd = Path.cwd()
+            sys.path.insert(0, str(cwd))
+            click.echo("Entering Maestro shell. Type 'exit' or 'quit' to terminate the session.")
+            while True:
+                try:
+                    user_input = click.prompt("> maestro", prompt_suffix=" ").strip()
+                    if not user_input:
+                        continue
+                    if user_input in ("exit", "quit"):
+                        break
+
+                    args = shlex.split(user_input)
+
+                    cli.main(args=args, standalone_mode=False)
+                except click.ClickException as e:
+                    e.show()
+                except Exception as e:
+                    click.secho(f"Unexpected error: {e}", fg="red")
+
+            click.echo("Exiting Maestro shell...")
+
+        return shell
+
+    def parse_address(ctx, param, value: str | None) -> tuple[str, int] | None:
+        # HOST[:PORT] of a statsd daemon, on its default port when none is given
+        if value is None:
+            return None
+
+        host, separator, port = value.rpartition(":")
+        if not separator:
+            return value, 8125
+        if not port.isdigit() or not 0 < int(port) < 65536:
+            raise click.BadParameter(f"Invalid port {port!r}: expected HOST[:PORT].")
+        return host or "127.0.0.1", int(port)
+
+    def set_journal_dir(ctx, param, value: Path | None) -> None:
+        # Parsed before the subcommand is built, which creates the Maestro of the CLI
+        global _journal_dir
+        _journal_dir = value
+
+    cli = LazyGroup(
+        "cli",
+        params=[
+            click.Option(
+                ["--journal", "journal_dir"],
+                default=None,
+                envvar="MAESTRO_JOURNAL",
+                expose_value=False,
+                callback=set_journal_dir,
+                type=click.Path(file_okay=False, path_type=Path),
+                help="Keep the registry in this directory across invocations, recording each change to a journal.",
+            )
+        ],
+        builders={
+            "shell": build_shell,
+            "add": build_add,
+            "remove": build_remove,
+            "show": build_show,
+            "execute": build_execute,
+            "serialize": build_serialize,
+            "deserialize": build_deserialize,
+            "cache": build_cache,
+        },
+    )
 
     return cli()
 
@@ -0,0 +1,194 @@
+# src/pymaestro/executors.py
+"""
+pymaestro.executors
+===================
+
+This module defines the executor backends that run the jobs of a JobPool.
+
+It includes:
+- `InlineExecutor`, which runs every submitted job immediately in the calling thread
+- `AsyncioExecutor`, which runs coroutine functions on one shared event loop
+- A "forkserver" process pool, whose workers fork from a template process that has
+  already imported the modules of the jobs
+- A factory function (`create_executor`) that, like `create_job`, dispatches on the
+  backend name, so that custom backends can be registered with `create_executor.register`
+"""
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Iterable
+
+from .utils.dispatcher import Dispatcher
+
+__all__ = ["InlineExecutor", "AsyncioExecutor", "create_executor", "SUPPORTED_EXECUTORS", "DEFAULT_EXECUTOR"]
+
+SUPPORTED_EXECUTORS = {"process", "forkserver", "thread", "inline", "asyncio"}
+DEFAULT_EXECUTOR = "process"
+
+
+class InlineExecutor(concurrent.futures.Executor):
+    """
+    An executor that runs each job synchronously at submission time.
+
+    Useful for debugging and for groups of jobs that are too small to amortize
+    the cost of a thread or process pool.
+    """
+
+    _max_workers = 1
+
+    def __init__(self) -> None:
+        self._is_shutdown = False
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+        if self._is_shutdown:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._is_shutdown = True
+
+
+class AsyncioExecutor(concurrent.futures.Executor):
+    """
+    An executor that owns an event loop running in a background thread.
+
+    Coroutine functions are scheduled as tasks on the loop, so that any number of them
+    share one thread. Plain callables are run in the default executor of the loop, a
+    thread pool of `max_workers` threads.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._is_shutdown = False
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(max_workers=max_workers))
+        self._thread = threading.Thread(target=self._loop.run_forever, name="maestro-asyncio", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+        if self._is_shutdown:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+
+        if iscoroutinefunction(fn):
+            coroutine = fn(*args, **kwargs)
+        else:
+            coroutine = asyncio.to_thread(fn, *args, **kwargs)
+
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        if self._is_shutdown:
+            return
+
+        self._is_shutdown = True
+        drained = asyncio.run_coroutine_threadsafe(self._drain(cancel_futures), self._loop)
+        if wait:
+            drained.result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+        else:
+            drained.add_done_callback(lambda _: self._loop.call_soon_threadsafe(self._loop.stop))
+
+    @staticmethod
+    async def _drain(cancel_futures: bool) -> None:
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        if cancel_futures:
+            for task in tasks:
+                task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.get_running_loop().shutdown_default_executor()
+
+
+# ---------------------------------------------------------------------------
+# Factory Design Pattern — Executor Factory(singledispatch-like factory function)
+# ---------------------------------------------------------------------------
+
+
+@Dispatcher
+def create_executor(backend: str, /, max_workers: int | None = None, **options: Any) -> concurrent.futures.Executor:
+    """
+    Factory function to create the executor that runs the jobs of a JobPool.
+
+    Supported backends are defined in `SUPPORTED_EXECUTORS`:
+        - "process": a `ProcessPoolExecutor`, for CPU-bound jobs.
+        - "forkserver": a `ProcessPoolExecutor` whose workers fork from a forkserver that imported the
+          modules in the `preload` option first, so that workers start warm. A process starts a single
+          forkserver, with the first such pool, and the `preload` of later pools has no effect: their
+          workers import the other modules themselves. Create the first pool with the modules of all the
+          jobs, as `Maestro.worker_pool` does with the whole registry.
+        - "thread": a `ThreadPoolExecutor`, for I/O-bound jobs that do not need to be pickled.
+        - "inline": an `InlineExecutor`, which runs the jobs one after the other in the calling thread.
+        - "asyncio": an `AsyncioExecutor`, which runs async jobs on one shared event loop.
+
+    Parameters:
+        backend (str): The name of the backend.
+        max_workers (int | None): The number of workers. Defaults to `os.cpu_count()`.
+        options (dict[str, Any]): Backend specific options.
+
+    Returns:
+        concurrent.futures.Executor: A running executor. The caller is responsible for shutting it down.
+
+    Raises:
+        ValueError: If `backend` is not supported. For custom backends, register a
+        factory function using `create_executor.register`.
+
+    Example:
+        @create_executor.register("dask")
+        def create_dask_executor(backend, max_workers=None, **options):
+            return distributed.Client(n_workers=max_workers).get_executor()
+    """
+    raise ValueError(
+        f"Invalid 'executor': {backend}. Must be one of {set(create_executor.get_registry())}. "
+        f"For custom executors, register a factory function using `create_executor.register`."
+    )
+
+
+@create_executor.register("process")
+def create_process_executor(
+    backend: str, max_workers: int | None = None, **options: Any
+) -> concurrent.futures.ProcessPoolExecutor:
+    return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), **options)
+
+
+@create_executor.register("forkserver")
+def create_forkserver_executor(
+    backend: str, max_workers: int | None = None, preload: Iterable[str] = (), **options: Any
+) -> concurrent.futures.ProcessPoolExecutor:
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        raise ValueError("The 'forkserver' executor is not supported on this platform.")
+
+    context = multiprocessing.get_context("forkserver")
+    # Only read when the forkserver starts. Modules that fail to import are imported by the workers instead
+    context.set_forkserver_preload(["__main__", *sorted(preload)])
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(), mp_context=context, **options
+    )
+
+
+@create_executor.register("thread")
+def create_thread_executor(
+    backend: str, max_workers: int | None = None, **options: Any
+) -> concurrent.futures.ThreadPoolExecutor:
+    return concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, **options)
+
+
+@create_executor.register("inline")
+def create_inline_executor(backend: str, max_workers: int | None = None, **options: Any) -> InlineExecutor:
+    return InlineExecutor()
+
+
+@create_executor.register("asyncio")
+def create_asyncio_executor(backend: str, max_workers: int | None = None, **options: Any) -> AsyncioExecutor:
+    return AsyncioExecutor(max_workers=max_workers)
@@ -1,11 +1,32 @@
 # src/pymaestro/job_registry.py
-from itertools import groupby
 from types import MappingProxyType
-from typing import Any, Iterable, Iterator, Optional
+from typing import Any, Iterable, Iterator, KeysView, Optional
 
 from .jobs import Job, JobPool
 
 
+class PendingJob:
+    """
+    A job of a registry that is decoded on first access, e.g. from a binary snapshot.
+
+    It carries only what the indexes of the registry need. `source.load_job(position)` returns the job.
+    """
+
+    __slots__ = ("name", "parallel_group", "source", "position")
+
+    def __init__(self, name: str, parallel_group: str | None, source: Any, position: int) -> None:
+        self.name = name
+        self.parallel_group = parallel_group
+        self.source = source
+        self.position = position
+
+    def load(self) -> Job:
+        return self.source.load_job(self.position)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r}, parallel_group={self.parallel_group!r})"
+
+
 class JobRegistry:
     """
     A container for managing and organizing jobs.
@@ -16,77 +37,188 @@ class JobRegistry:
 
     Intended as a central registry for job orchestration, making it easier
     to inspect, group, and modify job order before execution.
+
+    Lookups by name and by parallel group use indexes that every mutation keeps up to date,
+    and appending a job that starts a new execution unit extends the cached execution plan (`grouped_jobs`)
+    instead of resetting it. The mapping returned by `grouped_jobs` is never changed afterwards: the plan is
+    copied before it is extended, if it was handed out.
+
+    A registry built with `from_pending` holds jobs that are decoded on first access (see `PendingJob`):
+    lookups by name or group, `len` and reordering do not decode them, while `grouped_jobs` and
+    iteration decode them all.
+
+    When a `journal` is attached (see `pymaestro.journal.RegistryJournal`), every mutation is
+    also recorded to it, so that the registry persists without being rewritten as a whole.
     """
 
-    def __init__(self, jobs: Optional[Iterable[Job]] = None):
+    def __init__(self, jobs: Optional[Iterable[Job]] = None, journal: Any = None):
         if jobs is None:
             jobs = []
 
-        self.unique_names = set()
-        self._jobs = list(jobs)
+        self.journal = journal
+
+        self._jobs: list[Job] = []
+        # Indexes kept up to date by every mutation, so that lookups never scan the job list
+        self._positions: dict[str, int] = {}
+        self._groups: dict[str, set[str]] = {}
         self._grouped_jobs: dict[Job, int] | None = None
+        self._grouped_jobs_shared = False  # whether `grouped_jobs` handed out the cached plan
+        self._group_units: dict[str, Job] = {}
+        self._has_pending = False
 
-        for job in self._jobs:
+        for job in jobs:
             self._validate_job(job)
+            self._jobs.append(job)
+            self._index(job, len(self._jobs) - 1)
+
+    @classmethod
+    def from_pending(cls, pending_jobs: Iterable[PendingJob]) -> "JobRegistry":
+        """Build a registry of jobs that are decoded on first access."""
+        registry = cls()
+        for job in pending_jobs:
+            if job.name in registry._positions:
+                raise ValueError(f"Job with name '{job.name}' already exists.")
+            registry._jobs.append(job)
+            registry._index(job, len(registry._jobs) - 1)
+
+        registry._has_pending = True
+        return registry
 
     @property
     def jobs(self) -> list[Job]:
+        if self._has_pending:
+            self._jobs[:] = [job.load() if isinstance(job, PendingJob) else job for job in self._jobs]
+            self._has_pending = False
+
         return self._jobs
 
+    @property
+    def pending(self) -> int:
+        """The number of jobs not decoded yet."""
+        return sum(isinstance(job, PendingJob) for job in self._jobs) if self._has_pending else 0
+
+    @property
+    def unique_names(self) -> KeysView[str]:
+        return self._positions.keys()
+
     @property
     def grouped_jobs(self) -> MappingProxyType[Job, int] | None:
         if self._grouped_jobs is None:
             self.group_jobs_by_parallel_name()
 
-        return self._grouped_jobs
+        self._grouped_jobs_shared = True
+        return MappingProxyType(self._grouped_jobs)
 
     def append(self, job: Job) -> None:
         self._validate_job(job)
+        entry = self._journal_entry("append", job=job)
         self._jobs.append(job)
-        self.reset_cached()
+        self._index(job, len(self._jobs) - 1)
+        if self._grouped_jobs is not None:
+            self._extend_grouped_jobs(job)
+        self._record(entry)
 
     def extend(self, jobs: Iterable[Job]) -> None:
         for job in jobs:
             self.append(job)
 
+    def extend_bulk(self, jobs: Iterable[Job]) -> None:
+        """
+        Append many jobs at once, e.g. the jobs of `create_jobs`.
+
+        Unlike `extend`, the names are validated with one set operation before any job is added, so that
+        either all the jobs are added or none, the cached execution plan is reset once, and an attached
+        journal records one entry.
+        """
+        jobs = list(jobs)
+        for job in {type(job): job for job in jobs}.values():  # one job of each class
+            self._validate_type(job)
+
+        names = [job.name for job in jobs]
+        unique_names = set(names)
+        if len(unique_names) != len(names) or not unique_names.isdisjoint(self._positions):
+            seen: set[str] = set()
+            for name in names:
+                if name in seen or name in self._positions:
+                    raise ValueError(f"Job with name '{name}' already exists.")
+                seen.add(name)
+
+        entry = self._journal_entry("extend", jobs=jobs)
+        start = len(self._jobs)
+        self._jobs.extend(jobs)
+        self._positions.update(zip(names, range(start, start + len(jobs)), strict=True))
+        for job in jobs:
+            if job.parallel_group:
+                self._groups.setdefault(job.parallel_group, set()).add(job.name)
+        self.reset_cached()
+        self._record(entry)
+
     def insert(self, index: int, job: Job) -> None:
         self._validate_job(job)
+        entry = self._journal_entry("insert", index=index, job=job)
         self._jobs.insert(index, job)
+        self._reindex_from(index)
         self.reset_cached()
+        self._record(entry)
 
     def __setitem__(self, index: int, job: Job) -> None:
-        self._validate_job(job)
+        replaced_job = self._jobs[index]
+        self._unindex(replaced_job)
+        try:
+            self._validate_job(job)
+            entry = self._journal_entry("set", index=index, job=job)
+        except (TypeError, ValueError):
+            self._index(replaced_job, self._positions_of(index))
+            raise
+
         self._jobs[index] = job
+        self._index(job, self._positions_of(index))
         self.reset_cached()
+        self._record(entry)
 
     def remove(self, job_name: str) -> None:
-        candidate_job = filter(lambda job: job.name == job_name, self.jobs)
-        first_occurrence = next(candidate_job, None)
-        if first_occurrence is None:
+        if job_name not in self._positions:
             raise KeyError(f"Job with '{job_name}' not found in registry")
 
-        self.jobs.remove(first_occurrence)
-        self.unique_names.remove(first_occurrence.name)
-        self.reset_cached()
+        self._pop(self._positions[job_name])
+        self._record(self._journal_entry("remove", name=job_name))
 
     def pop(self, index: Optional[int] = -1) -> Job:
+        removed_job = self._pop(index)
+        self._record(self._journal_entry("pop", index=index))
+        return removed_job.load() if isinstance(removed_job, PendingJob) else removed_job
+
+    def _pop(self, index: int) -> Job | PendingJob:
         try:
             removed_job = self._jobs.pop(index)
-            self.unique_names.remove(removed_job.name)
-            self.reset_cached()
         except IndexError as ex:
             raise IndexError(f"Job with 'index {index}' not found in registry") from ex
 
+        self._unindex(removed_job)
+        self._reindex_from(index if index >= 0 else len(self._jobs) + index + 1)
+        self.reset_cached()
         return removed_job
 
     def __getitem__(self, index: int) -> Job:
-        return self.jobs[index]
+        if isinstance(index, slice):
+            return self.jobs[index]
+
+        job = self._jobs[index]
+        if isinstance(job, PendingJob):
+            job = self._jobs[index] = job.load()
+
+        return job
 
     def __iter__(self) -> Iterator[Job]:
         return iter(self.jobs)
 
     def __len__(self) -> int:
-        return len(self.jobs)
+        return len(self._jobs)
+
+    def group_members(self, parallel_group: str) -> list[Job]:
+        """Return the jobs of `parallel_group`, in insertion order."""
+        names = self._groups.get(parallel_group, ())
+        return [self[position] for position in sorted(self._positions[name] for name in names)]
 
     def group_jobs_by_parallel_name(self) -> None:
         """
@@ -98,44 +230,62 @@ class JobRegistry:
         - The resulting dictionary maps each job (or JobPool) to its execution priority.
         """
 
-        # 1. Sort jobs by parallel group name (empty string first for jobs without a group).
-        #    enumerate(self) keeps the original index so we can later restore execution order.
-        indexed_and_sorted = sorted(enumerate(self), key=lambda indexed_job: indexed_job[1].parallel_group or "")
-
-        # 2. Group jobs by their parallel group name.
-        grouped_by_parallel_group = groupby(indexed_and_sorted, key=lambda indexed_job: indexed_job[1].parallel_group)
-
-        grouped_jobs_with_priority = []
-
-        # 3. Build JobPool objects for groups, keep single jobs as-is.
-        for parallel_group, jobs_in_group in grouped_by_parallel_group:
-            if parallel_group:
-                # Convert to list so we can iterate multiple times
-                jobs_in_group = list(jobs_in_group)
-
-                # Priority is based on the smallest original index (preserves insertion order)
-                priority = min(index for index, _ in jobs_in_group)
-
-                # Extract raw jobs from (index, job) pairs
-                raw_jobs = tuple(job for _, job in jobs_in_group)
-
-                # If there is only one job in the group, use it directly; otherwise wrap in a JobPool
-                combined_job = raw_jobs[0] if len(raw_jobs) == 1 else JobPool(*raw_jobs)
-
-                grouped_jobs_with_priority.append((combined_job, priority))
+        # 1. Walk the jobs in insertion order. A job without a parallel group is an execution unit
+        #    of its own, while a parallel group takes the place of its first job (the smallest
+        #    original index), which preserves the insertion order without sorting.
+        units: list[Job | str] = []
+        members: dict[str, list[Job]] = {}
+        for job in self:
+            parallel_group = job.parallel_group
+            if not parallel_group:
+                units.append(job)
+            elif parallel_group in members:
+                members[parallel_group].append(job)
             else:
-                # Jobs without a parallel group keep their original priority (index)
-                for priority, job in jobs_in_group:
-                    grouped_jobs_with_priority.append((job, priority))
+                members[parallel_group] = [job]
+                units.append(parallel_group)
+
+        # 2. Build JobPool objects for groups, keep single jobs as-is, and number them sequentially.
+        self._group_units = {}
+        self._grouped_jobs = {}
+        self._grouped_jobs_shared = False
+        for priority, unit in enumerate(units):
+            if isinstance(unit, str):
+                combined_job = self._group_units[unit] = self._combine(members[unit])
+                unit = combined_job
+
+            self._grouped_jobs[unit] = priority
+
+    def _extend_grouped_jobs(self, job: Job) -> None:
+        """Add an appended job to the cached `_grouped_jobs` instead of grouping all the jobs again."""
+        parallel_group = job.parallel_group
+        if parallel_group in self._group_units:
+            # The job joins an existing group, whose JobPool is built again with the plan when it is next needed
+            self.reset_cached()
+            return
+
+        if self._grouped_jobs_shared:
+            # Callers may be iterating over the plan handed out by `grouped_jobs`
+            self._grouped_jobs = dict(self._grouped_jobs)
+            self._grouped_jobs_shared = False
 
-        # 4. Sort all jobs (or job pools) by priority
-        grouped_jobs_with_priority.sort(key=lambda job_priority: job_priority[1])
+        # A new execution unit always comes last
+        self._grouped_jobs[job] = len(self._grouped_jobs)
+        if parallel_group:
+            self._group_units[parallel_group] = job
 
-        # 5. Normalize priorities (make them 0, 1, 2, ... sequential)
-        ordered_jobs = (job for job, _ in grouped_jobs_with_priority)
-        self._grouped_jobs = MappingProxyType({job: priority for priority, job in enumerate(ordered_jobs)})
+    @staticmethod
+    def _combine(jobs: list[Job]) -> Job:
+        # If there is only one job in the group, use it directly; otherwise wrap in a JobPool
+        return jobs[0] if len(jobs) == 1 else JobPool(*jobs)
 
     def _validate_job(self, job: Any) -> None:
+        self._validate_type(job)
+        if job.name in self._positions:
+            raise ValueError(f"Job with name '{job.name}' already exists.")
+
+    @staticmethod
+    def _validate_type(job: Any) -> None:
         if not isinstance(job, Job):
             raise TypeError("Elements passed to JobRegistry must be instances of 'Job'.")
         elif isinstance(job, JobPool):
@@ -143,31 +293,61 @@ class JobRegistry:
                 "Elements passed to JobRegistry must not be JobPools. "
                 "Instead, create a separate Job for each executable and assign them the same parallel_group."
             )
-        if job.name in self.unique_names:
-            raise ValueError(f"Job with name '{job.name}' already exists.")
 
-        self.unique_names.add(job.name)
+    def _index(self, job: Job, position: int) -> None:
+        self._positions[job.name] = position
+        if job.parallel_group:
+            self._groups.setdefault(job.parallel_group, set()).add(job.name)
+
+    def _unindex(self, job: Job) -> None:
+        del self._positions[job.name]
+        if job.parallel_group:
+            group = self._groups[job.parallel_group]
+            group.discard(job.name)
+            if not group:
+                del self._groups[job.parallel_group]
+
+    def _reindex_from(self, start: int) -> None:
+        """Refresh the positions of the jobs from `start` onwards, after an insertion or a removal."""
+        for position in range(max(start, 0), len(self._jobs)):
+            self._positions[self._jobs[position].name] = position
+
+    def _positions_of(self, index: int) -> int:
+        return index if index >= 0 else len(self._jobs) + index
 
     def reset_cached(self):
         self._grouped_jobs = None
+        self._group_units = {}
 
     def __contains__(self, job_name: str) -> bool:
-        return job_name in self.unique_names
+        return job_name in self._positions
 
     def clear(self):
         self._jobs.clear()
-        self.unique_names.clear()
+        self._positions.clear()
+        self._groups.clear()
         self.reset_cached()
+        self._record(self._journal_entry("clear"))
 
     def index(self, job_name: str) -> int:
-        for idx, job in enumerate(self.jobs):
-            if job.name == job_name:
-                return idx
-
-        raise KeyError(f"Job with name '{job_name}' not found in registry")
+        try:
+            return self._positions[job_name]
+        except KeyError:
+            raise KeyError(f"Job with name '{job_name}' not found in registry") from None
 
     def swap(self, idx_or_name_i: int | str, idx_or_name_j: int | str) -> None:
-        i = self.index(idx_or_name_i) if isinstance(idx_or_name_i, str) else idx_or_name_i
-        j = self.index(idx_or_name_j) if isinstance(idx_or_name_j, str) else idx_or_name_j
+        i = self.index(idx_or_name_i) if isinstance(idx_or_name_i, str) else self._positions_of(idx_or_name_i)
+        j = self.index(idx_or_name_j) if isinstance(idx_or_name_j, str) else self._positions_of(idx_or_name_j)
         self._jobs[i], self._jobs[j] = self._jobs[j], self._jobs[i]
+        self._positions[self._jobs[i].name] = i
+        self._positions[self._jobs[j].name] = j
         self.reset_cached()
+        self._record(self._journal_entry("swap", i=i, j=j))
+
+    def _journal_entry(self, operation: str, **fields: Any) -> str | None:
+        # Encoded before the mutation, so that a job that cannot be recorded is not added either
+        return None if self.journal is None else self.journal.encode(operation, **fields)
+
+    def _record(self, entry: str | None) -> None:
+        if entry is not None:
+            self.journal.write(entry, self)
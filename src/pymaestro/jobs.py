@@ -8,21 +8,38 @@ This module defines the core job abstraction layer for Maestro.
 It includes:
 - Base and derived Job classes (callable, async, and script jobs)
 - A factory function (`create_job`) that implements the Factory design pattern
-- A `serialize` singledispatch function to convert jobs to JSON-serializable structures
+- A `serialize` function, dispatched on the class of its argument, to convert jobs to JSON-serializable structures
 """
 
 import asyncio
 import concurrent.futures
+import contextlib
+import functools
 import importlib
 import importlib.util
+import os
 import runpy
+import sys
 from abc import ABC, abstractmethod
 from inspect import iscoroutinefunction
 from pathlib import Path
-from typing import Any, Callable, Iterator
+from typing import Any, Callable, Iterable, Iterator, TextIO
 
+from .executors import DEFAULT_EXECUTOR, AsyncioExecutor, create_executor
+from .metrics import MeasuredResult, PoolMeter
+from .tracing import TracedResult, current_context, traced
 from .utils.dispatcher import Dispatcher
-from .utils.wrappers import inject_dependencies, is_completed
+from .utils.imports import check_package, is_lazy, resolve_import_path, split_import_path
+from .utils.transport import EncodedResult, SharedMemoryTransport
+from .utils.wrappers import (
+    Resource,
+    cached,
+    compile_execute,
+    initialize_worker,
+    inject_dependencies,
+    injected_positions,
+    is_completed,
+)
 
 __all__ = [
     "Job",
@@ -31,7 +48,12 @@ __all__ = [
     "AsyncCallableJob",
     "ScriptJob",
     "create_job",
+    "create_jobs",
+    "preload_modules",
+    "worker_resources",
+    "executor_options",
     "SUPPORTED_JOB_TYPES",
+    "SCRIPT_RESULT_NAME",
 ]
 
 # ---------------------------------------------------------------------------
@@ -40,24 +62,86 @@ __all__ = [
 
 SUPPORTED_JOB_TYPES = {"callable", "async_callable", "script"}
 
+# Isolated scripts may print long lines; the default limit of asyncio streams is 64 KiB
+_SUBPROCESS_LINE_LIMIT = 2**24
+
+# The variable a script assigns to return a single value to the orchestrator
+SCRIPT_RESULT_NAME = "__maestro_result__"
+
 
 class Job(ABC):
-    def __init__(self, name: str, executable: str | Callable[..., Any], parallel_group: str | None = None) -> None:
+    """
+    The base class of the jobs run by Maestro.
+
+    The `execute` method of every subclass is wrapped to inject the value of its Resources and
+    Broadcasts, to return the cached result of a job run before, and to mark the job as completed.
+    When a subclass defines `async_execute`, which its `execute` is expected to run, the injection
+    and the cache apply to `async_execute` only. Subclasses defined with `plain_wrappers=True`, as the
+    built-in jobs are, get these wrappers compiled into one plain function (see `compile_execute`)
+    instead of three `wrapt` layers, which costs a few microseconds less per execution:
+
+        class MyJob(Job, plain_wrappers=True):
+            def execute(self): ...
+
+    The option is inherited by the subclasses of the class.
+    """
+
+    plain_wrappers: bool = False
+
+    def __init__(
+        self,
+        name: str,
+        executable: str | Callable[..., Any],
+        parallel_group: str | None = None,
+        executor: str | None = None,
+    ) -> None:
+        if executor is not None and executor not in create_executor.registry:
+            raise ValueError(
+                f"Invalid 'executor': {executor}. Must be one of {set(create_executor.get_registry())}. "
+                f"For custom executors, register a factory function using `create_executor.register`."
+            )
+
         self.name = name
         self.executable = executable
         self.parallel_group = parallel_group
+        self.executor = executor
 
         self.is_completed: bool | None = None
         self._result: Any = None
+        # A `pymaestro.cache.ResultCache`, attached by Maestro when result caching is enabled
+        self.cache: Any = None
+        # The `ResourceScope`s of the run and of the parallel group, by name, attached by Maestro while the job runs
+        self.resource_scopes: dict[str, Any] | None = None
+
+    def __init_subclass__(cls, plain_wrappers: bool | None = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if plain_wrappers is not None:
+            cls.plain_wrappers = plain_wrappers
 
-    def __init_subclass__(cls):
         execute = cls.execute
-        cls.execute = is_completed(inject_dependencies(execute))
+        if "async_execute" in cls.__dict__:
+            # `execute` awaits `async_execute`, so dependencies are injected and results are cached at the
+            # async level only: the cache key is then computed from the Resources, not from their values
+            if cls.plain_wrappers:
+                cls.execute = compile_execute(execute, cache_results=False, inject=False)
+                cls.async_execute = compile_execute(cls.async_execute)
+            else:
+                cls.execute = is_completed(execute)
+                cls.async_execute = is_completed(cached(inject_dependencies(cls.async_execute)))
+        elif cls.plain_wrappers:
+            cls.execute = compile_execute(execute)
+        else:
+            cls.execute = is_completed(cached(inject_dependencies(execute)))
 
     @abstractmethod
     def execute(self) -> Any:
         pass
 
+    @property
+    def is_async(self) -> bool:
+        """Whether the job is awaited through `async_execute` when its parallel group runs on an event loop."""
+        return False
+
     @property
     def result(self) -> Any:
         if self.is_completed:
@@ -70,7 +154,13 @@ class Job(ABC):
         self._result = value
 
     def __getstate__(self) -> dict[str, Any]:
-        return {"is_completed": self.is_completed, "result": self.result}
+        # Read `_result`: the `result` property would execute a pending job while it is being pickled
+        return {
+            "is_completed": self.is_completed,
+            "result": self._result,
+            "executor": self.executor,
+            "cache": self.cache,
+        }
 
     def __reduce__(self):
         creator = self.__class__
@@ -94,7 +184,7 @@ class Job(ABC):
         return NotImplemented
 
 
-class JobPool(Job):
+class JobPool(Job, plain_wrappers=True):
     def __init__(self, *jobs: Job) -> None:  # noqa
         for job in jobs:
             if not isinstance(job, Job):  # Ensure that elements passed are of type Job
@@ -112,35 +202,186 @@ class JobPool(Job):
                 f"Found parallel groups: {parallel_groups or 'None'}"
             )
 
+        # Ensure all jobs agree on the executor backend of the group
+        executors = {job.executor for job in jobs} - {None}
+        if len(executors) > 1:
+            raise ValueError(f"All jobs in a JobPool must share the same executor. Found executors: {executors}")
+
         self.jobs = jobs
         self.parallel_group = parallel_groups.pop()
+        self.executor = executors.pop() if executors else None
+
+        # The strictest concurrency cap declared by the jobs applies to the whole group
+        caps = [job.max_concurrency for job in jobs if getattr(job, "max_concurrency", None)]
+        if not caps and any(isinstance(job, ScriptJob) and job.isolated for job in jobs):
+            # Unless capped, isolated scripts run at most one subprocess per CPU at a time
+            caps = [os.cpu_count() or 1]
+        self.max_concurrency = min(caps) if caps else None
 
     @property
     def name(self) -> str:
         return self.parallel_group
 
+    @property
+    def backend(self) -> str:
+        """
+        The name of the executor backend that runs the jobs of the pool.
+
+        Pools made only of async jobs (and isolated scripts) default to the "asyncio" backend, which
+        gathers them concurrently on one event loop instead of running one event loop per process.
+        """
+        if self.executor is not None:
+            return self.executor
+
+        return "asyncio" if all(job.is_async for job in self) else DEFAULT_EXECUTOR
+
     @staticmethod
     def execute_job(job: Job) -> Any:
         return job.execute()
 
-    def execute(self, max_workers: int | None = None, mode: str = "as_submitted") -> Iterator[Any]:
+    @staticmethod
+    def execute_job_with_transport(job: Job, transport: SharedMemoryTransport) -> EncodedResult:
+        return transport.encode(job.execute())
+
+    @staticmethod
+    async def async_execute_job(job: Job, semaphore: asyncio.Semaphore | None = None) -> Any:
+        if semaphore is None:
+            return await job.async_execute()
+
+        async with semaphore:
+            return await job.async_execute()
+
+    def execute(
+        self,
+        max_workers: int | None = None,
+        mode: str = "as_submitted",
+        executor: str | concurrent.futures.Executor | None = None,
+        transport: SharedMemoryTransport | None = None,
+    ) -> Iterator[Any]:
+        """
+        Execute the jobs of the pool concurrently.
+
+        Args:
+            max_workers (int | None): The number of workers. Defaults to `os.cpu_count()`.
+                Ignored when `executor` is an executor instance.
+            mode (str): `"as_submitted"` yields the results in the order of the jobs,
+                `"as_completed"` yields them as soon as each job finishes.
+            executor (str | concurrent.futures.Executor | None): Either the name of an executor
+                backend (see `create_executor`), or an already running executor to submit the jobs to.
+                A running executor is left open, so that it can be shared by many pools. By default,
+                a new executor of the pool's `backend` is created and shut down when the pool finishes.
+            transport (SharedMemoryTransport | None): When given, results of process workers are moved
+                to the parent through shared memory instead of the executor's pipe. Large buffers are
+                received as views on the shared memory, without being copied.
+        """
+        for _, result in self.execute_iter(max_workers, mode, executor, transport):
+            yield result
+
+    def execute_iter(
+        self,
+        max_workers: int | None = None,
+        mode: str = "as_submitted",
+        executor: str | concurrent.futures.Executor | None = None,
+        transport: SharedMemoryTransport | None = None,
+    ) -> Iterator[tuple[Job, Any]]:
+        """Like `execute`, but yields `(job, result)` pairs, so that each result can be traced to its job."""
         if mode not in ("as_submitted", "as_completed"):
             raise ValueError("'mode' must be 'as_submitted' or 'as_completed'")
 
-        if max_workers is None:
-            import os
+        if executor is None or isinstance(executor, str):
+            backend = executor or self.backend
+            executor_context = create_executor(backend, max_workers=max_workers, **executor_options(backend, self))
+        else:
+            backend = self.backend
+            executor_context = contextlib.nullcontext(executor)
+
+        with executor_context as executor:
+            if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+                check_process_resources(self)
+            semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+            meter = PoolMeter.start(self, backend, executor)
+            futures = {
+                executor.submit(self.job_runner(job, executor, semaphore, transport, meter), job): job for job in self
+            }
+            ordered_futures = concurrent.futures.as_completed(futures) if mode == "as_completed" else futures
+            undecoded = set(futures)
 
-            max_workers = os.cpu_count()
+            try:
+                for future in ordered_futures:
+                    job = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception:
+                        if meter is not None:
+                            meter.failed(job)
+                        raise
+
+                    decode = functools.partial(self.decode, job, transport=transport, meter=meter)
+                    result = result.receive(job.name, decode) if isinstance(result, TracedResult) else decode(result)
+                    undecoded.discard(future)
+                    yield job, result
+            finally:
+                if meter is not None:
+                    meter.close()
+                if transport is not None:
+                    # The consumer stopped early, or a job failed: the segments of the other results are removed
+                    # as soon as they are available, since no one will decode them
+                    for future in undecoded:
+                        future.add_done_callback(functools.partial(self.discard, transport=transport))
 
-        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-            if mode == "as_completed":
-                futures = [executor.submit(self.execute_job, job) for job in self]
-                for res in concurrent.futures.as_completed(futures):
-                    yield res.result()
-            else:
-                results = executor.map(JobPool.execute_job, self)
-                for result in results:
-                    yield result
+    @staticmethod
+    def decode(
+        job: Job, result: Any, transport: SharedMemoryTransport | None = None, meter: PoolMeter | None = None
+    ) -> Any:
+        """Turn what a worker returned for `job` back into the job's result."""
+        if meter is not None:
+            result = meter.receive(job, result)
+
+        return transport.decode(result) if isinstance(result, EncodedResult) else result
+
+    @staticmethod
+    def discard(future: concurrent.futures.Future, transport: SharedMemoryTransport) -> None:
+        """Remove the segments of the result of `future`, which is not decoded."""
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        result = future.result()
+        while isinstance(result, (TracedResult, MeasuredResult)):
+            result = result.result
+        if isinstance(result, EncodedResult):
+            transport.discard(result)
+
+    @classmethod
+    def job_runner(
+        cls,
+        job: Job,
+        executor: concurrent.futures.Executor,
+        semaphore: asyncio.Semaphore | None = None,
+        transport: SharedMemoryTransport | None = None,
+        meter: PoolMeter | None = None,
+    ) -> Callable[[Job], Any]:
+        """
+        Return the function that the `executor` calls to execute the `job`.
+
+        Async jobs (and isolated scripts) submitted to an `AsyncioExecutor` are awaited on its event loop,
+        at most `max_concurrency` at a time. Jobs submitted to a `ProcessPoolExecutor`
+        encode their result with `transport`, if any. When a tracer is active, the worker
+        records the spans of the job and returns them together with the result, and with
+        a `meter`, the times it started and finished the job.
+        """
+        if isinstance(executor, AsyncioExecutor) and job.is_async:
+            runner = functools.partial(cls.async_execute_job, semaphore=semaphore)
+        elif transport is not None and isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+            runner = functools.partial(cls.execute_job_with_transport, transport=transport)
+        else:
+            runner = cls.execute_job
+
+        if meter is not None:
+            is_process = isinstance(executor, concurrent.futures.ProcessPoolExecutor)
+            runner = meter.wrap(job, runner, serialize=is_process and transport is None)
+
+        context = current_context()
+        return runner if context is None else traced(runner, context)
 
     def __reduce__(self):
         raise TypeError("JobPool instances cannot be pickled. Nested pools are forbidden.")
@@ -171,7 +412,15 @@ class JobPool(Job):
         return hash(self.parallel_group)
 
 
-class CallableJob(Job):
+class CallableJob(Job, plain_wrappers=True):
+    """
+    A job that calls a function, or any callable object, with `args` and `kwargs`.
+
+    The executable may be given as an import path ('<package>.<module>.<function>'). With
+    `lazy=True`, or within `lazy_executables()`, the import path is only checked to belong to an
+    installed package, and the executable is imported when the job first runs.
+    """
+
     def __init__(
         self,
         name: str,
@@ -179,36 +428,68 @@ class CallableJob(Job):
         parallel_group: str | None = None,
         args: tuple[Any, ...] | list[Any] = (),
         kwargs: dict[str, Any] | None = None,
+        executor: str | None = None,
+        lazy: bool | None = None,
     ) -> None:
-        super().__init__(name, executable, parallel_group)
+        super().__init__(name, executable, parallel_group, executor)
         self.args = tuple(args)
         self.kwargs = kwargs or {}
 
-        self.validate_and_prepare_executable()
+        self.validate_and_prepare_executable(is_lazy() if lazy is None else lazy)
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        return self._args
+
+    @args.setter
+    def args(self, value: tuple[Any, ...] | list[Any]) -> None:
+        # The positions of the Resources and Broadcasts are found once here, not on every execution
+        self._args = tuple(value)
+        self._injected_args = injected_positions(self._args)
+
+    @property
+    def executable(self) -> Callable[..., Any]:
+        if isinstance(self._executable, str):
+            executable = resolve_import_path(self._executable)
+            self._check_executable(executable)
+            self._executable = executable
+
+        return self._executable
+
+    @executable.setter
+    def executable(self, value: Callable[..., Any] | str) -> None:
+        self._executable = value
+
+    @property
+    def is_resolved(self) -> bool:
+        """Whether the executable is imported. Lazy jobs import it when they first run."""
+        return not isinstance(self._executable, str)
+
+    @property
+    def import_path(self) -> str | None:
+        """The import path of the executable, without resolving it. None for callable objects."""
+        if not self.is_resolved:
+            return self._executable
+
+        qualname = getattr(self._executable, "__qualname__", None)
+        return f"{self._executable.__module__}.{qualname}" if qualname else None
 
     def execute(self) -> Any:
         return self.executable(*self.args, **self.kwargs)
 
-    def validate_and_prepare_executable(self) -> None:
-        if isinstance(self.executable, str):
-            try:
-                module_path, executable = self.executable.rsplit(".", 1)
-            except ValueError as e:
-                raise ValueError(
-                    f"Invalid value for 'executable': {self.executable!r}."
-                    f"When passing a string, it must be in the format: "
-                    f"'<package>.<module>.<function>',"
-                    f" e.g. 'my_package.mysubpackage.myscript.myfunction'."
-                ) from e
+    def validate_and_prepare_executable(self, lazy: bool = False) -> None:
+        if isinstance(self._executable, str):
+            module_path, _ = split_import_path(self._executable)
+            if lazy:
+                check_package(module_path)
+                return
 
-            if importlib.util.find_spec(module_path) is None:
-                raise ModuleNotFoundError(f"Module '{module_path}' not found")
+            self._executable = resolve_import_path(self._executable)
 
-            module = importlib.import_module(module_path)
-            executable = getattr(module, executable)
-            self.executable = executable
+        self._check_executable(self._executable)
 
-        if not callable(self.executable):
+    def _check_executable(self, executable: Any) -> None:
+        if not callable(executable):
             raise TypeError(
                 "'executable' must be either a callable object or an import path pointing to a callable object."
             )
@@ -218,19 +499,24 @@ class CallableJob(Job):
         state.update({"args": self.args, "kwargs": self.kwargs})
         return state
 
+    def __reduce__(self):
+        # An unresolved import path is sent as is, and resolved by the worker
+        return self.__class__, (self.name, self._executable, self.parallel_group), self.__getstate__()
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}"
             f"(name={self.name!r},"
-            f" executable={self.executable},"
+            f" executable={self._executable},"
             f" parallel_group={self.parallel_group!r},"
             f" args={self.args!r},"
-            f" kwargs={self.kwargs!r})"
+            f" kwargs={self.kwargs!r},"
+            f" executor={self.executor!r})"
         )
 
     def __str__(self) -> str:
         try:
-            callable_name = self.executable.__name__
+            callable_name = self._executable.__name__ if self.is_resolved else self._executable.rsplit(".", 1)[1]
         except AttributeError:
             callable_name = f"{self.__class__.__name__}.__call__"
 
@@ -248,6 +534,9 @@ class AsyncCallableJob(CallableJob):
         parallel_group: str | None = None,
         args: tuple[Any, ...] | list[Any] = (),
         kwargs: dict[str, Any] | None = None,
+        executor: str | None = None,
+        max_concurrency: int | None = None,
+        lazy: bool | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -255,9 +544,22 @@ class AsyncCallableJob(CallableJob):
             parallel_group,
             args,
             kwargs,
+            executor,
+            lazy,
         )
 
-        if not iscoroutinefunction(self.executable):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("'max_concurrency' must be a positive integer")
+
+        # The maximum number of jobs of the parallel group awaited at the same time on the event loop
+        self.max_concurrency = max_concurrency
+
+    @property
+    def is_async(self) -> bool:
+        return True
+
+    def _check_executable(self, executable: Any) -> None:
+        if not iscoroutinefunction(executable):
             raise TypeError("'executable' must be an async function (defined with 'async def')")
 
     def execute(self) -> Any:
@@ -268,16 +570,62 @@ class AsyncCallableJob(CallableJob):
         result = await self.executable(*self.args, **self.kwargs)
         return result
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.update({"max_concurrency": self.max_concurrency})
+        return state
+
+
+class ScriptJob(Job, plain_wrappers=True):
+    """
+    A job that runs a Python script or module as `__main__`.
+
+    By default, the script runs in the interpreter of the worker, through `runpy`. With
+    `isolated=True`, it runs in its own interpreter instead, started with
+    `asyncio.create_subprocess_exec`: scripts do not share `sys.argv` or `sys.modules`, and the
+    isolated scripts of a parallel group are started concurrently from one event loop, at most
+    `max_concurrency` at a time (one per CPU by default). Their output is streamed line by line
+    to the output of the orchestrator, prefixed with the name of the job.
+
+    A script returns None, unless it declares what to return: the variables listed in `outputs`,
+    as a dict, or else the value it assigns to `__maestro_result__`. Only in-process scripts
+    return values, so `outputs` cannot be combined with `isolated=True`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        executable: str,
+        parallel_group: str | None = None,
+        executor: str | None = None,
+        isolated: bool = False,
+        max_concurrency: int | None = None,
+        outputs: Iterable[str] | None = None,
+        lazy: bool | None = None,
+    ) -> None:
+        super().__init__(name, executable, parallel_group, executor)
+
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("'max_concurrency' must be a positive integer")
+
+        if isinstance(outputs, str):
+            raise TypeError("'outputs' must be an iterable of variable names, not a string")
+
+        if outputs is not None and isolated:
+            raise ValueError("Isolated scripts run in another interpreter and cannot return 'outputs'")
 
-class ScriptJob(Job):
-    def __init__(self, name: str, executable: str, parallel_group: str | None = None) -> None:
-        super().__init__(name, executable, parallel_group)
+        self.isolated = isolated
+        # The maximum number of isolated scripts of the parallel group running at the same time
+        self.max_concurrency = max_concurrency
+        # The variables of the script's namespace returned by `execute`
+        self.outputs = list(outputs) if outputs is not None else None
 
         # Validation step:
         # Ensure `executable` is a string and determine whether it represents
         # a filesystem script (.py file) or an importable Python module.
         # - If it's a script: resolve its absolute path (strict=True ensures it exists).
         # - If it's a module: verify that it can be imported via importlib.util.find_spec().
+        #   Lazy jobs only look up its top-level package, since finding a submodule imports its parents.
 
         if not isinstance(self.executable, (str, Path)):
             raise TypeError(
@@ -295,12 +643,21 @@ class ScriptJob(Job):
                 ) from None
             self.is_script = True
         else:
-            if importlib.util.find_spec(self.executable) is None:
+            if is_lazy() if lazy is None else lazy:
+                check_package(self.executable)
+            elif importlib.util.find_spec(self.executable) is None:
                 raise ModuleNotFoundError(f"Module '{self.executable}' not found")
             self.is_script = False
             self.executable_path = None  # no path
 
+    @property
+    def is_async(self) -> bool:
+        return self.isolated
+
     def execute(self) -> Any:
+        if self.isolated:
+            return asyncio.run(self.async_execute())
+
         exit_code = 0
         globals_after_run = {}
         try:
@@ -317,14 +674,89 @@ class ScriptJob(Job):
                     f" exited with non-zero code {exit_code}"
                 ) from None
 
-        return globals_after_run
+        return self._collect_outputs(globals_after_run)
+
+    def _collect_outputs(self, namespace: dict[str, Any]) -> Any:
+        # Return only what the script declares, instead of its whole namespace (modules, intermediate data...)
+        # which would be pickled back from pool workers
+        if self.outputs is None:
+            return namespace.get(SCRIPT_RESULT_NAME)
+
+        missing = [name for name in self.outputs if name not in namespace]
+        if missing:
+            raise RuntimeError(
+                f"Module or script '{self.executable_path or self.executable}' did not define the outputs {missing}"
+            )
+
+        return {name: namespace[name] for name in self.outputs}
+
+    async def async_execute(self) -> None:
+        """Run the script in a subprocess, streaming its output. Only for isolated scripts."""
+        if not self.isolated:
+            raise RuntimeError(f"ScriptJob '{self.name}' is not isolated. Use 'execute' to run it in-process.")
+
+        target = [str(self.executable_path)] if self.is_script else ["-m", self.executable]
+        pythonpath = [*self._source_paths(), *os.environ.get("PYTHONPATH", "").split(os.pathsep)]
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(dict.fromkeys(path for path in pythonpath if path))}
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            *target,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+            limit=_SUBPROCESS_LINE_LIMIT,
+        )
+        try:
+            await asyncio.gather(
+                self._forward(process.stdout, sys.stdout),
+                self._forward(process.stderr, sys.stderr),
+            )
+            exit_code = await process.wait()
+        except BaseException:  # e.g. cancelled, or a line longer than the limit of the streams
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+            raise
+
+        if exit_code != 0:
+            raise RuntimeError(
+                f"Module or script '{self.executable_path or self.executable}' exited with non-zero code {exit_code}"
+            )
+
+    def _source_paths(self) -> list[str]:
+        """
+        Return the directories the subprocess needs on top of its PYTHONPATH: the project of the orchestrator
+        (the first entry of `sys.path`), and the directory the package of the module is imported from.
+        """
+        paths = [os.path.abspath(sys.path[0])]
+        if not self.is_script:
+            spec = importlib.util.find_spec(self.executable.partition(".")[0])
+            if spec is not None:
+                # The directories of the package, or the module file, are in the directory on `sys.path`
+                locations = spec.submodule_search_locations or ([spec.origin] if spec.origin else [])
+                paths.extend(os.path.dirname(location) for location in locations)
+
+        return paths
+
+    async def _forward(self, stream: asyncio.StreamReader, sink: TextIO) -> None:
+        async for line in stream:
+            sink.write(f"[{self.name}] {line.decode(errors='replace')}")
+            sink.flush()
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.update({"isolated": self.isolated, "max_concurrency": self.max_concurrency, "outputs": self.outputs})
+        return state
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}"
             f"(name={self.name!r},"
             f" executable={self.executable!r},"
-            f" parallel_group={self.parallel_group!r})"
+            f" parallel_group={self.parallel_group!r},"
+            f" executor={self.executor!r},"
+            f" isolated={self.isolated!r},"
+            f" outputs={self.outputs!r})"
         )
 
     def __str__(self) -> str:
@@ -332,6 +764,79 @@ class ScriptJob(Job):
         return str(executable_name)
 
 
+def preload_modules(jobs: Iterable[Job]) -> list[str]:
+    """
+    Return the modules that workers import to run `jobs`, for the preload list of a forkserver.
+
+    These are the modules that define the executables of callable jobs, and the packages of
+    scripts given as module names. A script module itself is not preloaded: it must run as
+    `__main__`, and importing it first would run its body twice.
+    """
+    modules = set()
+    for job in jobs:
+        if isinstance(job, ScriptJob):
+            if not job.is_script and "." in job.executable:
+                modules.add(job.executable.rsplit(".", 1)[0])
+        elif isinstance(job, CallableJob) and not job.is_resolved:
+            modules.add(split_import_path(job.import_path)[0])
+        elif isinstance(job, CallableJob):
+            executable = job.executable
+            module = getattr(executable, "__module__", None) or type(executable).__module__
+            if module not in ("__main__", "builtins"):
+                modules.add(module)
+
+    return sorted(modules)
+
+
+def _resources(job: Job) -> Iterator[Resource]:
+    for value in (*getattr(job, "args", ()), *getattr(job, "kwargs", {}).values()):
+        if isinstance(value, Resource):
+            yield value
+
+
+def worker_resources(jobs: Iterable[Job]) -> list[Resource]:
+    """Return the worker-scoped Resources passed to `jobs`, once each, set up by every process worker when it starts."""
+    resources: dict[Any, Resource] = {}
+    for job in jobs:
+        for resource in _resources(job):
+            if resource.scope == "worker":
+                resources.setdefault(resource.key, resource)
+
+    return list(resources.values())
+
+
+def check_process_resources(jobs: Iterable[Job]) -> None:
+    """
+    Raise ValueError if `jobs`, run by process pool workers, are passed run- or group-scoped Resources.
+    A worker cannot tell when the run or the parallel group ends, to close them at the end of their scope.
+    """
+    for job in jobs:
+        for resource in _resources(job):
+            if resource.scope in ("run", "group"):
+                raise ValueError(
+                    f"Job '{job.name}' runs on a process pool and is passed a Resource with scope "
+                    f"'{resource.scope}', which its worker cannot close when the {resource.scope} ends. "
+                    f"Use scope='worker' or scope='job', or a 'thread' executor."
+                )
+
+
+def executor_options(backend: str, jobs: Iterable[Job]) -> dict[str, Any]:
+    """
+    Return the options of `create_executor` for a pool of `backend` that runs `jobs`: the modules that a
+    forkserver preloads, and the initializer of process workers, which sets up the worker-scoped resources.
+    """
+    jobs = list(jobs)
+    options: dict[str, Any] = {}
+    if backend == "forkserver":
+        options["preload"] = preload_modules(jobs)
+
+    resources = worker_resources(jobs) if backend in ("process", "forkserver") else []
+    if resources:
+        options.update(initializer=initialize_worker, initargs=(resources,))
+
+    return options
+
+
 # ---------------------------------------------------------------------------
 # Factory Design Pattern — Job Factory(singledispatch-like factory function)
 # ---------------------------------------------------------------------------
@@ -346,6 +851,7 @@ def create_job(
     parallel_group: str | None = None,
     args: tuple[Any, ...] = (),
     kwargs: dict[str, Any] | None = None,
+    executor: str | None = None,
     **extras: dict[str, Any],
 ) -> Job:
     """
@@ -362,6 +868,7 @@ def create_job(
         parallel_group (str | None): Optional name for the job's parallel group.
         args (tuple[Any, ...]): Positional arguments to pass to the executable (for callable jobs).
         kwargs (dict[str, Any] | None): Keyword arguments to pass to the executable (for callable jobs).
+        executor (str | None): The executor backend that runs the job's parallel group (see `create_executor`).
 
     Returns:
         Job: An instance of the requested job type.
@@ -392,8 +899,18 @@ def create_callable_job(
     parallel_group: str | None = None,
     args: tuple[Any, ...] = (),
     kwargs: dict[str, Any] | None = None,
+    executor: str | None = None,
+    lazy: bool | None = None,
 ) -> CallableJob:
-    return CallableJob(name=name, executable=executable, parallel_group=parallel_group, args=args, kwargs=kwargs)
+    return CallableJob(
+        name=name,
+        executable=executable,
+        parallel_group=parallel_group,
+        args=args,
+        kwargs=kwargs,
+        executor=executor,
+        lazy=lazy,
+    )
 
 
 @create_job.register("async_callable")
@@ -404,12 +921,53 @@ def create_async_callable_job(
     parallel_group: str | None = None,
     args: tuple[Any, ...] = (),
     kwargs: dict[str, Any] | None = None,
+    executor: str | None = None,
+    max_concurrency: int | None = None,
+    lazy: bool | None = None,
 ) -> AsyncCallableJob:
-    return AsyncCallableJob(name=name, executable=executable, parallel_group=parallel_group, args=args, kwargs=kwargs)
+    return AsyncCallableJob(
+        name=name,
+        executable=executable,
+        parallel_group=parallel_group,
+        args=args,
+        kwargs=kwargs,
+        executor=executor,
+        max_concurrency=max_concurrency,
+        lazy=lazy,
+    )
 
 
 @create_job.register("script")
 def create_script_job(
-    job_type: str, name: str, executable: str, parallel_group: str | None = None, **extras
+    job_type: str,
+    name: str,
+    executable: str,
+    parallel_group: str | None = None,
+    executor: str | None = None,
+    isolated: bool = False,
+    max_concurrency: int | None = None,
+    outputs: Iterable[str] | None = None,
+    lazy: bool | None = None,
+    **extras,
 ) -> ScriptJob:
-    return ScriptJob(name=name, executable=executable, parallel_group=parallel_group)
+    return ScriptJob(
+        name=name,
+        executable=executable,
+        parallel_group=parallel_group,
+        executor=executor,
+        isolated=isolated,
+        max_concurrency=max_concurrency,
+        outputs=outputs,
+        lazy=lazy,
+    )
+
+
+def create_jobs(job_type: str, rows: Iterable[dict[str, Any]]) -> list[Job]:
+    """
+    Create a job of `job_type` from each row of keyword arguments of `create_job`, e.g. the rows of a manifest.
+
+    The rows are dispatched at once through `create_job.map`, which looks up the factory of `job_type` once
+    and calls it for every row, so that each job is built as `create_job` would build it. Add the jobs to a
+    registry with `JobRegistry.extend_bulk`.
+    """
+    return create_job.map(((job_type,), row) for row in rows)
@@ -0,0 +1,199 @@
+# src/pymaestro/journal.py
+"""
+pymaestro.journal
+=================
+
+Persist a JobRegistry as a snapshot and an append-only journal of its mutations.
+
+Saving a registry with `Maestro.serialize` rewrites every job, so that adding one job to a
+registry of 50k jobs costs a 50k-job write. A journal records each mutation (append, bulk extend,
+insert, replace, pop, remove, swap and clear) as one compact line instead, and the registry is the
+last snapshot with the journal replayed on top of it. Once the journal holds `compact_every`
+records, the registry is written to a new snapshot and the journal starts over.
+
+The files of a journal are numbered by generation: `snapshot-<n>.jsonl` (see `dump_registry`)
+and `journal-<n>.jsonl`. Compaction writes the snapshot of the next generation before the files
+of the previous one are removed, so that an interrupted compaction loses nothing.
+"""
+
+import json
+import operator
+from pathlib import Path
+from typing import IO, Any
+
+from .job_registry import JobRegistry
+from .utils.deserialize import decode_object
+from .utils.dispatcher import Dispatcher
+from .utils.imports import is_lazy, lazy_executables
+from .utils.registry_codec import dump_registry, load_registry
+from .utils.serialize import serialize
+
+__all__ = ["RegistryJournal", "DEFAULT_JOURNAL_DIR"]
+
+DEFAULT_JOURNAL_DIR = Path(".maestro") / "registry"
+
+_SNAPSHOT = "snapshot-{}.jsonl"
+_JOURNAL = "journal-{}.jsonl"
+
+
+class RegistryJournal:
+    """
+    The snapshot and the journal of mutations of one registry, kept in `directory`.
+
+    Load the registry from the journal, and every later mutation of it is recorded:
+
+        journal = RegistryJournal(".maestro/registry")
+        registry = journal.load()
+        registry.append(job)  # one line appended to the journal
+
+    A journal has a single writer: two processes mutating the registry of the same directory
+    at the same time do not see each other's jobs.
+
+    Attributes:
+        directory (Path): The directory holding the snapshot and the journal.
+        compact_every (int): The number of records after which the journal is compacted into a new snapshot.
+    """
+
+    def __init__(self, directory: str | Path = DEFAULT_JOURNAL_DIR, compact_every: int = 1000) -> None:
+        if compact_every < 1:
+            raise ValueError(f"'compact_every' must be a positive integer, got {compact_every}")
+
+        self.directory = Path(directory)
+        self.compact_every = compact_every
+        self._generation = 0
+        self._records = 0
+        self._file: IO[str] | None = None
+        self._encoder = json.JSONEncoder(default=serialize, separators=(",", ":"))
+
+    @property
+    def records(self) -> int:
+        """The number of records in the journal since the last snapshot."""
+        return self._records
+
+    def load(self, lazy: bool | None = None) -> JobRegistry:
+        """
+        Return the registry of the last snapshot with the journal replayed on top of it, attached to this journal.
+
+        A record cut short by an interrupted write is dropped from the journal. See `Maestro.deserialize` for `lazy`,
+        which defaults to the surrounding `lazy_executables()` block.
+        """
+        self.close()
+        lazy = is_lazy() if lazy is None else lazy
+        generation = self._last_generation()
+        snapshot = self.directory / _SNAPSHOT.format(generation)
+        registry = load_registry(snapshot, lazy) if snapshot.exists() else JobRegistry()
+
+        records = 0
+        journal = self.directory / _JOURNAL.format(generation)
+        if journal.exists():
+            decoder = json.JSONDecoder(object_hook=decode_object)
+            with lazy_executables(lazy), open(journal, "rb+") as f:
+                end = 0
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        f.truncate(end)
+                        break
+                    replay(registry, decoder.decode(line.decode("utf-8")))
+                    end += len(line)
+                    records += 1
+
+        self._generation, self._records = generation, records
+        self._remove_before(generation)
+        registry.journal = self
+        return registry
+
+    def attach(self, registry: JobRegistry) -> JobRegistry:
+        """Replace the contents of the journal with `registry`, and record its later mutations."""
+        self.compact(registry)
+        registry.journal = self
+        return registry
+
+    def encode(self, operation: str, **fields: Any) -> str:
+        """Return the line recording `operation`."""
+        return self._encoder.encode({"op": operation, **fields}) + "\n"
+
+    def write(self, entry: str, registry: JobRegistry) -> None:
+        """Append `entry` to the journal, and compact it into a snapshot of `registry` once it is full."""
+        if self._file is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.directory / _JOURNAL.format(self._generation), "a", encoding="utf-8")
+
+        self._file.write(entry)
+        self._file.flush()
+        self._records += 1
+        if self._records >= self.compact_every:
+            self.compact(registry)
+
+    def compact(self, registry: JobRegistry) -> Path:
+        """Write `registry` to the snapshot of a new generation, and remove the files of the previous ones."""
+        self.close()
+        generation = self._last_generation() + 1
+        snapshot = dump_registry(registry, self.directory / _SNAPSHOT.format(generation))
+        self._generation, self._records = generation, 0
+        self._remove_before(generation)
+        return snapshot
+
+    def close(self) -> None:
+        """Close the journal file. It is opened again by the next record."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _last_generation(self) -> int:
+        generations = [int(path.stem.rpartition("-")[2]) for path in self.directory.glob(_SNAPSHOT.format("*"))]
+        return max(generations, default=self._generation)
+
+    def _remove_before(self, generation: int) -> None:
+        for pattern in (_SNAPSHOT, _JOURNAL):
+            for path in self.directory.glob(pattern.format("*")):
+                if int(path.stem.rpartition("-")[2]) < generation:
+                    path.unlink(missing_ok=True)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(directory={str(self.directory)!r}, compact_every={self.compact_every})"
+
+
+@Dispatcher(key_idx=1, key_generator=operator.itemgetter("op"))
+def replay(registry: JobRegistry, record: dict[str, Any]) -> None:
+    """Apply one record of a journal to `registry`."""
+    raise ValueError(f"Unknown journal record: {record!r}")
+
+
+@replay.register("append")
+def replay_append(registry: JobRegistry, record: dict[str, Any]) -> None:
+    registry.append(record["job"])
+
+
+@replay.register("extend")
+def replay_extend(registry: JobRegistry, record: dict[str, Any]) -> None:
+    registry.extend_bulk(record["jobs"])
+
+
+@replay.register("insert")
+def replay_insert(registry: JobRegistry, record: dict[str, Any]) -> None:
+    registry.insert(record["index"], record["job"])
+
+
+@replay.register("set")
+def replay_set(registry: JobRegistry, record: dict[str, Any]) -> None:
+    registry[record["index"]] = record["job"]
+
+
+@replay.register("pop")
+def replay_pop(registry: JobRegistry, record: dict[str, Any]) -> None:
+    registry.pop(record["index"])
+
+
+@replay.register("remove")
+def replay_remove(registry: JobRegistry, record: dict[str, Any]) -> None:
+    registry.remove(record["name"])
+
+
+@replay.register("swap")
+def replay_swap(registry: JobRegistry, record: dict[str, Any]) -> None:
+    registry.swap(record["i"], record["j"])
+
+
+@replay.register("clear")
+def replay_clear(registry: JobRegistry, record: dict[str, Any]) -> None:
+    registry.clear()
@@ -1,14 +1,31 @@
 # src/pymaestro/pymaestro.py
+import concurrent.futures
+import contextlib
+import contextvars
 import json
+import queue
+import threading
 from inspect import iscoroutinefunction
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
 
+from .cache import ResultCache
+from .checkpoint import CheckpointStore
+from .executors import DEFAULT_EXECUTOR, create_executor
 from .job_registry import JobRegistry
-from .jobs import Job, JobPool, create_job
+from .jobs import Job, JobPool, check_process_resources, create_job, executor_options
+from .journal import RegistryJournal
+from .metrics import Metrics, collect, measure
+from .scheduler import DependencyGraph, run_graph
+from .tracing import Tracer, span
 from .utils import DependsOn
-from .utils.deserialize import deserialize
+from .utils.deserialize import decode_object
+from .utils.imports import lazy_executables
+from .utils.registry_codec import dump_registry, is_registry_stream, load_registry
+from .utils.registry_snapshot import dump_snapshot, is_registry_snapshot, load_snapshot
 from .utils.serialize import serialize
+from .utils.transport import SharedMemoryTransport
+from .utils.wrappers import ResourceScope
 
 __all__ = ["Maestro"]
 
@@ -21,26 +38,115 @@ class Maestro:
     a central access point to add, retrieve, and organize jobs via the
     associated JobRegistry.
 
+    Parallel groups are executed on worker pools owned by Maestro, one per executor backend
+    (see `create_executor`). A pool is created lazily by the first parallel group of a run
+    that needs it and shut down at the end of `execute()`, unless `reuse_pool=True`, in which
+    case it stays alive across calls until `close()` is called or the `with` block exits:
+
+        with Maestro(reuse_pool=True) as maestro:
+            maestro.execute()
+            maestro.execute()  # the worker processes of the first run are reused
+
     Attributes:
         _registry (JobRegistry): The internal registry storing all jobs.
+        pool_size (int | None): The number of workers of each pool. Defaults to `os.cpu_count()`.
+        reuse_pool (bool): Whether the worker pools outlive a single `execute()` call.
+        cache (ResultCache | None): When set, the results of callable jobs are cached on disk and
+            jobs whose executable and arguments did not change are not executed again.
+        transport (SharedMemoryTransport | None): When set, results of process pool workers are moved
+            to the parent through shared memory, and large buffers are received without being copied.
+        tracer (Tracer | None): When set, every run records its spans (jobs, pool workers, dependency
+            resolution, resources, execution and result transfer) to the tracer, for export to
+            Perfetto or OpenTelemetry.
+        metrics (Metrics | None): When set, every run records job durations, queue wait, worker
+            utilization, transferred bytes and failures, for export to Prometheus or statsd.
+        journal (RegistryJournal | None): When set, the registry is loaded from the journal (unless one
+            is given), and every later change to it is appended to the journal instead of rewriting
+            the whole registry.
     """
 
     _instance = None
 
-    def __new__(cls, registry: Optional[JobRegistry] = None):
+    def __new__(cls, registry: Optional[JobRegistry] = None, **options: Any):
         if not cls._instance:
             new_instance = super().__new__(cls)
             cls._instance = new_instance
 
         return cls._instance
 
-    def __init__(self, registry: Optional[JobRegistry] = None):
-        self._registry = registry or JobRegistry()
+    def __init__(
+        self,
+        registry: Optional[JobRegistry] = None,
+        *,
+        pool_size: int | None = None,
+        reuse_pool: bool = False,
+        cache: ResultCache | None = None,
+        transport: SharedMemoryTransport | None = None,
+        tracer: Tracer | None = None,
+        metrics: Metrics | None = None,
+        journal: RegistryJournal | None = None,
+    ):
+        if getattr(self, "_worker_pools", None) or getattr(self, "journal", None):  # re-initialization
+            self.close()
+
+        if journal is not None:
+            registry = journal.load() if registry is None else journal.attach(registry)
+
+        self._registry = registry if registry is not None else JobRegistry()
+        self.journal = journal
+        self.pool_size = pool_size
+        self.reuse_pool = reuse_pool
+        self.cache = cache
+        self.transport = transport
+        self.tracer = tracer
+        self.metrics = metrics
+        self._worker_pools: dict[str, concurrent.futures.Executor] = {}
+        self._worker_pool_lock = threading.Lock()
+        self._run_resources: ResourceScope | None = None
 
     @property
     def registry(self) -> JobRegistry:
         return self._registry
 
+    def worker_pool(self, backend: str = DEFAULT_EXECUTOR) -> concurrent.futures.Executor:
+        """
+        Return the worker pool of `backend` shared by all parallel groups, creating it on first access.
+
+        A "forkserver" pool preloads the modules of every job of the registry that runs in a parallel group,
+        and the workers of process pools set up the worker-scoped resources of these jobs when they start.
+        Both are taken from the registry when the pool is created (see `close`).
+        """
+        with self._worker_pool_lock:
+            if backend not in self._worker_pools:
+                options = executor_options(backend, (job for job in self.registry if job.parallel_group))
+                self._worker_pools[backend] = create_executor(backend, max_workers=self.pool_size, **options)
+
+            return self._worker_pools[backend]
+
+    def close(self) -> None:
+        """
+        Shut down the worker pools, close the journal file and the sinks of the metrics.
+        New pools are created if jobs are executed again. Changing the registry does not replace the pools:
+        close the Maestro afterwards so that they pick up the preloaded modules and worker-scoped resources
+        of the new jobs.
+        """
+        with self._worker_pool_lock:
+            worker_pools, self._worker_pools = self._worker_pools, {}
+
+        for worker_pool in worker_pools.values():
+            worker_pool.shutdown(wait=True)
+
+        if self.journal is not None:
+            self.journal.close()
+        if self.metrics is not None:
+            self.metrics.close()
+
+    def __enter__(self) -> "Maestro":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def add(
         self,
         _executable: Optional[Callable[..., Any] | str] = None,
@@ -50,6 +156,10 @@ class Maestro:
         parallel_group: str | None = None,
         args: tuple[Any, ...] = (),
         kwargs: dict[str, Any] | None = None,
+        executor: str | None = None,
+        max_concurrency: int | None = None,
+        isolated: bool = False,
+        outputs: list[str] | None = None,
     ) -> Callable[..., Any]:
         """
         Register a job in the Maestro job pool.
@@ -100,6 +210,20 @@ class Maestro:
             Positional arguments to bind to the job.
         kwargs : dict, optional
             Keyword arguments to bind to the job.
+        executor : str, optional
+            The executor backend that runs the job's parallel group: `"process"` (default), `"forkserver"`,
+            `"thread"`, `"inline"`, `"asyncio"` or a custom backend registered with `create_executor.register`.
+            Parallel groups made only of async jobs default to `"asyncio"`.
+        max_concurrency : int, optional
+            For async jobs and isolated scripts only: the maximum number of jobs of the parallel group
+            running at the same time on the shared event loop. The smallest value declared by the jobs
+            of a group applies.
+        isolated : bool, optional
+            For scripts only: run the script in its own interpreter, with `asyncio.create_subprocess_exec`,
+            instead of in the interpreter of a worker. Its output is streamed as it is produced.
+        outputs : list[str], optional
+            For in-process scripts only: the variables of the script returned as the job's result, as a dict.
+            Without them, a script returns the value it assigns to `__maestro_result__`, or None.
 
         Returns
         -------
@@ -129,8 +253,21 @@ class Maestro:
                 except AttributeError:
                     name = f"{executable.__class__.__name__}.__call__"
 
+            # Only async jobs and scripts accept a concurrency cap, and only scripts can be isolated or declare outputs
+            extras = {} if max_concurrency is None else {"max_concurrency": max_concurrency}
+            if isolated:
+                extras["isolated"] = isolated
+            if outputs is not None:
+                extras["outputs"] = outputs
             job = create_job(
-                job_type, name=name, executable=executable, parallel_group=parallel_group, args=args, kwargs=kwargs
+                job_type,
+                name=name,
+                executable=executable,
+                parallel_group=parallel_group,
+                args=args,
+                kwargs=kwargs,
+                executor=executor,
+                **extras,
             )
             self.registry.append(job)
             return executable
@@ -143,22 +280,258 @@ class Maestro:
     def clear(self) -> None:
         self.registry.clear()
 
-    def execute(self) -> list[Any]:
-        """Execute all the scheduled job"""
-        results = []
-        for job, priority in self.registry.grouped_jobs.items():
-            self._resolve_dependencies(job)
-            print(f"Executing job: \n  - Priority: {priority}\n  - Job name: '{job.name}'")  # noqa: T201
-            if isinstance(job, JobPool):
-                result = list(job.execute())
-            else:
-                result = job.execute()
+    def execute(
+        self, schedule: str = "priority", max_workers: int | None = None, checkpoint: CheckpointStore | None = None
+    ) -> list[Any]:
+        """
+        Execute all the scheduled jobs.
 
-            results.append(result)
+        Parameters
+        ----------
+        schedule : str, optional
+            - `"priority"` (default): run jobs and parallel groups one after the other,
+              in the order of `JobRegistry.grouped_jobs`.
+            - `"graph"`: build a DAG from the `DependsOn` markers of the jobs and start
+              every job (or parallel group) as soon as all of its upstream jobs have finished.
+        max_workers : int, optional
+            The maximum number of jobs or parallel groups running at the same time when
+            `schedule="graph"`. Defaults to the `concurrent.futures.ThreadPoolExecutor` default.
+        checkpoint : CheckpointStore, optional
+            Persist the result of each job as soon as it finishes. Jobs already recorded in the
+            checkpoint are not executed again: their stored results are returned and passed to
+            their `DependsOn` consumers, so that an interrupted run resumes where it stopped.
 
-        return results
+        Returns
+        -------
+        list
+            The result of each job, or the list of results of each parallel group, in priority order.
+        """
+        if schedule not in ("priority", "graph"):
+            raise ValueError("'schedule' must be 'priority' or 'graph'")
+
+        self._restore(checkpoint)
+        self._check_resources()
+        try:
+            with span("run", "run", tracer=self.tracer, schedule=schedule), collect(self.metrics), self._run_scope():
+                return self._execute(schedule, max_workers, checkpoint)
+        finally:
+            if not self.reuse_pool:
+                self.close()
+
+    def _execute(self, schedule: str, max_workers: int | None, checkpoint: CheckpointStore | None) -> list[Any]:
+        if schedule == "priority":
+            return [
+                self._execute_unit(job, priority, checkpoint) for job, priority in self.registry.grouped_jobs.items()
+            ]
+
+        graph = DependencyGraph(self.registry)
+        priorities = self.registry.grouped_jobs
+        results = run_graph(
+            graph, lambda job: self._execute_unit(job, priorities[job], checkpoint), max_workers=max_workers
+        )
+        return [results[job] for job in graph.units]
+
+    def execute_iter(
+        self,
+        schedule: str = "priority",
+        mode: str = "as_submitted",
+        max_workers: int | None = None,
+        checkpoint: CheckpointStore | None = None,
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Execute all the scheduled jobs, yielding `(job_name, result)` as soon as each job finishes.
+
+        Unlike `execute`, results are not collected into a list, and each job of a parallel
+        group is reported on its own.
+
+        Parameters
+        ----------
+        schedule : str, optional
+            `"priority"` (default) or `"graph"`, see `execute`.
+        mode : str, optional
+            - `"as_submitted"` (default): the jobs of a parallel group are reported in insertion order.
+            - `"as_completed"`: the jobs of a parallel group are reported in completion order. With
+              `schedule="graph"`, events of jobs and groups running at the same time are interleaved,
+              so the whole run is reported in completion order.
+        max_workers : int, optional
+            See `execute`.
+        checkpoint : CheckpointStore, optional
+            See `execute`. Jobs restored from the checkpoint are reported first, without being executed.
+
+        Yields
+        ------
+        tuple[str, Any]
+            The name of the job that finished and its result.
+        """
+        if schedule not in ("priority", "graph"):
+            raise ValueError("'schedule' must be 'priority' or 'graph'")
+        if mode not in ("as_submitted", "as_completed"):
+            raise ValueError("'mode' must be 'as_submitted' or 'as_completed'")
+
+        # The run has a context of its own, so that its tracer and metrics are not set in the consumer between events
+        yield from _iter_in_context(self._iter_run(schedule, mode, max_workers, checkpoint))
+
+    def _iter_run(
+        self, schedule: str, mode: str, max_workers: int | None, checkpoint: CheckpointStore | None
+    ) -> Iterator[tuple[str, Any]]:
+        self._restore(checkpoint)
+        self._check_resources()
+        try:
+            with (
+                span("run", "run", tracer=self.tracer, schedule=schedule, mode=mode),
+                collect(self.metrics),
+                self._run_scope(),
+            ):
+                if schedule == "priority":
+                    for job, priority in self.registry.grouped_jobs.items():
+                        yield from self._iter_unit(job, priority, mode, checkpoint)
+                else:
+                    yield from self._iter_graph(mode, max_workers, checkpoint)
+        finally:
+            if not self.reuse_pool:
+                self.close()
+
+    def _iter_graph(
+        self, mode: str, max_workers: int | None, checkpoint: CheckpointStore | None
+    ) -> Iterator[tuple[str, Any]]:
+        graph = DependencyGraph(self.registry)
+        priorities = self.registry.grouped_jobs
+        events: queue.SimpleQueue = queue.SimpleQueue()
+        done = object()
+        stop = threading.Event()
+
+        def execute_unit(job: Job) -> None:
+            for event in self._iter_unit(job, priorities[job], mode, checkpoint):
+                events.put(event)
+
+        def run() -> None:
+            try:
+                run_graph(graph, execute_unit, max_workers=max_workers, stop=stop)
+            except BaseException as e:
+                events.put((done, e))
+            else:
+                events.put((done, None))
+
+        # The thread inherits the context of the run, e.g. its tracer
+        context = contextvars.copy_context()
+        thread = threading.Thread(target=context.run, args=(run,), name="maestro-graph", daemon=True)
+        thread.start()
+        try:
+            while True:
+                name, result = events.get()
+                if name is done:
+                    if result is not None:
+                        raise result
+                    return
+
+                yield name, result
+        finally:
+            # When the consumer stops early, no unit is started anymore, and the running ones finish
+            # before the worker pools and the resources of the run are closed
+            stop.set()
+            thread.join()
+
+    def _execute_unit(self, job: Job, priority: int, checkpoint: CheckpointStore | None = None) -> Any:
+        if isinstance(job, JobPool):
+            results = dict(self._iter_unit(job, priority, checkpoint=checkpoint))
+            return [results[member.name] for member in job]
+
+        [(_, result)] = self._iter_unit(job, priority, checkpoint=checkpoint)
+        return result
+
+    def _iter_unit(
+        self, job: Job, priority: int, mode: str = "as_submitted", checkpoint: CheckpointStore | None = None
+    ) -> Iterator[tuple[str, Any]]:
+        if checkpoint is not None:
+            # Jobs restored from the checkpoint are reported without being executed again
+            members = list(DependencyGraph.members(job))
+            for member in members:
+                if member.is_completed:
+                    yield member.name, member.result
+
+            pending = [member for member in members if not member.is_completed]
+            if not pending:
+                return
+            elif isinstance(job, JobPool):
+                job = JobPool(*pending)
+
+        is_pool = isinstance(job, JobPool)
+        with (
+            span(job.name, "pool" if is_pool else "job", priority=priority, job_type=type(job).__name__),
+            self._group_scope(job),
+        ):
+            with span("resolve_dependencies", "dependencies"):
+                self._resolve_dependencies(job)
+
+            for member in DependencyGraph.members(job):
+                member.cache = self.cache
+
+            print(f"Executing job: \n  - Priority: {priority}\n  - Job name: '{job.name}'")  # noqa: T201
+            if is_pool:
+                events = job.execute_iter(mode=mode, executor=self.worker_pool(job.backend), transport=self.transport)
+            else:
+                with span("execute", "execute"), measure(job):
+                    events = [(job, job.execute())]
+
+            for member, result in events:
+                # Record the outcome on the members, so that 'DependsOn' consumers do not run them again
+                member.is_completed = True
+                member.result = result
+                if checkpoint is not None:
+                    checkpoint.save(member.name, result)
+
+                yield member.name, result
+
+    def _check_resources(self) -> None:
+        """Reject the resources that the workers of process pools cannot close, before the run starts."""
+        for job in self.registry.grouped_jobs:
+            if isinstance(job, JobPool) and job.backend in ("process", "forkserver"):
+                check_process_resources(job)
+
+    @contextlib.contextmanager
+    def _run_scope(self) -> Iterator[ResourceScope]:
+        """The scope of the run-scoped resources, closed when the run ends."""
+        with ResourceScope("run") as scope:
+            self._run_resources = scope
+            try:
+                yield scope
+            finally:
+                self._run_resources = None
+
+    @contextlib.contextmanager
+    def _group_scope(self, job: Job) -> Iterator[ResourceScope]:
+        """
+        The scope of the group-scoped resources of a parallel group (or single job), attached to its members
+        together with the scope of the run, and closed when the group finishes.
+        """
+        members = list(DependencyGraph.members(job))
+        with ResourceScope("group") as scope:
+            scopes = {"run": self._run_resources, "group": scope}
+            for member in members:
+                member.resource_scopes = scopes
+            try:
+                yield scope
+            finally:
+                for member in members:
+                    member.resource_scopes = None
+
+    def _restore(self, checkpoint: CheckpointStore | None) -> None:
+        """Mark the jobs recorded in `checkpoint` as completed, with their stored results."""
+        if checkpoint is None:
+            return
+
+        for name, result in checkpoint.load().items():
+            if name in self.registry:
+                job = self.registry[self.registry.index(name)]
+                job.is_completed = True
+                job.result = result
 
     def _resolve_dependencies(self, job: Job) -> None:
+        if isinstance(job, JobPool):
+            for member in job:
+                self._resolve_dependencies(member)
+            return
+
         if hasattr(job, "args") or hasattr(job, "kwargs"):
             args = []
             for arg in job.args:
@@ -190,11 +563,50 @@ class Maestro:
 
         return json_str
 
-    def deserialize(self, path: str | Path | None) -> None:
+    def dump(self, path: str | Path, binary: bool = False) -> Path:
         """
-        Initialize the current state of JobRegistry from a JSON string
+        Write the JobRegistry to `path` as JSON Lines, one job per line, in compact form.
+
+        Unlike `serialize`, the jobs are written one at a time, without building the whole document
+        in memory. `deserialize` reads such files back one line at a time.
+
+        With `binary=True`, the registry is written as a binary snapshot instead (see `dump_snapshot`),
+        which `deserialize` memory-maps and whose jobs are built only when the registry first touches them.
         """
-        with open(str(path), "r") as f:
-            registry = json.load(f, object_hook=deserialize)
+        if binary:
+            return dump_snapshot(self.registry, path)
+
+        return dump_registry(self.registry, path)
 
-        self._registry = registry
+    def deserialize(self, path: str | Path | None, lazy: bool = False) -> None:
+        """
+        Initialize the current state of JobRegistry from a JSON string, or from a file written by `dump`
+
+        With `lazy=True`, the executables of the jobs are imported when the jobs first run, so that
+        a registry can be loaded and inspected without importing the dependencies of its jobs.
+        With a `journal`, the loaded registry replaces the contents of the journal.
+        """
+        if is_registry_snapshot(path):
+            registry = load_snapshot(path, lazy)
+        elif is_registry_stream(path):
+            registry = load_registry(path, lazy)
+        else:
+            with open(str(path), "r") as f, lazy_executables(lazy):
+                registry = json.load(f, object_hook=decode_object)
+
+        self._registry = registry if self.journal is None else self.journal.attach(registry)
+
+
+def _iter_in_context(iterator: Iterator[Any]) -> Iterator[Any]:
+    """Advance `iterator` in a copy of the current context, so that the context variables it sets stay there."""
+    context = contextvars.copy_context()
+    try:
+        while True:
+            try:
+                item = context.run(next, iterator)
+            except StopIteration:
+                return
+
+            yield item
+    finally:
+        context.run(iterator.close)
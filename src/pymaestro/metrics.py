@@ -0,0 +1,418 @@
+# src/pymaestro/metrics.py
+"""
+pymaestro.metrics
+=================
+
+In-process metrics of the runs of Maestro, for dashboards and capacity planning.
+
+Attach `Metrics` to Maestro to collect:
+- job durations, as histograms by job type and parallel group,
+- the time jobs of a parallel group wait before a worker picks them up,
+- the busy and available worker time of pools, and the utilization of each parallel group,
+- the bytes of results transferred back from process pool workers,
+- job failures.
+
+    metrics = Metrics(sinks=[StatsdSink("127.0.0.1", 8125)])
+    Maestro(metrics=metrics).execute()
+    metrics.export_prometheus("/var/lib/node_exporter/pymaestro.prom")
+
+The active `Metrics` are held in a context variable. When none is active, measuring a job
+costs one lookup and pool workers run their jobs unwrapped.
+"""
+
+import contextlib
+import contextvars
+import inspect
+import pickle
+import socket
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Iterator
+
+from .utils.files import atomic_write
+from .utils.transport import EncodedResult
+
+__all__ = ["Metrics", "StatsdSink", "PoolMeter", "MeasuredResult", "collect", "measure", "DEFAULT_BUCKETS"]
+
+# Upper bounds, in seconds, of the histogram buckets. Jobs range from milliseconds to many minutes.
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 600.0, float("inf"))
+
+_current_metrics: contextvars.ContextVar["Metrics | None"] = contextvars.ContextVar("pymaestro_metrics", default=None)
+
+_NOOP = contextlib.nullcontext()
+
+Labels = tuple[tuple[str, str], ...]
+
+# name: (type, help)
+_FAMILIES = {
+    "job_duration_seconds": ("histogram", "Duration of the execution of jobs."),
+    "queue_wait_seconds": ("histogram", "Time jobs of parallel groups waited before a worker picked them up."),
+    "worker_busy_seconds_total": ("counter", "Time pool workers spent executing jobs."),
+    "worker_capacity_seconds_total": ("counter", "Time pool workers were available while parallel groups ran."),
+    "pool_utilization_ratio": ("gauge", "Busy over available worker time of the last run of each parallel group."),
+    "result_bytes_total": ("counter", "Bytes of results transferred from process pool workers."),
+    "job_failures_total": ("counter", "Jobs that raised an exception."),
+}
+
+
+class StatsdSink:
+    """
+    Send every observation to a statsd daemon over UDP, as soon as it is made.
+
+    Histograms are sent as timers (`|ms`), counters as counters (`|c`) and gauges as gauges (`|g`).
+    Labels are sent as DogStatsD tags (`|#key:value`), understood by most statsd servers.
+    Sending never raises: metrics are dropped when the daemon is unreachable.
+    The UDP socket is opened by the first observation and released by `close` (or on leaving a `with`
+    block); `Maestro.close` closes the sinks of its metrics, and a later observation opens the socket again.
+
+    Attributes:
+        host (str): The host of the statsd daemon.
+        port (int): The UDP port of the statsd daemon.
+        prefix (str): The prefix of the metric names.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8125, prefix: str = "pymaestro") -> None:
+        self.host = host
+        self.port = port
+        self.prefix = prefix
+        self._socket: socket.socket | None = None
+        self._lock = threading.Lock()
+
+    def send(self, name: str, kind: str, value: float, labels: Labels) -> None:
+        if kind == "histogram":
+            value, kind_suffix = value * 1000, "ms"
+        else:
+            kind_suffix = "c" if kind == "counter" else "g"
+
+        line = f"{self.prefix}.{name}:{value:g}|{kind_suffix}"
+        if labels:
+            line += "|#" + ",".join(f"{key}:{label}" for key, label in labels)
+
+        try:
+            self._open().sendto(line.encode(), (self.host, self.port))
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        """Release the socket."""
+        with self._lock:
+            sock, self._socket = self._socket, None
+        if sock is not None:
+            sock.close()
+
+    def _open(self) -> socket.socket:
+        with self._lock:
+            if self._socket is None:
+                self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            return self._socket
+
+    def __enter__(self) -> "StatsdSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(host={self.host!r}, port={self.port!r}, prefix={self.prefix!r})"
+
+
+class Metrics:
+    """
+    Counters, gauges and histograms of the runs of Maestro.
+
+    Attributes:
+        namespace (str): The prefix of the metric names in the Prometheus export.
+        buckets (tuple[float, ...]): The upper bounds of the histogram buckets, in seconds.
+        sinks (list[StatsdSink]): Receive every observation as soon as it is made.
+    """
+
+    def __init__(
+        self,
+        namespace: str = "pymaestro",
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        sinks: list[StatsdSink] | None = None,
+    ) -> None:
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets)) if buckets[-1] == float("inf") else (*sorted(buckets), float("inf"))
+        self.sinks = sinks or []
+        self._values: dict[str, dict[Labels, Any]] = {name: {} for name in _FAMILIES}
+        self._lock = threading.Lock()
+
+    # -----------------------------------------------------------------------
+    #  Observations
+    # -----------------------------------------------------------------------
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record `value` in the histogram `name`."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._values[name].get(key)
+            if series is None:
+                series = self._values[name][key] = [0] * len(self.buckets) + [0.0]
+
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-1] += value
+
+        self._send(name, value, key)
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """Add `value` to the counter `name`."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[name][key] = self._values[name].get(key, 0) + value
+
+        self._send(name, value, key)
+
+    def set(self, name: str, value: float, **labels: str) -> None:
+        """Set the gauge `name` to `value`."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[name][key] = value
+
+        self._send(name, value, key)
+
+    def get(self, name: str, **labels: str) -> Any:
+        """
+        Return the value of a counter or a gauge, or `(bucket counts, sum)` of a histogram.
+        Returns None for series that were never recorded.
+        """
+        series = self._values[name].get(tuple(sorted(labels.items())))
+        if series is None or _FAMILIES[name][0] != "histogram":
+            return series
+
+        return series[:-1], series[-1]
+
+    def clear(self) -> None:
+        with self._lock:
+            for values in self._values.values():
+                values.clear()
+
+    def _send(self, name: str, value: float, labels: Labels) -> None:
+        for sink in self.sinks:
+            sink.send(name, _FAMILIES[name][0], value, labels)
+
+    # -----------------------------------------------------------------------
+    #  Export
+    # -----------------------------------------------------------------------
+
+    def to_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, (kind, description) in _FAMILIES.items():
+                metric = f"{self.namespace}_{name}"
+                lines.append(f"# HELP {metric} {description}")
+                lines.append(f"# TYPE {metric} {kind}")
+                for labels, series in sorted(self._values[name].items()):
+                    if kind != "histogram":
+                        lines.append(f"{metric}{_format_labels(labels)} {series:g}")
+                        continue
+
+                    for bound, count in zip(self.buckets, series, strict=False):
+                        le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                        lines.append(f"{metric}_bucket{_format_labels((*labels, ('le', le)))} {count}")
+                    lines.append(f"{metric}_sum{_format_labels(labels)} {series[-1]:g}")
+                    lines.append(f"{metric}_count{_format_labels(labels)} {series[-2]}")
+
+        return "\n".join(lines) + "\n"
+
+    def export_prometheus(self, path: str | Path) -> Path:
+        """
+        Write the metrics to `path` in the Prometheus text format, atomically, so that the file can
+        be scraped by the textfile collector of the node exporter while runs update it.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, self.to_prometheus().encode())
+        return path
+
+    def close(self) -> None:
+        """Close the sinks. The metrics collected so far are kept."""
+        for sink in self.sinks:
+            sink.close()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(namespace={self.namespace!r}, sinks={self.sinks!r})"
+
+
+def collect(metrics: "Metrics | None") -> ContextManager[Any]:
+    """Make `metrics` the active metrics within the block. A no-op when `metrics` is None."""
+    if metrics is None:
+        return _NOOP
+
+    return _activate(metrics)
+
+
+@contextlib.contextmanager
+def _activate(metrics: Metrics) -> Iterator[Metrics]:
+    token = _current_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        try:
+            _current_metrics.reset(token)
+        except ValueError:  # a generator finalized in another context
+            pass
+
+
+def measure(job: Any) -> ContextManager[Any]:
+    """Record the duration of the enclosed execution of `job`, or its failure, in the active metrics."""
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return _NOOP
+
+    return _measure(metrics, job)
+
+
+@contextlib.contextmanager
+def _measure(metrics: Metrics, job: Any) -> Iterator[None]:
+    labels = _job_labels(job)
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        metrics.increment("job_failures_total", **labels)
+        raise
+
+    metrics.observe("job_duration_seconds", time.perf_counter() - start, **labels)
+
+
+# ---------------------------------------------------------------------------
+#  Metrics of the jobs of a JobPool, possibly executed in another process
+# ---------------------------------------------------------------------------
+
+
+class MeasuredResult:
+    """
+    The result of a job executed by a pool worker, with the times the worker started and finished it.
+
+    Attributes:
+        result (Any): The result of the job, pickled when `nbytes` is its size.
+        started_ns (int): When the worker started the job.
+        finished_ns (int): When the worker finished the job.
+        nbytes (int | None): The bytes transferred to the parent, when the job ran in another process.
+        pickled (bool): Whether `result` holds the pickled result.
+    """
+
+    __slots__ = ("result", "started_ns", "finished_ns", "nbytes", "pickled")
+
+    def __init__(self, result: Any, started_ns: int, finished_ns: int, nbytes: int | None, pickled: bool) -> None:
+        self.result = result
+        self.started_ns = started_ns
+        self.finished_ns = finished_ns
+        self.nbytes = nbytes
+        self.pickled = pickled
+
+    def __reduce__(self):
+        return self.__class__, (self.result, self.started_ns, self.finished_ns, self.nbytes, self.pickled)
+
+
+class PoolMeter:
+    """
+    Measure the execution of one JobPool: the queue wait, duration and result size of each job,
+    the failures, and the utilization of the workers while the pool runs.
+    """
+
+    def __init__(self, metrics: Metrics, parallel_group: str, backend: str, workers: int) -> None:
+        self.metrics = metrics
+        self.parallel_group = parallel_group
+        self.backend = backend
+        self.workers = workers
+        self.started_ns = time.time_ns()
+        self.busy_ns = 0
+        self._submitted_ns: dict[str, int] = {}
+
+    @classmethod
+    def start(cls, pool: Any, backend: str, executor: Any) -> "PoolMeter | None":
+        """Return a meter for `pool`, which starts now on `executor`, or None when no metrics are active."""
+        metrics = _current_metrics.get()
+        if metrics is None:
+            return None
+
+        # The number of jobs of the pool that run at the same time
+        workers = min(
+            len(pool), getattr(executor, "_max_workers", None) or len(pool), pool.max_concurrency or len(pool)
+        )
+        return cls(metrics, pool.parallel_group, backend, max(workers, 1))
+
+    def wrap(self, job: Any, runner: Callable[..., Any], serialize: bool = False) -> Callable[..., Any]:
+        """
+        Wrap the function that a worker calls with `job`, so that it returns a `MeasuredResult`.
+        With `serialize`, the worker pickles the result itself, so that its size can be measured
+        without pickling it twice. Coroutine functions are wrapped with a coroutine function.
+        """
+        self._submitted_ns[job.name] = time.time_ns()
+        if inspect.iscoroutinefunction(runner):
+            return partial(_async_run_measured, runner)
+
+        return partial(_run_measured, runner, serialize)
+
+    def receive(self, job: Any, result: Any) -> Any:
+        """Record the metrics of a finished job and return its result."""
+        if not isinstance(result, MeasuredResult):
+            return result
+
+        labels = _job_labels(job)
+        duration_ns = result.finished_ns - result.started_ns
+        self.busy_ns += duration_ns
+        queue_wait_ns = max(result.started_ns - self._submitted_ns.get(job.name, result.started_ns), 0)
+        self.metrics.observe("job_duration_seconds", duration_ns / 1e9, **labels)
+        self.metrics.observe(
+            "queue_wait_seconds", queue_wait_ns / 1e9, parallel_group=self.parallel_group, backend=self.backend
+        )
+        if result.nbytes is not None:
+            self.metrics.increment(
+                "result_bytes_total", result.nbytes, parallel_group=self.parallel_group, backend=self.backend
+            )
+
+        return pickle.loads(result.result) if result.pickled else result.result
+
+    def failed(self, job: Any) -> None:
+        self.metrics.increment("job_failures_total", **_job_labels(job))
+
+    def close(self) -> None:
+        """Record the utilization of the workers, from the start of the pool until now."""
+        capacity_ns = (time.time_ns() - self.started_ns) * self.workers
+        self.metrics.increment("worker_busy_seconds_total", self.busy_ns / 1e9, backend=self.backend)
+        self.metrics.increment("worker_capacity_seconds_total", capacity_ns / 1e9, backend=self.backend)
+        if capacity_ns:
+            self.metrics.set(
+                "pool_utilization_ratio", min(self.busy_ns / capacity_ns, 1.0), parallel_group=self.parallel_group
+            )
+
+
+def _run_measured(runner: Callable[..., Any], serialize: bool, job: Any) -> MeasuredResult:
+    started_ns = time.time_ns()
+    result = runner(job)
+    finished_ns = time.time_ns()
+    if isinstance(result, EncodedResult):
+        return MeasuredResult(result, started_ns, finished_ns, result.nbytes, pickled=False)
+    elif serialize:
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        return MeasuredResult(payload, started_ns, finished_ns, len(payload), pickled=True)
+
+    return MeasuredResult(result, started_ns, finished_ns, None, pickled=False)
+
+
+async def _async_run_measured(runner: Callable[..., Any], job: Any) -> MeasuredResult:
+    started_ns = time.time_ns()
+    result = await runner(job)
+    return MeasuredResult(result, started_ns, time.time_ns(), None, pickled=False)
+
+
+def _job_labels(job: Any) -> dict[str, str]:
+    return {"job_type": type(job).__name__, "parallel_group": job.parallel_group or ""}
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+
+    escaped = (
+        (key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
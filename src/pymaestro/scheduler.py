@@ -0,0 +1,160 @@
+# src/pymaestro/scheduler.py
+"""
+pymaestro.scheduler
+===================
+
+Dependency-graph scheduling for Maestro.
+
+The default execution strategy walks `JobRegistry.grouped_jobs` strictly in priority
+order. This module builds a directed acyclic graph from the `DependsOn` markers found
+in each job's `args`/`kwargs` instead, so that jobs (or parallel groups) which do not
+depend on each other can run at the same time.
+"""
+
+import concurrent.futures
+import contextvars
+import threading
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator
+
+from .job_registry import JobRegistry
+from .jobs import Job, JobPool
+from .utils import DependsOn
+
+__all__ = ["DependencyGraph", "run_graph", "upstream_names"]
+
+
+def upstream_names(job: Job) -> set[str]:
+    """Return the names of all jobs referenced through `DependsOn` in the arguments of `job`."""
+    if isinstance(job, JobPool):
+        return set().union(*(upstream_names(member) for member in job))
+
+    values = [*getattr(job, "args", ()), *getattr(job, "kwargs", {}).values()]
+    return {value.name for value in values if isinstance(value, DependsOn)}
+
+
+class DependencyGraph:
+    """
+    A DAG over the execution units of a registry.
+
+    Execution units are the keys of `JobRegistry.grouped_jobs`: single jobs and JobPools.
+    A unit depends on another unit when any of its jobs has a `DependsOn` argument that
+    points to a job of the other unit.
+
+    Attributes:
+        units (list[Job]): The execution units in priority order.
+        upstream (dict[Job, set[Job]]): The units each unit depends on.
+        downstream (dict[Job, set[Job]]): The units that depend on each unit.
+    """
+
+    def __init__(self, registry: JobRegistry) -> None:
+        self.units: list[Job] = list(registry.grouped_jobs)
+        self.upstream: dict[Job, set[Job]] = {unit: set() for unit in self.units}
+        self.downstream: dict[Job, set[Job]] = {unit: set() for unit in self.units}
+
+        owners = {}
+        for unit in self.units:
+            for job in self.members(unit):
+                owners[job.name] = unit
+
+        for unit in self.units:
+            for name in upstream_names(unit):
+                if name not in owners:
+                    raise KeyError(f"Job with name '{name}' not found in registry")
+
+                upstream_unit = owners[name]
+                if upstream_unit is unit:
+                    raise ValueError(
+                        f"Job '{name}' is a dependency of a job in the same parallel group '{unit.name}'. "
+                        f"Jobs of the same parallel group run concurrently and cannot depend on each other."
+                    )
+
+                self.upstream[unit].add(upstream_unit)
+                self.downstream[upstream_unit].add(unit)
+
+        self._validate_acyclic()
+
+    @staticmethod
+    def members(unit: Job) -> Iterable[Job]:
+        return unit if isinstance(unit, JobPool) else (unit,)
+
+    def roots(self) -> list[Job]:
+        """Return the units without upstream dependencies, in priority order."""
+        return [unit for unit in self.units if not self.upstream[unit]]
+
+    def topological_order(self) -> Iterator[Job]:
+        """Yield the units so that every unit comes after all of its upstream units."""
+        pending = {unit: len(upstream) for unit, upstream in self.upstream.items()}
+        priorities = {unit: priority for priority, unit in enumerate(self.units)}
+        ready = deque(self.roots())
+        while ready:
+            unit = ready.popleft()
+            yield unit
+            released = [child for child in self.downstream[unit] if _release(pending, child)]
+            ready.extend(sorted(released, key=priorities.__getitem__))
+
+    def _validate_acyclic(self) -> None:
+        visited = sum(1 for _ in self.topological_order())
+        if visited != len(self.units):
+            raise ValueError("Circular dependency detected between jobs. 'DependsOn' markers must form a DAG.")
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def __repr__(self) -> str:
+        edges = {unit.name: sorted(upstream.name for upstream in self.upstream[unit]) for unit in self.units}
+        return f"{self.__class__.__name__}({edges!r})"
+
+
+def _release(pending: dict[Job, int], unit: Job) -> bool:
+    pending[unit] -= 1
+    return pending[unit] == 0
+
+
+def run_graph(
+    graph: DependencyGraph,
+    execute_unit: Callable[[Job], Any],
+    max_workers: int | None = None,
+    stop: threading.Event | None = None,
+) -> dict[Job, Any]:
+    """
+    Execute the units of `graph` on a shared thread budget of `max_workers`.
+
+    Every unit whose upstream units have finished is submitted immediately.
+    `execute_unit` is called with a single unit, in a copy of the caller's context,
+    and its return value is recorded. Once `stop` is set, no unit is started anymore:
+    the units that are not running are cancelled, and the running ones are waited for.
+
+    Returns:
+        dict[Job, Any]: The result of every unit that finished.
+    """
+    pending = {unit: len(upstream) for unit, upstream in graph.upstream.items()}
+    priorities = {unit: priority for priority, unit in enumerate(graph.units)}
+    results: dict[Job, Any] = {}
+
+    def submit(unit: Job) -> concurrent.futures.Future:
+        return executor.submit(contextvars.copy_context().run, execute_unit, unit)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {submit(unit): unit for unit in graph.roots()}
+        while running:
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            if stop is not None and stop.is_set():
+                for remaining in running:
+                    remaining.cancel()
+                break
+
+            for future in sorted(done, key=lambda f: priorities[running[f]]):
+                unit = running.pop(future)
+                try:
+                    results[unit] = future.result()
+                except BaseException:
+                    for remaining in running:
+                        remaining.cancel()
+                    raise
+
+                for child in sorted(graph.downstream[unit], key=priorities.__getitem__):
+                    if _release(pending, child):
+                        running[submit(child)] = child
+
+    return results
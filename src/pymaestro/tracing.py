@@ -0,0 +1,325 @@
+# src/pymaestro/tracing.py
+"""
+pymaestro.tracing
+=================
+
+Record where the time of a run goes, and export it for Perfetto or an OpenTelemetry collector.
+
+Attach a `Tracer` to Maestro to record one span per run, per job or parallel group, per
+job of a parallel group (with the PID of the worker that ran it), and per phase:
+dependency resolution, `Resource` setup and teardown, execution and result transfer.
+
+    tracer = Tracer()
+    Maestro(tracer=tracer).execute()
+    tracer.export_chrome("run.trace.json")  # open in https://ui.perfetto.dev
+    tracer.export_otlp("run.otlp.json")
+
+The active tracer and span are held in context variables. When no tracer is active,
+`span()` returns a shared no-op context manager, so that tracing costs one lookup.
+Spans recorded in pool workers travel back to the parent together with the job's result.
+"""
+
+import contextlib
+import contextvars
+import inspect
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Iterator
+
+__all__ = ["Tracer", "Span", "TracedResult", "span", "current_context", "traced"]
+
+_current_tracer: contextvars.ContextVar["Tracer | None"] = contextvars.ContextVar("pymaestro_tracer", default=None)
+_current_span: contextvars.ContextVar["Span | None"] = contextvars.ContextVar("pymaestro_span", default=None)
+
+_NOOP = contextlib.nullcontext()
+
+
+@dataclass(slots=True)
+class Span:
+    """
+    A timed operation of a run. Times are nanoseconds since the epoch, comparable across processes.
+
+    Attributes:
+        name (str): The job name for job spans, the phase otherwise.
+        category (str): The kind of span: "run", "job", "pool", "member", "dependencies",
+            "resource", "execute" or "transfer".
+        trace_id (str): The identifier of the run, shared by all of its spans.
+        span_id (str): The identifier of the span.
+        parent_id (str | None): The identifier of the enclosing span.
+        start_ns (int): When the operation started.
+        end_ns (int): When the operation finished.
+        pid (int): The process that ran the operation.
+        tid (int): The native id of the thread that ran the operation.
+        attributes (dict[str, Any]): Additional details, e.g. the priority of a job.
+        error (str | None): The exception that ended the operation, if any.
+    """
+
+    name: str
+    category: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int = 0
+    pid: int = field(default_factory=os.getpid)
+    tid: int = field(default_factory=threading.get_native_id)
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+class Tracer:
+    """
+    Collect the spans of one or more runs.
+
+    Attributes:
+        trace_id (str): The identifier shared by the recorded spans.
+        spans (list[Span]): The finished spans, in the order they finished.
+    """
+
+    def __init__(self, trace_id: str | None = None) -> None:
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, *, parent: str | None = None, **attributes: Any) -> Iterator[Span]:
+        """
+        Time the enclosed block as a span, child of `parent` or of the current span.
+
+        Within the block, this tracer and the new span are the current ones, so that nested
+        calls to `span()` record child spans.
+        """
+        if parent is None:
+            enclosing = _current_span.get()
+            parent = enclosing.span_id if enclosing is not None else None
+
+        record = Span(name, category, self.trace_id, uuid.uuid4().hex[:16], parent, time.time_ns())
+        record.attributes.update(attributes)
+        tracer_token = _current_tracer.set(self)
+        span_token = _current_span.set(record)
+        try:
+            yield record
+        except GeneratorExit:  # a stream that was closed early is not a failure
+            raise
+        except BaseException as e:
+            record.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record.end_ns = time.time_ns()
+            _reset(_current_span, span_token)
+            _reset(_current_tracer, tracer_token)
+            self.add(record)
+
+    def add(self, *spans: Span) -> None:
+        """Record finished spans, e.g. the spans received from a pool worker."""
+        with self._lock:
+            self.spans.extend(spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+    def to_chrome(self) -> dict[str, Any]:
+        """Return the spans in the Chrome trace-event format, as complete ("X") events."""
+        events: list[dict[str, Any]] = []
+        for pid in sorted({record.pid for record in self.spans}):
+            name = "maestro" if pid == os.getpid() else f"worker {pid}"
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": name}})
+
+        for record in sorted(self.spans, key=lambda record: record.start_ns):
+            args = {**record.attributes, "span_id": record.span_id, "parent_id": record.parent_id}
+            if record.error is not None:
+                args["error"] = record.error
+
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.category,
+                    "ph": "X",
+                    "ts": record.start_ns / 1000,
+                    "dur": (record.end_ns - record.start_ns) / 1000,
+                    "pid": record.pid,
+                    "tid": record.tid,
+                    "args": args,
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_otlp(self, service_name: str = "pymaestro") -> dict[str, Any]:
+        """Return the spans in the OTLP-JSON format of the OpenTelemetry trace exporter."""
+        spans = []
+        for record in sorted(self.spans, key=lambda record: record.start_ns):
+            attributes = {"maestro.category": record.category, "process.pid": record.pid, "thread.id": record.tid}
+            attributes.update(record.attributes)
+            otlp_span = {
+                "traceId": record.trace_id,
+                "spanId": record.span_id,
+                "name": record.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(record.start_ns),
+                "endTimeUnixNano": str(record.end_ns),
+                "attributes": [_otlp_attribute(key, value) for key, value in attributes.items()],
+                "status": {"code": 2, "message": record.error} if record.error else {"code": 1},
+            }
+            if record.parent_id is not None:
+                otlp_span["parentSpanId"] = record.parent_id
+            spans.append(otlp_span)
+
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", service_name)]},
+                    "scopeSpans": [{"scope": {"name": "pymaestro"}, "spans": spans}],
+                }
+            ]
+        }
+
+    def export_chrome(self, path: str | Path) -> Path:
+        """Write the spans to `path` in the Chrome trace-event format, loadable in Perfetto."""
+        return _write_json(path, self.to_chrome())
+
+    def export_otlp(self, path: str | Path, service_name: str = "pymaestro") -> Path:
+        """Write the spans to `path` in the OTLP-JSON format."""
+        return _write_json(path, self.to_otlp(service_name))
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(trace_id={self.trace_id!r}, spans={len(self.spans)})"
+
+
+def span(name: str, category: str, *, tracer: Tracer | None = None, **attributes: Any) -> ContextManager[Any]:
+    """
+    Time the enclosed block with `tracer`, or with the current tracer. A no-op when there is neither.
+    """
+    if tracer is None:
+        tracer = _current_tracer.get()
+    if tracer is None:
+        return _NOOP
+
+    return tracer.span(name, category, **attributes)
+
+
+def current_context() -> tuple[str, str | None] | None:
+    """Return the trace id and the current span id, or None when no tracer is active."""
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return None
+
+    enclosing = _current_span.get()
+    return tracer.trace_id, enclosing.span_id if enclosing is not None else None
+
+
+# ---------------------------------------------------------------------------
+#  Tracing of the jobs of a JobPool, possibly in another process
+# ---------------------------------------------------------------------------
+
+
+class TracedResult:
+    """
+    The result of a job executed by a pool worker, together with the spans the worker recorded.
+
+    Attributes:
+        result (Any): The result of the job, possibly encoded by a transport.
+        spans (list[Span]): The spans recorded by the worker.
+        finished_ns (int): When the worker finished, i.e. when the transfer of the result started.
+    """
+
+    __slots__ = ("result", "spans", "finished_ns")
+
+    def __init__(self, result: Any, spans: list[Span], finished_ns: int) -> None:
+        self.result = result
+        self.spans = spans
+        self.finished_ns = finished_ns
+
+    def __reduce__(self):
+        return self.__class__, (self.result, self.spans, self.finished_ns)
+
+    def receive(self, name: str, decode: Callable[[Any], Any] = lambda result: result, **attributes: Any) -> Any:
+        """
+        Record the worker's spans and a "transfer" span, from the end of the job until the decoded
+        result is available in the parent. Returns the decoded result.
+        """
+        tracer = _current_tracer.get()
+        result = decode(self.result)
+        if tracer is not None:
+            worker = next((record for record in self.spans if record.category == "member"), None)
+            transfer = Span(
+                name,
+                "transfer",
+                tracer.trace_id,
+                uuid.uuid4().hex[:16],
+                worker.parent_id if worker is not None else None,
+                self.finished_ns,
+                time.time_ns(),
+                attributes={"worker.pid": worker.pid if worker is not None else None, **attributes},
+            )
+            tracer.add(*self.spans, transfer)
+
+        return result
+
+
+def traced(runner: Callable[..., Any], context: tuple[str, str | None]) -> Callable[..., Any]:
+    """
+    Wrap the function that a pool worker calls with a job, so that it records the job's spans
+    and returns a `TracedResult`. Coroutine functions are wrapped with a coroutine function.
+    """
+    if inspect.iscoroutinefunction(runner):
+        return partial(_async_run_traced, runner, context)
+
+    return partial(_run_traced, runner, context)
+
+
+def _run_traced(runner: Callable[..., Any], context: tuple[str, str | None], job: Any) -> TracedResult:
+    trace_id, parent = context
+    recorder = Tracer(trace_id)
+    with recorder.span(job.name, "member", parent=parent, pid=os.getpid()):
+        with recorder.span("execute", "execute"):
+            result = runner(job)
+
+    return TracedResult(result, recorder.spans, time.time_ns())
+
+
+async def _async_run_traced(runner: Callable[..., Any], context: tuple[str, str | None], job: Any) -> TracedResult:
+    trace_id, parent = context
+    recorder = Tracer(trace_id)
+    with recorder.span(job.name, "member", parent=parent, pid=os.getpid()):
+        with recorder.span("execute", "execute"):
+            result = await runner(job)
+
+    return TracedResult(result, recorder.spans, time.time_ns())
+
+
+def _reset(variable: contextvars.ContextVar, token: contextvars.Token) -> None:
+    try:
+        variable.reset(token)
+    except ValueError:  # a generator finalized in another context
+        pass
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+
+    return {"key": key, "value": encoded}
+
+
+def _write_json(path: str | Path, document: dict[str, Any]) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document))
+    return path
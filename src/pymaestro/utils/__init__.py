@@ -1,5 +1,47 @@
 # src/pymaestro/utils/__init__.py
-from .dispatcher import Dispatcher
-from .wrappers import DependsOn, Resource, inject_dependencies, is_completed
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["Dispatcher", "DependsOn", "Resource", "is_completed", "inject_dependencies"]
+__all__ = [
+    "Dispatcher",
+    "lazy_executables",
+    "DependsOn",
+    "Resource",
+    "Broadcast",
+    "is_completed",
+    "inject_dependencies",
+    "cached",
+]
+
+# The submodule that defines each public name, imported on first access: `wrappers` imports wrapt,
+# which imports asyncio, and modules such as `utils.files` must stay cheap to import
+_SUBMODULES = {
+    "Dispatcher": ".dispatcher",
+    "lazy_executables": ".imports",
+    "DependsOn": ".wrappers",
+    "Resource": ".wrappers",
+    "Broadcast": ".wrappers",
+    "is_completed": ".wrappers",
+    "inject_dependencies": ".wrappers",
+    "cached": ".wrappers",
+}
+
+if TYPE_CHECKING:
+    from .dispatcher import Dispatcher
+    from .imports import lazy_executables
+    from .wrappers import Broadcast, DependsOn, Resource, cached, inject_dependencies, is_completed
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        submodule = _SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value  # later accesses skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,4 @@
 # src/pymaestro/utils/deserialize.py
-import importlib
 from datetime import date, datetime
 from types import FunctionType
 from typing import Any
@@ -7,9 +6,10 @@ from typing import Any
 from ..job_registry import JobRegistry
 from ..jobs import Job, JobPool, create_job
 from .dispatcher import Dispatcher
-from .wrappers import DependsOn, Resource
+from .imports import is_lazy, resolve_import_path
+from .wrappers import Broadcast, DependsOn, Resource
 
-__all__ = ["deserialize"]
+__all__ = ["deserialize", "decode_object"]
 
 # ---------------------------------------------------------------------------
 #  Deserialization — singledispatch-like factory
@@ -20,6 +20,14 @@ def get_type(obj: dict[str, Any]) -> Any:
     return obj.get("type", object())
 
 
+class _ImportPath(str):
+    """A function left unresolved by `deserialize` within `lazy_executables()`."""
+
+
+def _resolved(value: Any) -> Any:
+    return resolve_import_path(value) if isinstance(value, _ImportPath) else value
+
+
 @Dispatcher(key_generator=get_type)
 def deserialize(obj: Any) -> Any:
     return obj
@@ -37,9 +45,11 @@ def deserialize_date(obj: dict[str, str]) -> date:
 
 @deserialize.register("function")
 def deserialize_function(obj: dict[str, str]) -> FunctionType:
-    import_path, function_name = obj["value"].rsplit(".", maxsplit=1)
-    module = importlib.import_module(import_path)
-    return getattr(module, function_name)
+    # Within `lazy_executables()`, the executables of jobs stay import paths until the jobs run
+    if is_lazy():
+        return _ImportPath(obj["value"])
+
+    return resolve_import_path(obj["value"])
 
 
 @deserialize.register("callable")
@@ -47,6 +57,13 @@ def deserialize_function(obj: dict[str, str]) -> FunctionType:
 @deserialize.register("script")
 def deserialize_callable_job(obj: dict[str, str]) -> Job:
     _type = obj.pop("type")  # it must be passed as positional argument to the create_job factory function
+    if isinstance(obj["executable"], _ImportPath):
+        obj["executable"] = str(obj["executable"])
+    # Functions passed as arguments are values, not executables: they are imported right away
+    if "args" in obj:
+        obj["args"] = [_resolved(arg) for arg in obj["args"]]
+    if "kwargs" in obj:
+        obj["kwargs"] = {key: _resolved(value) for key, value in obj["kwargs"].items()}
     return create_job(_type, **obj)
 
 
@@ -67,4 +84,25 @@ def deserialize_depends_on(obj: dict):
 
 @deserialize.register("Resource")
 def deserialize_resource(obj: dict):
-    return Resource(obj["generator_fn"], obj["generator_args"], obj["generator_kwargs"])
+    # Registries written before resource scopes existed hold job-scoped resources
+    return Resource(
+        _resolved(obj["generator_fn"]), obj["generator_args"], obj["generator_kwargs"], obj.get("scope", "job")
+    )
+
+
+@deserialize.register("Broadcast")
+def deserialize_broadcast(obj: dict):
+    return Broadcast(_resolved(obj["value"]), obj.get("directory"))
+
+
+def decode_object(obj: dict[str, Any]) -> Any:
+    """
+    The `object_hook` of registry files: decode the dicts tagged with a registered `type`, and return
+    any other dict (e.g. the kwargs of a job) as it is, without going through the dispatcher.
+    """
+    try:
+        decoder = deserialize.registry.get(obj.get("type"))
+    except TypeError:  # an unhashable "type" value
+        return obj
+
+    return obj if decoder is None else decoder(obj)
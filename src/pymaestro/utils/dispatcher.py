@@ -1,12 +1,20 @@
 # src/pymaestro/utils/dispatcher.py
 from __future__ import annotations
 
+import operator
+from functools import singledispatch
 from types import MappingProxyType, MethodType
-from typing import Any, Callable, Dict, List, Optional, Set, TypeVar, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, TypeVar, Union
 
 __all__ = ["Dispatcher"]
 
 T = TypeVar("T")
+Call = tuple[tuple[Any, ...], Dict[str, Any]]  # the positional and keyword arguments of a call
+
+
+def _unregistered(*args: Any, **kwargs: Any) -> Any:
+    """Stand-in for the classes without a function (or a batch handler) in the `by_type` lookups."""
+    raise NotImplementedError
 
 
 class Dispatcher:
@@ -14,10 +22,21 @@ class Dispatcher:
     A class to manage function dispatching based on the selected argument.
     By default, it performs the dispatching based on the first argument.
 
+    The extraction of the key is compiled into a closure specialized for `key_idx`, `key_names`
+    and `key_generator` when the dispatcher is created, so that calls do not branch on them.
+    With `by_type=True`, the dispatcher selects the function registered for the class of the key,
+    or for its closest base class, through `functools.singledispatch`: the classes are resolved and
+    cached the same way, including abstract base classes, and `register` accepts the same forms
+    (`register(cls)`, `register(cls, func)`, or a function whose first argument is annotated).
+
     Attributes:
         fallback (Callable): The default function to call if no mapping matches.
 
         registry (Dict[Any, Callable]): A dictionary mapping values to specific functions.
+
+        batch_registry (Dict[Any, Callable]): The functions handling many calls of a key at once (see `map`).
+
+        by_type (bool): Whether the functions are registered for classes and selected by the class of the key.
     """
 
     def __init__(
@@ -27,6 +46,7 @@ class Dispatcher:
         key_idx: Union[int, List[int]] = 0,
         key_generator: Optional[Callable[..., Any]] = None,
         key_names: Optional[Union[str, List[str], Set[str]]] = None,
+        by_type: bool = False,
     ):
         """
         Initialize the dispatcher with a default function.
@@ -40,9 +60,12 @@ class Dispatcher:
                 If named arguments are used instead of an index, the arguments used
                 for dispatching must be passed as keyword arguments.
                 By default, dispatching is performed using the first argument.
+            by_type (bool, optional): Dispatch on the class of the key, resolved through its MRO.
+                `dispatch(cls)` then returns the function selected for a class, as with `functools.singledispatch`.
         """
         self.fallback = fallback
         self.registry: Dict[Any, Callable[..., Any]] = {}
+        self.batch_registry: Dict[Any, Callable[[List[Call]], List[Any]]] = {}
         self.key_idx = key_idx
         self.key_generator = key_generator
         self.key_names = key_names
@@ -56,6 +79,14 @@ class Dispatcher:
             elif isinstance(self.key_names, (tuple, list)):
                 self.key_names = set(key_names)  # type: ignore
 
+        self.by_type = by_type
+        # The functions and the batch handlers, resolved by class (by_type=True only)
+        self._functions = singledispatch(fallback or _unregistered)
+        self._batch_functions = singledispatch(_unregistered)
+        self.dispatch = self._functions.dispatch
+        self._attribute_name: Optional[str] = None
+        self._key = self._compile_key()
+
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """
         Dispatch to the appropriate function based on the selected argument.
@@ -70,35 +101,111 @@ class Dispatcher:
         if self.fallback is None:
             return self._set_fallback(args[0])
 
-        if not (args or kwargs):
-            raise ValueError("At least one positional or keyword argument is required for dispatching.")
-        key = self.extract_key(args, kwargs)
-        function_to_call = self.registry.get(key, self.fallback)
-        return function_to_call(*args, **kwargs)
+        try:
+            key = self._key(args, kwargs)
+        except Exception:
+            if not (args or kwargs):
+                raise ValueError("At least one positional or keyword argument is required for dispatching.") from None
+            raise
+
+        if self.by_type:
+            return self.dispatch(key.__class__)(*args, **kwargs)
+
+        return self.registry.get(key, self.fallback)(*args, **kwargs)
+
+    def __set_name__(self, owner_class: type[Any], name: str) -> None:
+        self._attribute_name = name
 
     def __get__(self, instance: Optional[Any], owner_class: Optional[type[Any]]) -> Dispatcher | Callable[..., Any]:
         if instance is None:
             return self
 
-        return MethodType(self, instance)
+        method = MethodType(self, instance)
+        if self._attribute_name is not None:
+            try:  # later lookups find the bound method in the instance and skip the descriptor
+                instance.__dict__[self._attribute_name] = method
+            except AttributeError:  # instances without a __dict__
+                pass
+
+        return method
 
-    def register(self, key: Any) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    def register(self, key: Any, func: Optional[Callable[..., T]] = None) -> Any:
         """
         Decorator factory to register a function to handle a specific key.
 
         Args:
-            key (Any): The key to associate with the function.
+            key (Any): The key to associate with the function. With `by_type=True`, it can also be the
+                function itself, registered for the class its first argument is annotated with.
+            func (Callable[..., Any], optional): The function to register, instead of decorating it.
 
         Returns:
-            A decorator function that registers the provided function and return the same function as it is.
+            A decorator function that registers the provided function and return the same function as it is,
+            or the function when it is given.
         """
+        if self.by_type and not isinstance(key, type) and func is None:
+            return self._register_by_type(key)
 
         def decorator(func: Callable[..., T]) -> Callable[..., T]:
+            if self.by_type:
+                return self._register_by_type(key, func)
             self.registry[key] = func
+            self.batch_registry.pop(key, None)  # it would bypass the new function
+            return func
+
+        return decorator if func is None else decorator(func)
+
+    def register_batch(self, key: Any) -> Callable[[Callable[[List[Call]], List[Any]]], Callable[..., Any]]:
+        """
+        Decorator factory to register a function handling all the calls of `key` passed to `map` at once.
+
+        The function receives the `(args, kwargs)` pairs of the calls and returns their results, in the same
+        order. Registering a function for `key` afterwards removes its batch handler.
+        """
+
+        def decorator(func: Callable[[List[Call]], List[Any]]) -> Callable[[List[Call]], List[Any]]:
+            self.batch_registry[key] = func
+            if self.by_type:
+                self._batch_functions.register(key, func)
             return func
 
         return decorator
 
+    def map(self, calls: Iterable[Call]) -> List[Any]:
+        """
+        Dispatch many calls, each given as an `(args, kwargs)` pair, and return their results in order.
+
+        The calls are grouped by key, so that the function of each key is looked up once, or its batch
+        handler (see `register_batch`) is called once with all of them. The calls of a key are made in
+        order, but the keys are handled one after the other. With `by_type=True`, the calls are grouped
+        by class, and the batch handler of a class is resolved like its function.
+        """
+        calls = list(calls)
+        extract_key = self._key
+        groups: Dict[Any, List[int]] = {}
+        for position, (args, kwargs) in enumerate(calls):
+            key = extract_key(args, kwargs)
+            groups.setdefault(key.__class__ if self.by_type else key, []).append(position)
+
+        if len(groups) == 1:  # e.g. the rows of a manifest of one job type
+            [key] = groups
+            return self._call_group(key, calls)
+
+        results: List[Any] = [None] * len(calls)
+        for key, positions in groups.items():
+            group_results = self._call_group(key, [calls[position] for position in positions])
+            for position, result in zip(positions, group_results, strict=True):
+                results[position] = result
+
+        return results
+
+    def _call_group(self, key: Any, calls: List[Call]) -> List[Any]:
+        batch_function = self._batch_functions.dispatch(key) if self.by_type else self.batch_registry.get(key)
+        if batch_function is not None and batch_function is not _unregistered:
+            return list(batch_function(calls))
+
+        function = self.get_function(key)
+        return [function(*args, **kwargs) for args, kwargs in calls]
+
     def get_registry(self) -> MappingProxyType[Any, Callable[..., Any]]:
         """
         Get an immutable view of the current function registry.
@@ -117,35 +224,80 @@ class Dispatcher:
 
         Returns:
             Callable[..., Any]: The function associated with the key, or the default function.
+                With `by_type=True`, `key` is a class.
         """
+        if self.by_type:
+            return self.dispatch(key)
+
         return self.registry.get(key, self.fallback)
 
     def extract_key(self, args: tuple[Any, ...], kwargs: dict[str, Any] | None = None) -> Any:
-        if self.key_names:
-            if kwargs is None:
-                kwargs = {}
-            missing_keys = self.key_names - kwargs.keys()
-            if missing_keys:
-                raise TypeError(
-                    f"Missing required keyword arguments: {missing_keys}. "
-                    f"Arguments used for dispatching must be passed as keyword arguments."
-                )
+        return self._key(args, kwargs)
 
-            kws = {key: kwargs[key] for key in self.key_names}
-
-            return self.key_generator(**kws) if self.key_generator else tuple(kws.values())
+    def _compile_key(self) -> Callable[[tuple[Any, ...], Optional[dict[str, Any]]], Any]:
+        """Build the function that extracts the key from the arguments of a call."""
+        key_generator = self.key_generator
+        if self.key_names:
+            return self._compile_keyword_key()
 
         # --- Positional-based dispatch ---
         if isinstance(self.key_idx, (list, tuple)):
-            values = tuple(args[i] for i in self.key_idx)
-            return self.key_generator(*values) if self.key_generator else values
-
-        # key_idx is guaranteed to be int here
-        value = args[self.key_idx]
-        return self.key_generator(value) if self.key_generator else value
+            key_idx = tuple(self.key_idx)
+            values = operator.itemgetter(*key_idx) if len(key_idx) > 1 else lambda args: (args[key_idx[0]],)
+            if key_generator is not None:
+                return lambda args, kwargs=None: key_generator(*values(args))
+            return lambda args, kwargs=None: values(args)
+
+        index = self.key_idx
+        if key_generator is not None:
+            return lambda args, kwargs=None: key_generator(args[index])
+        return lambda args, kwargs=None: args[index]
+
+    def _compile_keyword_key(self) -> Callable[[tuple[Any, ...], Optional[dict[str, Any]]], Any]:
+        key_generator = self.key_generator
+        key_names = tuple(self.key_names)
+
+        def missing(kwargs: Optional[dict[str, Any]]) -> TypeError:
+            missing_keys = set(key_names) - (kwargs or {}).keys()
+            return TypeError(
+                f"Missing required keyword arguments: {missing_keys}. "
+                f"Arguments used for dispatching must be passed as keyword arguments."
+            )
+
+        if key_generator is not None:
+
+            def key(args: tuple[Any, ...], kwargs: Optional[dict[str, Any]]) -> Any:
+                try:
+                    return key_generator(**{name: kwargs[name] for name in key_names})
+                except (KeyError, TypeError):
+                    if kwargs and all(name in kwargs for name in key_names):
+                        raise  # raised by the key generator
+                    raise missing(kwargs) from None
+
+            return key
+
+        def key(args: tuple[Any, ...], kwargs: Optional[dict[str, Any]]) -> Any:
+            try:
+                return tuple([kwargs[name] for name in key_names])
+            except (KeyError, TypeError):
+                raise missing(kwargs) from None
+
+        return key
+
+    def _register_by_type(self, cls: Any, func: Optional[Callable[..., T]] = None) -> Callable[..., T]:
+        functions = self._functions
+        registered = dict(functions.registry)
+        func = functions.register(cls, func)
+        for key, function in functions.registry.items():
+            if key is not object and registered.get(key) is not function:  # e.g. the classes of a Union
+                self.registry[key] = function
+                self.batch_registry.pop(key, None)  # it would bypass the new function
+                self._batch_functions.register(key, _unregistered)
+        return func
 
     def _set_fallback(self, fallback: Callable[..., T]) -> Dispatcher:
         self.fallback = fallback
         self.__doc__ = fallback.__doc__
         self.__name__ = fallback.__name__
+        self._functions.register(object, fallback)
         return self
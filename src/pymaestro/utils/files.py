@@ -0,0 +1,37 @@
+# src/pymaestro/utils/files.py
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Iterator
+
+__all__ = ["atomic_write", "atomic_open"]
+
+
+@contextlib.contextmanager
+def atomic_open(path: str | Path, mode: str = "wb", **options) -> Iterator[IO]:
+    """
+    Open a temporary file in the directory of `path`, which is renamed over `path` when the block exits
+    without error and removed otherwise, so that readers never see a partially written file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, **options) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write(path: str | Path, *chunks: bytes) -> None:
+    """
+    Write `chunks` to `path` so that concurrent readers see either the old or the new file, never a partial one.
+
+    The data is written to a temporary file in the same directory, which is then renamed over `path`.
+    """
+    with atomic_open(path) as f:
+        for chunk in chunks:
+            f.write(chunk)
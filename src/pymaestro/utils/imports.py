@@ -0,0 +1,84 @@
+# src/pymaestro/utils/imports.py
+"""
+Resolution of the import paths of job executables, shared by all jobs of a process.
+
+Resolved executables are cached by import path, so that 5k jobs calling functions of the
+same module look the module up once. Within `lazy_executables()`, jobs only check that the
+top-level package of an import path exists, which does not import anything, and import the
+executable when they first run:
+
+    with lazy_executables():
+        maestro.deserialize("registry.json")  # no job dependency is imported
+"""
+
+import contextlib
+import contextvars
+import importlib
+import importlib.util
+from typing import Any, Iterator
+
+__all__ = ["lazy_executables", "is_lazy", "resolve_import_path", "split_import_path", "check_package"]
+
+_lazy: contextvars.ContextVar[bool] = contextvars.ContextVar("pymaestro_lazy_executables", default=False)
+
+_resolved: dict[str, Any] = {}
+_found_packages: set[str] = set()
+
+
+@contextlib.contextmanager
+def lazy_executables(enabled: bool = True) -> Iterator[None]:
+    """Within the block, jobs given import paths resolve them on first execution instead of when created."""
+    token = _lazy.set(enabled)
+    try:
+        yield
+    finally:
+        _lazy.reset(token)
+
+
+def is_lazy() -> bool:
+    """Whether jobs created now resolve their executables lazily by default."""
+    return _lazy.get()
+
+
+def split_import_path(import_path: str) -> tuple[str, str]:
+    """Split '<package>.<module>.<name>' into the module path and the name."""
+    try:
+        module_path, name = import_path.rsplit(".", 1)
+    except ValueError as e:
+        raise ValueError(
+            f"Invalid value for 'executable': {import_path!r}."
+            f"When passing a string, it must be in the format: "
+            f"'<package>.<module>.<function>',"
+            f" e.g. 'my_package.mysubpackage.myscript.myfunction'."
+        ) from e
+
+    return module_path, name
+
+
+def resolve_import_path(import_path: str) -> Any:
+    """Import and return the object at `import_path`. Each import path is resolved once per process."""
+    try:
+        return _resolved[import_path]
+    except KeyError:
+        pass
+
+    module_path, name = split_import_path(import_path)
+    if importlib.util.find_spec(module_path) is None:
+        raise ModuleNotFoundError(f"Module '{module_path}' not found")
+
+    resolved = _resolved[import_path] = getattr(importlib.import_module(module_path), name)
+    return resolved
+
+
+def check_package(module_path: str) -> None:
+    """
+    Raise ModuleNotFoundError if the top-level package of `module_path` cannot be found, without importing it.
+    """
+    package = module_path.partition(".")[0]
+    if package in _found_packages:
+        return
+
+    if importlib.util.find_spec(package) is None:
+        raise ModuleNotFoundError(f"Module '{module_path}' not found")
+
+    _found_packages.add(package)
@@ -0,0 +1,63 @@
+# src/pymaestro/utils/registry_codec.py
+"""
+Stream a JobRegistry to and from a JSON Lines file, one job per line.
+
+The first line of the file is a header, and every following line is one job, in the compact
+form of `serialize`. Writing encodes one job at a time, and reading decodes one line at a time,
+so that registries of millions of jobs are saved and loaded without holding the whole document
+in memory next to the jobs.
+"""
+
+import json
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from ..job_registry import JobRegistry
+from ..jobs import Job
+from .deserialize import decode_object
+from .files import atomic_open
+from .imports import lazy_executables
+from .serialize import serialize
+
+__all__ = ["dump_registry", "iter_registry", "load_registry", "is_registry_stream"]
+
+HEADER = {"type": "JobRegistry", "format": "jsonl", "version": 1}
+
+_SEPARATORS = (",", ":")
+_HEADER_LINE = json.dumps(HEADER, separators=_SEPARATORS)
+_HEADER_PREFIX = _HEADER_LINE.split(',"version"')[0]
+
+
+def dump_registry(jobs: Iterable[Job], path: str | Path) -> Path:
+    """Write `jobs` to `path`, one per line. The file is replaced atomically once every job is written."""
+    encoder = json.JSONEncoder(default=serialize, separators=_SEPARATORS)
+    with atomic_open(path, "w", encoding="utf-8") as f:
+        f.write(_HEADER_LINE + "\n")
+        for job in jobs:
+            f.write(encoder.encode(job) + "\n")
+
+    return Path(path)
+
+
+def iter_registry(path: str | Path) -> Iterator[Job]:
+    """Yield the jobs of a file written by `dump_registry`, decoding one line at a time."""
+    decoder = json.JSONDecoder(object_hook=decode_object)
+    with open(path, "r", encoding="utf-8") as f:
+        if not f.readline().startswith(_HEADER_PREFIX):
+            raise ValueError(f"'{path}' is not a registry written by 'dump_registry'")
+
+        for line in f:
+            if line.strip():
+                yield decoder.decode(line)
+
+
+def load_registry(path: str | Path, lazy: bool = False) -> JobRegistry:
+    """Build a JobRegistry from a file written by `dump_registry`. See `Maestro.deserialize` for `lazy`."""
+    with lazy_executables(lazy):
+        return JobRegistry(iter_registry(path))
+
+
+def is_registry_stream(path: str | Path) -> bool:
+    """Whether `path` was written by `dump_registry`, by reading its first bytes only."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read(len(_HEADER_PREFIX)) == _HEADER_PREFIX
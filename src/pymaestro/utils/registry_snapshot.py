@@ -0,0 +1,192 @@
+# src/pymaestro/utils/registry_snapshot.py
+"""
+Save a JobRegistry to a binary snapshot, and load it through `mmap` without decoding its jobs.
+
+A snapshot is laid out as:
+
+    header | job records | payloads | string table
+
+Every job has a fixed-width record holding its type, flags, `max_concurrency`, the offset of its
+payload and the ids of its name, executable, parallel group and executor in the string table. The
+payload is the compact JSON of the job's remaining fields (`args`, `kwargs`, `outputs`), and is
+left empty when they are empty, as for most jobs.
+
+Loading a snapshot decodes the string table and reads the records only, which is enough to index
+the jobs by name and parallel group. A job is built from its record when the registry first
+touches it (see `PendingJob`), e.g. by `grouped_jobs` or `Maestro.execute()`.
+"""
+
+import json
+import mmap
+import struct
+from pathlib import Path
+from types import FunctionType
+from typing import Any, Iterable, Iterator
+
+from ..job_registry import JobRegistry, PendingJob
+from ..jobs import Job
+from .deserialize import decode_object, deserialize
+from .files import atomic_open
+from .imports import lazy_executables
+from .serialize import serialize
+
+__all__ = ["RegistrySnapshot", "dump_snapshot", "load_snapshot", "is_registry_snapshot"]
+
+MAGIC = b"MAESTRO\x01"
+VERSION = 1
+
+# magic, version, reserved, number of jobs, offset and size of the string table, offset of the payloads
+_HEADER = struct.Struct("<8sHHIQQQ")
+# type, flags, reserved, name, executable, parallel group, executor, max_concurrency, payload offset and size
+_RECORD = struct.Struct("<BBHIIIIiQI")
+
+_JOB_TYPES = ("callable", "async_callable", "script")
+_ISOLATED = 0x1
+_NONE = 0xFFFFFFFF  # the string id of a missing value
+_FIELDS = ("type", "name", "executable", "parallel_group", "executor", "isolated", "max_concurrency")
+
+
+def dump_snapshot(jobs: Iterable[Job], path: str | Path) -> Path:
+    """Write `jobs` to a binary snapshot at `path`. The file is replaced atomically once every job is written."""
+    encoder = json.JSONEncoder(default=serialize, separators=(",", ":"))
+    string_ids: dict[str, int] = {}
+
+    def string_id(value: str | None) -> int:
+        if value is None:
+            return _NONE
+        elif "\0" in value:
+            raise ValueError(f"Strings of a registry snapshot must not contain NUL characters, got {value!r}")
+
+        return string_ids.setdefault(value, len(string_ids))
+
+    records = bytearray()
+    payloads = bytearray()
+    for job in jobs:
+        fields = serialize(job)
+        payload = {key: value for key, value in fields.items() if key not in _FIELDS and not _is_default(key, value)}
+        encoded_payload = encoder.encode(payload).encode("utf-8") if payload else b""
+        records += _RECORD.pack(
+            _JOB_TYPES.index(fields["type"]),
+            _ISOLATED if fields.get("isolated") else 0,
+            0,
+            string_id(fields["name"]),
+            string_id(_import_path(fields["executable"])),
+            string_id(fields["parallel_group"]),
+            string_id(fields["executor"]),
+            -1 if fields.get("max_concurrency") is None else fields["max_concurrency"],
+            len(payloads),
+            len(encoded_payload),
+        )
+        payloads += encoded_payload
+
+    strings = "\0".join(string_ids).encode("utf-8")
+    payloads_offset = _HEADER.size + len(records)
+    strings_offset = payloads_offset + len(payloads)
+    header = _HEADER.pack(
+        MAGIC, VERSION, 0, len(records) // _RECORD.size, strings_offset, len(strings), payloads_offset
+    )
+    with atomic_open(path, "wb") as f:
+        f.write(header)
+        f.write(records)
+        f.write(payloads)
+        f.write(strings)
+
+    return Path(path)
+
+
+def _is_default(key: str, value: Any) -> bool:
+    return value is None or (key in ("args", "kwargs") and not value)
+
+
+def _import_path(executable: Any) -> str:
+    # Scripts and lazy callables are serialized as strings, and resolved callables as their import path
+    if isinstance(executable, FunctionType):
+        executable = serialize(executable)["value"]
+    if not isinstance(executable, str):
+        raise TypeError(f"Only functions and scripts can be written to a registry snapshot, got {executable!r}")
+
+    return executable
+
+
+class RegistrySnapshot:
+    """
+    The jobs of a snapshot written by `dump_snapshot`, memory-mapped and built one at a time.
+
+    Attributes:
+        path (Path): The snapshot file.
+        lazy (bool): Whether the jobs built from the snapshot import their executables on first execution.
+        strings (list[str]): The string table of the snapshot.
+    """
+
+    def __init__(self, path: str | Path, lazy: bool = False) -> None:
+        self.path = Path(path)
+        self.lazy = lazy
+        with open(self.path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._buffer[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"'{path}' is not a registry snapshot written by 'dump_snapshot'")
+
+        _, version, _, self._count, strings_offset, strings_size, self._payloads_offset = _HEADER.unpack_from(
+            self._buffer
+        )
+        if version != VERSION:
+            raise ValueError(f"Unsupported registry snapshot version {version} in '{path}'")
+
+        strings = self._buffer[strings_offset : strings_offset + strings_size]
+        self.strings = strings.decode("utf-8").split("\0") if self._count else []
+        self._decoder = json.JSONDecoder(object_hook=decode_object)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def pending_jobs(self) -> Iterator[PendingJob]:
+        """Yield a `PendingJob` for every record, in order, without building the jobs."""
+        strings = self.strings
+        end = _HEADER.size + self._count * _RECORD.size
+        with memoryview(self._buffer)[_HEADER.size : end] as records:
+            for position, (_, _, _, name, _, parallel_group, *_) in enumerate(_RECORD.iter_unpack(records)):
+                yield PendingJob(
+                    strings[name], None if parallel_group == _NONE else strings[parallel_group], self, position
+                )
+
+    def load_job(self, position: int) -> Job:
+        """Build the job of the record at `position`."""
+        job_type, flags, _, name, executable, parallel_group, executor, max_concurrency, offset, size = (
+            _RECORD.unpack_from(self._buffer, _HEADER.size + position * _RECORD.size)
+        )
+        strings = self.strings
+        job_type = _JOB_TYPES[job_type]
+        with lazy_executables(self.lazy):
+            fields = {
+                "type": job_type,
+                "name": strings[name],
+                "executable": strings[executable],
+                "parallel_group": None if parallel_group == _NONE else strings[parallel_group],
+                "executor": None if executor == _NONE else strings[executor],
+            }
+            if job_type != "script":
+                fields["executable"] = deserialize({"type": "function", "value": fields["executable"]})
+            else:
+                fields["isolated"] = bool(flags & _ISOLATED)
+            if job_type != "callable":
+                fields["max_concurrency"] = None if max_concurrency < 0 else max_concurrency
+            if size:
+                start = self._payloads_offset + offset
+                fields.update(self._decoder.decode(self._buffer[start : start + size].decode("utf-8")))
+
+            return deserialize(fields)
+
+
+def load_snapshot(path: str | Path, lazy: bool = False) -> JobRegistry:
+    """
+    Build a JobRegistry from a snapshot written by `dump_snapshot`, indexed by the names and parallel
+    groups of its jobs, whose jobs are built on first access. See `Maestro.deserialize` for `lazy`.
+    """
+    return JobRegistry.from_pending(RegistrySnapshot(path, lazy).pending_jobs())
+
+
+def is_registry_snapshot(path: str | Path) -> bool:
+    """Whether `path` was written by `dump_snapshot`, by reading its first bytes only."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
@@ -2,22 +2,22 @@
 import json
 from collections.abc import Iterable
 from datetime import date, datetime
-from functools import singledispatch
 from inspect import iscoroutinefunction
 from pathlib import Path
 from types import FunctionType
 from typing import Any
 
-from ..jobs import CallableJob, JobPool, ScriptJob
-from .wrappers import DependsOn, Resource
+from ..jobs import AsyncCallableJob, CallableJob, JobPool, ScriptJob
+from .dispatcher import Dispatcher
+from .wrappers import Broadcast, DependsOn, Resource
 
 __all__ = ["serialize"]
 # ---------------------------------------------------------------------------
-#  Serialization — singledispatch-based JSON encoding
+#  Serialization — JSON encoding dispatched on the class of the object
 # ---------------------------------------------------------------------------
 
 
-@singledispatch
+@Dispatcher(by_type=True)
 def serialize(obj: Any) -> Any:
     return json.dumps(obj)
 
@@ -54,19 +54,39 @@ def serialize_function(obj: FunctionType) -> dict[str, str]:
 
 @serialize.register(ScriptJob)
 def serialize_script_job(obj: ScriptJob) -> dict[str, Any]:
-    return {"type": "script", "name": obj.name, "executable": obj.executable, "parallel_group": obj.parallel_group}
+    return {
+        "type": "script",
+        "name": obj.name,
+        "executable": obj.executable,
+        "parallel_group": obj.parallel_group,
+        "executor": obj.executor,
+        "isolated": obj.isolated,
+        "max_concurrency": obj.max_concurrency,
+        "outputs": obj.outputs,
+    }
 
 
 @serialize.register(CallableJob)
 def serialize_callable_job(obj: CallableJob) -> dict[str, Any]:
-    return {
-        "type": "async_callable" if iscoroutinefunction(obj.executable) else "callable",
+    # Lazy jobs are serialized without importing their executable
+    if obj.is_resolved:
+        is_async, executable = iscoroutinefunction(obj.executable), obj.executable
+    else:
+        is_async, executable = isinstance(obj, AsyncCallableJob), obj.import_path
+
+    serialized = {
+        "type": "async_callable" if is_async else "callable",
         "name": obj.name,
-        "executable": obj.executable,  # by default handle case where executable is function
+        "executable": executable,  # by default handle case where executable is function
         "parallel_group": obj.parallel_group,
         "args": obj.args,
         "kwargs": obj.kwargs,
+        "executor": obj.executor,
     }
+    if isinstance(obj, AsyncCallableJob):
+        serialized["max_concurrency"] = obj.max_concurrency
+
+    return serialized
 
 
 @serialize.register(DependsOn)
@@ -81,4 +101,14 @@ def serialize_resource(dep: Resource):
         "generator_fn": dep.generator_fn,
         "generator_args": dep.generator_args,
         "generator_kwargs": dep.generator_kwargs,
+        "scope": dep.scope,
+    }
+
+
+@serialize.register(Broadcast)
+def serialize_broadcast(obj: Broadcast):
+    return {
+        "type": "Broadcast",
+        "value": obj.value,
+        "directory": str(obj.directory) if obj.directory else None,
     }
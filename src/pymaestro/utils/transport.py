@@ -0,0 +1,232 @@
+# src/pymaestro/utils/transport.py
+"""
+Transfer of large results from pool workers to the parent process through shared memory.
+
+By default, a worker's result is pickled, copied through the executor's pipe and
+unpickled in the parent. `SharedMemoryTransport` instead pickles the result with
+protocol 5 and moves every large out-of-band buffer (bytes-like results, numpy arrays
+and other objects implementing `__reduce_ex__(5)`) into a memory-mapped segment.
+Only the small pickle stream and the segment names travel through the pipe, and the
+parent maps the segments and unpickles views on them, without copying the data.
+
+Segments are files in `/dev/shm` (POSIX shared memory, the same storage used by
+`multiprocessing.shared_memory`) when it exists, or spill files in the temporary
+directory otherwise. The parent unlinks a segment as soon as it is mapped, so that its
+memory is released when the last view of the result is garbage collected, and discards
+the segments of results it does not decode (see `SharedMemoryTransport.discard`).
+
+A large `bytes` or `bytearray` result is moved to a segment as well, and received as a
+read-only `memoryview` on it, so its type depends on its size. With `copy_bytes=True`, it
+is copied back to its own type instead: it still does not go through the pipe, but the
+parent holds a full copy of it once the segment is released.
+
+`dump_segment` and `load_segment` go the other way, for values that the parent shares
+with many workers (see `Broadcast`): the value is pickled once into a single file, named
+after the digest of its content, and every worker that loads it unpickles views on the
+same mapped pages.
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import uuid
+import weakref
+from pathlib import Path
+from typing import Any
+
+from .files import atomic_write
+
+__all__ = [
+    "SharedMemoryTransport",
+    "EncodedResult",
+    "dump_segment",
+    "load_segment",
+    "segment_digest",
+    "default_segment_dir",
+]
+
+_SHARED_MEMORY_DIR = Path("/dev/shm")
+
+# A segment file starts with the size of the pickle stream and the number of out-of-band buffers,
+# followed by the size of each buffer. The stream and the buffers follow, each aligned for vectorized reads.
+_SEGMENT_HEADER = struct.Struct("<QQ")
+_SEGMENT_ALIGNMENT = 64
+
+
+def default_segment_dir() -> Path:
+    """Return `/dev/shm` when it exists, otherwise the temporary directory."""
+    return _SHARED_MEMORY_DIR if _SHARED_MEMORY_DIR.is_dir() else Path(tempfile.gettempdir())
+
+
+def dump_segment(value: Any, directory: str | Path | None = None) -> tuple[str, str]:
+    """
+    Pickle `value` with protocol 5 into a segment file named after the digest of its content.
+
+    Equal values share one file, which is only written if it does not exist yet.
+
+    Returns:
+        tuple[str, str]: The path of the segment and the digest of its content.
+    """
+    payload, views, digest = _pickle_segment(value)
+    path = Path(directory or default_segment_dir()) / f"pymaestro-broadcast-{digest}"
+    if not path.exists():
+        chunks = [_SEGMENT_HEADER.pack(len(payload), len(views)), struct.pack(f"<{len(views)}Q", *map(len, views))]
+        offset = sum(map(len, chunks))
+        for chunk in (payload, *views):
+            padding = -offset % _SEGMENT_ALIGNMENT
+            chunks.extend((bytes(padding), chunk))
+            offset += padding + len(chunk)
+        atomic_write(path, *chunks)
+
+    return str(path), digest
+
+
+def segment_digest(value: Any) -> str:
+    """Return the digest of the segment `dump_segment` would write for `value`, without writing it."""
+    return _pickle_segment(value)[2]
+
+
+def _pickle_segment(value: Any) -> tuple[bytes, list[memoryview], str]:
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    views = [buffer.raw() for buffer in buffers]
+
+    digest = hashlib.sha256(payload)
+    for view in views:
+        digest.update(view)
+
+    return payload, views, digest.hexdigest()
+
+
+def load_segment(path: str | Path) -> Any:
+    """Unpickle the value of a segment written by `dump_segment`, with views on the mapped file."""
+    with open(path, "rb") as f:
+        segment = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(segment)
+    payload_size, count = _SEGMENT_HEADER.unpack_from(view)
+    sizes = struct.unpack_from(f"<{count}Q", view, _SEGMENT_HEADER.size)
+
+    chunks = []
+    offset = _SEGMENT_HEADER.size + 8 * count
+    for size in (payload_size, *sizes):
+        offset += -offset % _SEGMENT_ALIGNMENT
+        chunks.append(view[offset : offset + size])
+        offset += size
+
+    return pickle.loads(chunks[0], buffers=chunks[1:])
+
+
+class EncodedResult:
+    """
+    A result encoded by a worker: a pickle stream and its out-of-band buffers.
+
+    Attributes:
+        payload (bytes): The protocol 5 pickle stream.
+        buffers (list[bytes | tuple[str, int]]): Small buffers inline, large ones as `(segment path, size)`.
+        result_type (type | None): `bytes` or `bytearray` when the result is one, pickled out-of-band.
+    """
+
+    __slots__ = ("payload", "buffers", "result_type")
+
+    def __init__(self, payload: bytes, buffers: list[bytes | tuple[str, int]], result_type: type | None = None) -> None:
+        self.payload = payload
+        self.buffers = buffers
+        self.result_type = result_type
+
+    def __reduce__(self):
+        return self.__class__, (self.payload, self.buffers, self.result_type)
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes sent through the executor's pipe."""
+        return len(self.payload) + sum(len(buffer) for buffer in self.buffers if isinstance(buffer, bytes))
+
+
+class SharedMemoryTransport:
+    """
+    Encode results in pool workers and decode them in the parent process without copying large buffers.
+
+    Attributes:
+        threshold (int): Buffers of at least this many bytes are moved to a segment; smaller ones
+            are sent inline through the pipe. Defaults to 1 MiB.
+        directory (Path | None): Where segments are created. Defaults to `/dev/shm` when it exists,
+            otherwise the temporary directory (memory-mapped spill files).
+        copy_bytes (bool): Whether `bytes` and `bytearray` results moved to a segment are copied back
+            to their type. By default, they are received as read-only memoryviews on the segment.
+    """
+
+    def __init__(self, threshold: int = 1 << 20, directory: str | Path | None = None, copy_bytes: bool = False) -> None:
+        self.threshold = threshold
+        self.directory = Path(directory) if directory else None
+        self.copy_bytes = copy_bytes
+
+    @property
+    def segment_dir(self) -> Path:
+        if self.directory is not None:
+            return self.directory
+
+        return default_segment_dir()
+
+    def encode(self, result: Any) -> EncodedResult:
+        """Pickle `result`, moving its large buffers to segments. Runs in the worker."""
+        # Top-level bytes-like results are pickled in-band unless they are wrapped in a PickleBuffer.
+        # Wrapped, they are decoded as a read-only memoryview on the segment (see `copy_bytes`).
+        result_type = None
+        if isinstance(result, (bytes, bytearray, memoryview)) and memoryview(result).contiguous:
+            result_type = None if isinstance(result, memoryview) else type(result)
+            result = pickle.PickleBuffer(result)
+
+        buffers: list[bytes | tuple[str, int]] = []
+
+        def move_buffer(buffer: pickle.PickleBuffer) -> None:
+            with buffer.raw() as view:
+                if view.nbytes and view.nbytes >= self.threshold:
+                    buffers.append(self._write_segment(view))
+                else:
+                    buffers.append(bytes(view))
+
+        payload = pickle.dumps(result, protocol=5, buffer_callback=move_buffer)
+        return EncodedResult(payload, buffers, result_type)
+
+    def decode(self, encoded: EncodedResult) -> Any:
+        """Unpickle `encoded` with views on its segments. Runs in the parent process."""
+        buffers = [buffer if isinstance(buffer, bytes) else self._map_segment(*buffer) for buffer in encoded.buffers]
+        result = pickle.loads(encoded.payload, buffers=buffers)
+        if encoded.result_type is not None and not isinstance(result, encoded.result_type):
+            if self.copy_bytes or not isinstance(result, memoryview):  # sent inline, or copied on request
+                return encoded.result_type(result)
+
+        return result
+
+    @staticmethod
+    def discard(encoded: EncodedResult) -> None:
+        """Remove the segments of `encoded` without decoding it, e.g. when its job pool is not consumed."""
+        for buffer in encoded.buffers:
+            if not isinstance(buffer, bytes):
+                Path(buffer[0]).unlink(missing_ok=True)
+
+    def _write_segment(self, view: memoryview) -> tuple[str, int]:
+        path = self.segment_dir / f"pymaestro-{os.getpid()}-{uuid.uuid4().hex}"
+        with open(path, "wb") as f:
+            f.write(view)
+
+        return str(path), view.nbytes
+
+    @staticmethod
+    def _map_segment(path: str, size: int) -> memoryview:
+        with open(path, "rb") as f:
+            segment = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+
+        try:
+            os.unlink(path)  # the mapping stays valid until the last view of it is released
+        except PermissionError:  # Windows does not delete mapped files
+            weakref.finalize(segment, os.unlink, path)
+
+        return memoryview(segment)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(threshold={self.threshold!r}, directory={self.directory!r})"
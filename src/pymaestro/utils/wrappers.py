@@ -1,10 +1,34 @@
 # src/pymaestro/utils/wrappers.py
+import functools
 import inspect
+import os
+import threading
 import warnings
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
 
 import wrapt
 
-__all__ = ["DependsOn", "Resource", "is_completed", "inject_dependencies"]
+from ..tracing import span
+from .transport import dump_segment, load_segment, segment_digest
+
+__all__ = [
+    "DependsOn",
+    "Resource",
+    "Broadcast",
+    "is_completed",
+    "inject_dependencies",
+    "cached",
+    "compile_execute",
+    "injected_positions",
+    "ResourceScope",
+    "RESOURCE_SCOPES",
+    "worker_scope",
+    "initialize_worker",
+]
+
+RESOURCE_SCOPES = ("job", "run", "group", "worker")
 
 
 class DependsOn:
@@ -16,24 +40,286 @@ class DependsOn:
 
 
 class Resource:
-    def __init__(self, generator_fn, generator_args=None, generator_kwargs=None):
+    """
+    An argument of a job set up by a generator function, which yields the value passed to the job.
+
+    The `scope` decides how long the value lives, and which jobs share it:
+        - "job" (default): the generator is entered for every execution of a job and closed right after.
+        - "run": entered once per `Maestro.execute()`, shared by all its jobs, and closed when the run ends.
+        - "group": entered once per parallel group (or single job), and closed when the group finishes.
+        - "worker": entered once per process, when a process pool worker starts (see `initialize_worker`),
+          and closed when the process exits.
+
+    Resources with the same generator function and arguments share one value within a scope. A live value
+    cannot cross a process boundary, and a pool worker cannot tell when a run or a group ends, so the jobs
+    of process pools reject "run" and "group" resources. Jobs executed outside of Maestro enter them in
+    the scope of their process.
+    Within a scope, the values are closed in the reverse order of their creation.
+    """
+
+    def __init__(self, generator_fn, generator_args=None, generator_kwargs=None, scope="job"):
         if not inspect.isgeneratorfunction(generator_fn):
             raise TypeError("'generator_fn' must be a generator function")
+        if scope not in RESOURCE_SCOPES:
+            raise ValueError(f"Invalid 'scope': {scope}. Must be one of {RESOURCE_SCOPES}")
 
         self.generator_fn = generator_fn
         self.generator_args = generator_args or ()
         self.generator_kwargs = generator_kwargs or {}
+        self.scope = scope
+
+    @property
+    def key(self):
+        """What identifies the value of the resource within a scope: its generator function and arguments."""
+        key = (self.generator_fn, tuple(self.generator_args), tuple(sorted(self.generator_kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:  # unhashable arguments: the value is shared by the jobs holding this very Resource
+            return id(self)
+
+        return key
+
+
+class ResourceScope:
+    """
+    The values of the Resources entered within one scope (a run, a parallel group or a process), shared
+    by its jobs. Closing the scope closes their generators, the last entered first.
+
+    Attributes:
+        name (str): The scope, one of `RESOURCE_SCOPES`.
+        pid (int): The process the scope belongs to.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.pid = os.getpid()
+        self._values = {}  # key -> (resource, value), so that the id of a keyed Resource cannot be reused
+        self._generators = []
+        self._lock = threading.RLock()
+
+    def enter(self, resource):
+        """Return the value of `resource`, setting it up on its first use in the scope."""
+        key = resource.key
+        with self._lock:
+            if key not in self._values:
+                qualname = resource.generator_fn.__qualname__
+                with span("resource.setup", "resource", generator=qualname, scope=self.name):
+                    generator = resource.generator_fn(*resource.generator_args, **resource.generator_kwargs)
+                    value = next(generator)
+                self._generators.append(generator)
+                self._values[key] = resource, value
+
+            return self._values[key][1]
+
+    def close(self):
+        """Close the generators of the scope in reverse order. Later uses of the scope enter them again."""
+        with self._lock:
+            generators, self._generators = self._generators, []
+            self._values.clear()
+
+        for generator in reversed(generators):
+            with span("resource.teardown", "resource", generator=generator.__qualname__, scope=self.name):
+                generator.close()
+
+    def __len__(self):
+        return len(self._values)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_worker_scope = None
+_worker_scope_lock = threading.Lock()
+
+
+def worker_scope():
+    """
+    Return the scope of the resources of this process, closed when the process exits.
+
+    A process forked from another one, e.g. a pool worker, starts with a scope of its own.
+    """
+    global _worker_scope
+    with _worker_scope_lock:
+        if _worker_scope is None or _worker_scope.pid != os.getpid():
+            from multiprocessing.util import Finalize
+
+            _worker_scope = ResourceScope("worker")
+            # Run by process pool workers when they exit, and by the main process at exit
+            Finalize(None, _worker_scope.close, exitpriority=10)
+
+        return _worker_scope
+
+
+def initialize_worker(resources=()):
+    """The initializer of process pool workers: set up the worker-scoped `resources` once per worker."""
+    scope = worker_scope()
+    for resource in resources:
+        scope.enter(resource)
+
+
+def _scope_of(instance, resource):
+    # The scopes of the run and of the parallel group are attached to the jobs by Maestro
+    scopes = getattr(instance, "resource_scopes", None)
+    if scopes and resource.scope != "worker" and scopes.get(resource.scope) is not None:
+        return scopes[resource.scope]
+
+    return worker_scope()
+
+
+_UNSET = object()
+
+# The values of the broadcasts loaded by this process, with the path of their segment, by digest, kept for
+# every job it runs until the segment is released by the process that shared it
+_materialized: dict[str, tuple[str, object]] = {}
+# The broadcasts owning a segment in this process, by digest, and how many owners share each segment file
+_owners: "weakref.WeakValueDictionary[str, Broadcast]" = weakref.WeakValueDictionary()
+_segment_owners: dict[str, int] = {}
+_segments_lock = threading.Lock()
+
+
+class Broadcast:
+    """
+    A large argument shared by many jobs, sent to each pool worker only once.
+
+    Pickling a Broadcast, e.g. when a job is submitted to a process pool, writes its value once
+    to a memory-mapped segment (in `/dev/shm` when it exists) and pickles only the segment's path.
+    Each worker loads the value the first time one of its jobs uses it, and keeps it for the next
+    jobs. Like a `Resource`, a Broadcast is replaced by its value when the job executes.
+
+    The segment is written when the Broadcast is first pickled, i.e. when a job is submitted to a
+    process pool, and removed when the Broadcast that wrote it is garbage collected, or at exit.
+    A worker drops the values it loaded once their segments are removed.
+    """
+
+    def __init__(self, value, directory=None):
+        self._value = value
+        self.directory = Path(directory) if directory else None
+        self._segment = None  # (path, digest), once the value is shared
+        self._digest = None
+        self._lock = threading.Lock()
+
+    @property
+    def value(self):
+        if self._value is _UNSET:
+            path, digest = self._segment
+            if digest not in _materialized:
+                try:
+                    _materialized[digest] = path, load_segment(path)
+                except FileNotFoundError:
+                    raise RuntimeError(f"The segment of {self!r} was removed before the value was loaded") from None
+            return _materialized[digest][1]
+
+        return self._value
+
+    @property
+    def digest(self):
+        """The digest of the value, as named by its segment, computed without writing the segment."""
+        if self._segment is not None:
+            return self._segment[1]
+        if self._digest is None:
+            self._digest = segment_digest(self._value)
+
+        return self._digest
+
+    def _share(self):
+        with self._lock:
+            if self._segment is None:
+                path, digest = dump_segment(self._value, self.directory)
+                with _segments_lock:
+                    _owners.setdefault(digest, self)
+                    _segment_owners[path] = _segment_owners.get(path, 0) + 1
+                weakref.finalize(self, _release_segment, path, os.getpid())
+                self._segment = path, digest
+
+        return self._segment
+
+    def __reduce__(self):
+        return _attach, self._share()
+
+    def __repr__(self):
+        return f"Broadcast(segment={self._segment[0] if self._segment else None!r})"
+
+
+def _attach(path, digest):
+    # In the process that shared the value (or in a worker forked from it), reuse the original
+    owner = _owners.get(digest)
+    if owner is not None:
+        return owner
+
+    _evict_released()
+
+    broadcast = Broadcast.__new__(Broadcast)
+    broadcast._value = _UNSET
+    broadcast.directory = None
+    broadcast._segment = path, digest
+    broadcast._digest = digest
+    broadcast._lock = threading.Lock()
+    return broadcast
+
+
+def _evict_released():
+    # Long-lived workers, e.g. of a reused pool, must not keep the values of every past run
+    for digest, (path, _) in list(_materialized.items()):
+        if not os.path.exists(path):
+            del _materialized[digest]
+
+
+def _release_segment(path, owner_pid):
+    if os.getpid() != owner_pid:  # a forked worker must not remove the parent's segments
+        return
+
+    with _segments_lock:
+        _segment_owners[path] -= 1
+        if _segment_owners[path]:
+            return
+        del _segment_owners[path]
+
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+    _evict_released()
+
+
+def injected_positions(args) -> tuple[int, ...]:
+    """The positions of the arguments replaced by their values when a job executes: Resources and Broadcasts."""
+    return tuple(position for position, arg in enumerate(args) if isinstance(arg, (Resource, Broadcast)))
+
+
+def _has_injections(instance) -> bool:
+    # Jobs precompute the positions in `args` when it is assigned (see `CallableJob.args`), while `kwargs`
+    # is checked on every call, as it may be changed in place, e.g. when `DependsOn` markers are resolved
+    positions = getattr(instance, "_injected_args", None)
+    if positions is None:
+        positions = injected_positions(getattr(instance, "args", ()))
+
+    if positions:
+        return True
+
+    kwargs = getattr(instance, "kwargs", None)
+    return bool(kwargs) and any(isinstance(value, (Resource, Broadcast)) for value in kwargs.values())
+
+
+def _warn_completed(instance, stacklevel):
+    warnings.warn(
+        f"'{instance.name}' was called but the job has already been completed.",
+        category=RuntimeWarning,
+        stacklevel=stacklevel,
+    )
 
 
 @wrapt.decorator
 def is_completed(wrapped, instance, args, kwargs):
     if hasattr(instance, "is_completed") and instance.is_completed:
-        warnings.warn(
-            f"'{instance.name}' was called but the job has already been completed.",
-            category=RuntimeWarning,
-            stacklevel=4,
-        )
-        return instance.result
+        _warn_completed(instance, stacklevel=3)
+        return _awaitable(instance.result) if inspect.iscoroutinefunction(wrapped) else instance.result
+
+    if inspect.iscoroutinefunction(wrapped):
+        return _async_complete(wrapped(*args, **kwargs), instance)
 
     output = wrapped(*args, **kwargs)
     instance.is_completed = True
@@ -41,8 +327,133 @@ def is_completed(wrapped, instance, args, kwargs):
     return output
 
 
+async def _awaitable(value):
+    return value
+
+
+async def _async_complete(coroutine, instance):
+    output = await coroutine
+    instance.is_completed = True
+    instance.result = output
+    return output
+
+
+@wrapt.decorator
+def cached(wrapped, instance, args, kwargs):
+    cache = getattr(instance, "cache", None)
+    key = cache.key(instance) if cache is not None else None
+    if key is None:
+        return wrapped(*args, **kwargs)
+
+    if inspect.iscoroutinefunction(wrapped):
+        return _async_cached(wrapped(*args, **kwargs), cache, key)
+
+    hit, output = cache.get(key)
+    if not hit:
+        output = wrapped(*args, **kwargs)
+        cache.put(key, output)
+
+    return output
+
+
+async def _async_cached(coroutine, cache, key):
+    hit, output = cache.get(key)
+    if hit:
+        coroutine.close()  # never awaited
+        return output
+
+    output = await coroutine
+    cache.put(key, output)
+    return output
+
+
 @wrapt.decorator
 def inject_dependencies(wrapped, instance, args, kwargs):
+    if not _has_injections(instance):
+        # Nothing to set up: the arguments are used as they are, without being copied
+        return wrapped(*args, **kwargs)
+
+    if inspect.iscoroutinefunction(wrapped):
+        return _async_inject_dependencies(wrapped, instance, args, kwargs)
+
+    with _injected_dependencies(instance):
+        return wrapped(*args, **kwargs)
+
+
+async def _async_inject_dependencies(wrapped, instance, args, kwargs):
+    # The resources must stay open until the coroutine finishes, not just until it is created
+    with _injected_dependencies(instance):
+        return await wrapped(*args, **kwargs)
+
+
+def compile_execute(execute, cache_results=True, inject=True):
+    """
+    Return `is_completed(cached(inject_dependencies(execute)))` compiled into one plain function.
+
+    It behaves like the three wrapt layers (without `cached` when `cache_results` is False, and without
+    `inject_dependencies` when `inject` is False), but checks
+    once, here, whether `execute` is a coroutine function, and costs a single call. Jobs use it instead
+    of the wrapt layers when their class is defined with `plain_wrappers=True` (see `Job`).
+    """
+    if inspect.iscoroutinefunction(execute):
+        return _compile_async_execute(execute, cache_results, inject)
+
+    @functools.wraps(execute)
+    def wrapper(self, *args, **kwargs):
+        if getattr(self, "is_completed", None):
+            _warn_completed(self, stacklevel=3)
+            return self.result
+
+        cache = getattr(self, "cache", None) if cache_results else None
+        key = cache.key(self) if cache is not None else None
+        hit, output = cache.get(key) if key is not None else (False, None)
+        if not hit:
+            if inject and _has_injections(self):
+                with _injected_dependencies(self):
+                    output = execute(self, *args, **kwargs)
+            else:
+                output = execute(self, *args, **kwargs)
+
+            if key is not None:
+                cache.put(key, output)
+
+        self.is_completed = True
+        self.result = output
+        return output
+
+    return wrapper
+
+
+def _compile_async_execute(execute, cache_results, inject):
+    @functools.wraps(execute)
+    async def wrapper(self, *args, **kwargs):
+        if getattr(self, "is_completed", None):
+            _warn_completed(self, stacklevel=3)
+            return self.result
+
+        cache = getattr(self, "cache", None) if cache_results else None
+        key = cache.key(self) if cache is not None else None
+        hit, output = cache.get(key) if key is not None else (False, None)
+        if not hit:
+            # The resources must stay open until the coroutine finishes, not just until it is created
+            if inject and _has_injections(self):
+                with _injected_dependencies(self):
+                    output = await execute(self, *args, **kwargs)
+            else:
+                output = await execute(self, *args, **kwargs)
+
+            if key is not None:
+                cache.put(key, output)
+
+        self.is_completed = True
+        self.result = output
+        return output
+
+    return wrapper
+
+
+@contextmanager
+def _injected_dependencies(instance):
     active_generators = []
 
     # Normalize args / kwargs
@@ -50,10 +461,15 @@ def inject_dependencies(wrapped, instance, args, kwargs):
     orig_kwargs = dict(getattr(instance, "kwargs", {}))
 
     def resolve(value):
+        if isinstance(value, Broadcast):
+            return value.value
+        if isinstance(value, Resource) and value.scope != "job":
+            return _scope_of(instance, value).enter(value)
         if isinstance(value, Resource):
-            generator = value.generator_fn(*value.generator_args, **value.generator_kwargs)
-            active_generators.append(generator)
-            return next(generator)
+            with span("resource.setup", "resource", generator=value.generator_fn.__qualname__):
+                generator = value.generator_fn(*value.generator_args, **value.generator_kwargs)
+                active_generators.append(generator)
+                return next(generator)
         return value
 
     try:
@@ -63,11 +479,12 @@ def inject_dependencies(wrapped, instance, args, kwargs):
         if hasattr(instance, "kwargs"):
             instance.kwargs = {k: resolve(v) for k, v in orig_kwargs.items()}
 
-        return wrapped(*args, **kwargs)
+        yield
 
     finally:
         for gen in reversed(active_generators):
-            gen.close()
+            with span("resource.teardown", "resource", generator=gen.__qualname__):
+                gen.close()
 
         if hasattr(instance, "args"):
             instance.args = orig_args
@@ -4,6 +4,10 @@ import math
 import os
 import random
 import time
+from typing import Any
+
+# The process that imported this module, to tell preloaded modules from modules imported by a worker
+IMPORTED_IN = os.getpid()
 
 # -------------------------
 # 1. CALLABLE TASKS
@@ -108,3 +112,46 @@ def approximate_pi(iterations: int) -> float:
     for k in range(iterations):
         pi_approx += ((-1) ** k) / (2 * k + 1)
     return 4 * pi_approx
+
+
+def worker_pid(_: int = 0) -> int:
+    """Return the PID of the process that runs the job."""
+    return os.getpid()
+
+
+def large_payload(size: int) -> bytes:
+    """Return `size` bytes, to test the transfer of large results from pool workers."""
+    return bytes(range(256)) * (size // 256)
+
+
+def number_resource(n: int):
+    """A `Resource` generator that provides `n` to a job."""
+    yield n
+
+
+def logged_resource(path: str, name: str):
+    """A `Resource` generator that appends to the file at `path` when it opens and closes `name`, with its PID."""
+    with open(path, "a") as f:
+        f.write(f"open {name} {os.getpid()}\n")
+    try:
+        yield name
+    finally:
+        with open(path, "a") as f:
+            f.write(f"close {name} {os.getpid()}\n")
+
+
+def materialized_broadcasts(table: dict) -> int:
+    """Return how many broadcast values the worker keeps, after loading `table`."""
+    from pymaestro.utils import wrappers
+
+    return len(wrappers._materialized)
+
+
+def imported_before_fork(_: int = 0) -> bool:
+    """Return whether this module was imported by a parent of the worker, e.g. a forkserver preload."""
+    return IMPORTED_IN != os.getpid()
+
+
+def lookup(table: dict, key: str) -> tuple[int, int, Any]:
+    """Return the worker's PID, the identity of `table` in the worker, and the value of `key`."""
+    return os.getpid(), id(table), table[key]
@@ -0,0 +1,8 @@
+import os
+import time
+from pathlib import Path
+
+if __name__ == "__main__":
+    Path(os.environ["PID_FILE"]).write_text(str(os.getpid()))
+    print("x" * 100, flush=True)  # noqa: T201
+    time.sleep(60)
@@ -0,0 +1,7 @@
+import json
+
+numbers = list(range(10))
+__maestro_result__ = sum(number**2 for number in numbers)
+
+if __name__ == "__main__":
+    print(json.dumps({"result": __maestro_result__}))  # noqa: T201
@@ -0,0 +1,46 @@
+# tests/test_benchmarks.py
+import json
+
+from benchmarks import BENCHMARKS, compare, run_benchmarks
+from benchmarks.__main__ import main
+
+
+def test_suite_covers_hot_paths() -> None:
+    names = set(BENCHMARKS)
+    assert {"dispatcher.call", "dispatcher.extract_key.index", "create_job.callable", "execute.wrapped"} <= names
+    assert {f"registry.{bench}[{size}]" for bench in ("append", "grouped_jobs") for size in (1000, 10000, 100000)} <= (
+        names
+    )
+    assert "serialize.round_trip[1000]" in names
+    assert "pool.first_result[process]" in names
+
+
+def test_run_benchmarks_filter() -> None:
+    results = run_benchmarks(r"^dispatcher\.", quick=True)
+    assert set(results["benchmarks"]) == {name for name in BENCHMARKS if name.startswith("dispatcher.")}
+    for result in results["benchmarks"].values():
+        assert result["seconds"] > 0
+        assert result["repeat"] == 1
+
+    json.dumps(results)
+
+
+def test_compare() -> None:
+    baseline = {"benchmarks": {"fast": {"seconds": 1.0}, "slow": {"seconds": 1.0}, "removed": {"seconds": 1.0}}}
+    results = {"benchmarks": {"fast": {"seconds": 1.1}, "slow": {"seconds": 1.5}, "added": {"seconds": 1.0}}}
+    rows = {row["name"]: row for row in compare(results, baseline, threshold=0.25)}
+    assert set(rows) == {"fast", "slow"}
+    assert not rows["fast"]["regressed"]
+    assert rows["slow"]["regressed"]
+    assert rows["slow"]["ratio"] == 1.5
+
+
+def test_main_exit_status(tmp_path) -> None:
+    output = tmp_path / "results.json"
+    assert main(["-k", r"^dispatcher\.call$", "--quick", "-o", str(output)]) == 0
+
+    baseline = json.loads(output.read_text())
+    baseline["benchmarks"]["dispatcher.call"]["seconds"] /= 100
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(baseline))
+    assert main(["-k", r"^dispatcher\.call$", "--quick", "-o", str(output), "-b", str(baseline_path)]) == 1
@@ -0,0 +1,114 @@
+import os
+import time
+
+import pytest
+
+from pymaestro import Maestro
+from pymaestro.cache import ResultCache
+from pymaestro.jobs import create_job
+from tests.helper_scripts.functions import FactorialJob, sum_of_squares
+
+calls = []
+
+
+def record_call(value):
+    calls.append(value)
+    return value * 2
+
+
+@pytest.fixture(scope="function")
+def cache(tmp_path) -> ResultCache:
+    return ResultCache(tmp_path / "cache")
+
+
+def test_key_is_stable_and_depends_on_arguments(cache) -> None:
+    job = create_job("callable", name="a", executable=sum_of_squares, args=(3,))
+    same_job = create_job("callable", name="b", executable=sum_of_squares, args=(3,))
+    other_args = create_job("callable", name="c", executable=sum_of_squares, args=(4,))
+    other_executable = create_job("callable", name="d", executable=FactorialJob(), args=(3,))
+
+    assert cache.key(job) == cache.key(same_job)
+    assert cache.key(job) != cache.key(other_args)
+    assert cache.key(job) != cache.key(other_executable)
+
+
+def test_key_is_none_for_unpicklable_arguments(cache) -> None:
+    job = create_job("callable", name="a", executable=sum_of_squares, args=(lambda: 3,))
+    assert cache.key(job) is None
+
+
+def test_get_and_put(cache) -> None:
+    assert cache.get("key") == (False, None)
+    assert cache.put("key", {"value": 42})
+    assert cache.get("key") == (True, {"value": 42})
+
+
+def test_put_unpicklable_value(cache) -> None:
+    assert not cache.put("key", lambda: 42)
+    assert cache.get("key") == (False, None)
+
+
+def test_expired_entries_are_misses(tmp_path) -> None:
+    cache = ResultCache(tmp_path, ttl=0.05)
+    cache.put("key", 1)
+    assert cache.get("key") == (True, 1)
+    time.sleep(0.1)
+    assert cache.get("key") == (False, None)
+    assert cache.stats()["expired"] == 1
+    assert cache.evict() == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path) -> None:
+    cache = ResultCache(tmp_path)
+    for i, key in enumerate(("old", "recent", "new")):
+        cache.put(key, b"x" * 1000)
+        os.utime(cache._path(key), (i, i))
+
+    cache.get("old")  # a hit makes "old" the most recently used entry
+    cache.max_bytes = 2500
+    assert cache.evict() == 1
+    assert cache.get("recent") == (False, None)
+    assert cache.get("old")[0] and cache.get("new")[0]
+
+
+def test_stats_and_clear(cache) -> None:
+    cache.put("a", 1)
+    cache.put("b", 2)
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] > 0
+    assert cache.clear() == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_maestro_skips_cached_jobs(cache) -> None:
+    maestro = Maestro(cache=cache)
+    maestro.add(record_call, args=(21,))
+    calls.clear()
+
+    assert maestro.execute() == [42]
+    maestro.registry.clear()
+
+    maestro.add(record_call, args=(21,))
+    assert maestro.execute() == [42]
+    assert calls == [21]
+
+    Maestro()  # restore the default options of the singleton
+
+
+def test_maestro_caches_results_of_pool_workers(cache) -> None:
+    maestro = Maestro(cache=cache)
+    for i in range(3):
+        maestro.add(
+            "tests.helper_scripts.functions.sum_of_squares",
+            job_type="callable",
+            name=f"sum_of_squares_{i}",
+            parallel_group="math",
+            args=(i,),
+        )
+
+    assert maestro.execute() == [[0, 1, 5]]
+    assert cache.stats()["entries"] == 3
+
+    Maestro()  # restore the default options of the singleton
@@ -0,0 +1,93 @@
+import pytest
+
+from pymaestro import DependsOn, Maestro
+from pymaestro.checkpoint import CheckpointStore
+
+maestro = Maestro()
+calls = []
+
+
+def record(name, value=None):
+    calls.append(name)
+    return value
+
+
+@pytest.fixture(scope="function")
+def checkpoint(tmp_path) -> CheckpointStore:
+    return CheckpointStore("run", tmp_path)
+
+
+def test_save_and_load(checkpoint) -> None:
+    assert checkpoint.save("job/with:odd name", {"value": 1})
+    assert checkpoint.load() == {"job/with:odd name": {"value": 1}}
+    assert CheckpointStore.runs(checkpoint.directory) == ["run"]
+
+
+def test_save_unpicklable_result(checkpoint) -> None:
+    assert not checkpoint.save("job", lambda: 1)
+    assert checkpoint.load() == {}
+
+
+def test_clear(checkpoint) -> None:
+    checkpoint.save("job", 1)
+    checkpoint.clear()
+    assert checkpoint.load() == {}
+    assert not checkpoint.path.exists()
+
+
+def test_new_run_ids_are_unique(tmp_path) -> None:
+    assert CheckpointStore(directory=tmp_path).run_id != CheckpointStore(directory=tmp_path).run_id
+
+
+def register_pipeline(fail: bool) -> None:
+    @maestro.add(args=("first", 1))
+    def first(name, value):
+        return record(name, value)
+
+    @maestro.add(args=("second", DependsOn("first")))
+    def second(name, value):
+        if fail:
+            raise RuntimeError("interrupted")
+        return record(name, value + 1)
+
+    @maestro.add(args=("third", DependsOn("second")))
+    def third(name, value):
+        return record(name, value + 1)
+
+
+@pytest.mark.parametrize("schedule", ["priority", "graph"])
+def test_resume_skips_completed_jobs(checkpoint, schedule) -> None:
+    calls.clear()
+    register_pipeline(fail=True)
+    with pytest.raises(RuntimeError, match="interrupted"):
+        maestro.execute(schedule=schedule, checkpoint=checkpoint)
+    maestro.registry.clear()
+
+    assert checkpoint.load() == {"first": 1}
+
+    register_pipeline(fail=False)
+    resumed = CheckpointStore(checkpoint.run_id, checkpoint.directory)
+    assert maestro.execute(schedule=schedule, checkpoint=resumed) == [1, 2, 3]
+    assert calls == ["first", "second", "third"]
+    assert checkpoint.load() == {"first": 1, "second": 2, "third": 3}
+    maestro.registry.clear()
+
+
+def test_resume_partially_completed_parallel_group(checkpoint) -> None:
+    for i in range(3):
+        maestro.add(
+            "tests.helper_scripts.functions.sum_of_squares",
+            job_type="callable",
+            name=f"sum_of_squares_{i}",
+            parallel_group="math",
+            args=(i + 1,),
+        )
+    checkpoint.save("sum_of_squares_1", -1)  # a stored result is reused, not recomputed
+
+    assert maestro.execute(checkpoint=checkpoint) == [[1, -1, 14]]
+    assert list(maestro.execute_iter(checkpoint=checkpoint)) == [
+        ("sum_of_squares_0", 1),
+        ("sum_of_squares_1", -1),
+        ("sum_of_squares_2", 14),
+    ]
+    maestro.registry.clear()
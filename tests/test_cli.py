@@ -0,0 +1,87 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pymaestro import IMPORT_TIME_BUDGET_MS
+
+SRC = str(Path(__file__).resolve().parents[1] / "src")
+
+# Modules that only the subcommands running jobs need
+HEAVY_MODULES = ("asyncio", "wrapt", "concurrent.futures", "pymaestro.jobs", "pymaestro.maestro")
+
+
+def import_times(code: str, *argv: str) -> dict[str, int]:
+    """Run `code` with `python -X importtime` and return the cumulative import time of each module, in µs."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *argv],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": SRC},
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+
+    return times
+
+
+@pytest.mark.parametrize("module", ["pymaestro", "pymaestro.cli"])
+def test_import_time_budget(module) -> None:
+    # The best of a few runs, so that a busy machine does not make the test flaky
+    elapsed_ms = min(import_times(f"import {module}")[module] for _ in range(3)) / 1000
+    assert elapsed_ms < IMPORT_TIME_BUDGET_MS
+
+
+def test_import_does_not_load_heavy_modules() -> None:
+    times = import_times("import pymaestro.cli")
+    assert not [module for module in HEAVY_MODULES if module in times]
+
+
+def test_subcommands_only_import_what_they_need(tmp_path) -> None:
+    code = "import sys; from pymaestro.cli import main; sys.argv[0] = 'maestro'; main()"
+    times = import_times(code, "cache", "stats", "-d", str(tmp_path))
+    assert "pymaestro.cache" in times
+    assert not [module for module in HEAVY_MODULES if module in times]
+
+
+def test_public_names_are_imported_on_first_access() -> None:
+    import pymaestro
+
+    assert pymaestro.Maestro.__module__ == "pymaestro.maestro"
+    assert set(pymaestro.__all__) <= set(dir(pymaestro))
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        pymaestro.missing  # noqa: B018
+
+
+def test_journal_keeps_the_registry_across_invocations(tmp_path) -> None:
+    def maestro(*argv: str) -> str:
+        code = "import sys; from pymaestro.cli import main; sys.argv[0] = 'maestro'; main()"
+        env = {"PYTHONPATH": f"{SRC}:{Path(SRC).parent}", "MAESTRO_JOURNAL": str(tmp_path / "registry")}
+        return subprocess.run([sys.executable, "-c", code, *argv], capture_output=True, text=True, env=env).stdout
+
+    executable = "tests.helper_scripts.functions.sum_of_squares"
+    maestro("add", executable, "callable", "-n", "first", "-a", "3")
+    maestro("add", executable, "callable", "-n", "second", "-a", "4")
+    maestro("remove", "first")
+    assert "Job: second\nInsertion Order: 0" in maestro("show", "-n", "second")
+    assert len((tmp_path / "registry" / "journal-0.jsonl").read_text().splitlines()) == 3
+
+
+def test_statsd_address_is_validated(tmp_path) -> None:
+    def execute(address: str) -> subprocess.CompletedProcess:
+        code = "import sys; from pymaestro.cli import main; sys.argv[0] = 'maestro'; main()"
+        env = {"PYTHONPATH": SRC, "MAESTRO_JOURNAL": str(tmp_path / "registry")}
+        argv = ["execute", "--statsd", address]
+        return subprocess.run([sys.executable, "-c", code, *argv], capture_output=True, text=True, env=env)
+
+    assert execute("localhost").returncode == 0  # port 8125
+    assert execute("localhost:8125").returncode == 0
+    failed = execute("localhost:port")
+    assert failed.returncode == 2
+    assert "Invalid port 'port'" in failed.stderr
@@ -0,0 +1,175 @@
+from collections.abc import Collection, Iterable, Sized
+
+import pytest
+
+from pymaestro.utils import Dispatcher
+
+
+def make_dispatcher(**options):
+    @Dispatcher(**options)
+    def dispatch(*args, **kwargs):
+        return "fallback"
+
+    return dispatch
+
+
+def test_dispatch_by_index() -> None:
+    dispatch = make_dispatcher(key_idx=1)
+    dispatch.register("b")(lambda *args: "b")
+    assert dispatch("a", "b") == "b"
+    assert dispatch("b", "a") == "fallback"
+    assert dispatch.extract_key(("a", "b")) == "b"
+
+
+def test_dispatch_by_indexes_and_key_generator() -> None:
+    dispatch = make_dispatcher(key_idx=[0, 2], key_generator=lambda x, y: x + y)
+    dispatch.register(3)(lambda *args: "three")
+    assert dispatch(1, 0, 2) == "three"
+    assert make_dispatcher(key_idx=[1]).extract_key(("a", "b")) == ("b",)
+
+
+def test_dispatch_by_names() -> None:
+    dispatch = make_dispatcher(key_names=["kind"])
+    dispatch.register(("job",))(lambda **kwargs: "job")
+    assert dispatch(kind="job", value=1) == "job"
+    with pytest.raises(TypeError, match="Missing required keyword arguments: {'kind'}"):
+        dispatch(value=1)
+    with pytest.raises(ValueError, match="At least one positional or keyword argument is required"):
+        dispatch()
+
+    generated = make_dispatcher(key_names="kind", key_generator=lambda kind: kind.upper())
+    assert generated.extract_key((), {"kind": "job"}) == "JOB"
+    with pytest.raises(TypeError, match="Missing required keyword arguments"):
+        generated.extract_key((), None)
+
+
+def test_dispatch_by_type_follows_the_mro() -> None:
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    class Items:
+        def __iter__(self):
+            return iter(())
+
+    dispatch = make_dispatcher(by_type=True)
+    dispatch.register(Iterable)(lambda obj: "iterable")
+    dispatch.register(Base)(lambda obj: "base")
+    dispatch.register(list)(lambda obj: "list")
+
+    assert dispatch(Child()) == "base"
+    assert dispatch([]) == "list"
+    assert dispatch(Items()) == "iterable"
+    assert dispatch(1) == "fallback"
+    assert dispatch.get_function(Child)(None) == "base"
+
+    # Registering a function, or a class to an abstract base class, invalidates the resolved classes
+    dispatch.register(Child)(lambda obj: "child")
+    assert dispatch(Child()) == "child"
+    assert dispatch(Base()) == "base"
+
+    class Measured:
+        def __len__(self):
+            return 0
+
+    assert dispatch(Measured()) == "fallback"
+    dispatch.register(Sized)(lambda obj: "sized")
+    assert dispatch(Measured()) == "sized"
+
+    class Virtual:
+        pass
+
+    assert dispatch(Virtual()) == "fallback"
+    Sized.register(Virtual)
+    assert dispatch(Virtual()) == "sized"
+
+
+def test_dispatch_by_type_resolves_like_singledispatch() -> None:
+    class Items:
+        def __iter__(self):
+            return iter(())
+
+        def __len__(self):
+            return 0
+
+        def __contains__(self, item):
+            return False
+
+    dispatch = make_dispatcher(by_type=True)
+    dispatch.register(Iterable)(lambda obj: "iterable")
+    dispatch.register(Collection, lambda obj: "collection")
+
+    # The most specific abstract base class wins, whatever the order of registration
+    assert dispatch(Items()) == "collection"
+    assert dispatch.dispatch(Items)(None) == "collection"
+
+    @dispatch.register
+    def dispatch_number(obj: int | float) -> str:
+        return "number"
+
+    assert dispatch(1) == dispatch(1.5) == "number"
+    assert dispatch.get_registry()[float] is dispatch_number
+    assert dispatch.dispatch(object)(None) == "fallback"
+
+
+def test_dispatcher_binds_methods() -> None:
+    class Handler:
+        __slots__ = ()  # bound on every lookup
+
+        @Dispatcher(key_idx=1)
+        def handle(self, key):
+            return "fallback"
+
+        @handle.register(1)
+        def handle_one(self, key):
+            return ("one", self)
+
+    class CachedHandler:
+        @Dispatcher(key_idx=1)
+        def handle(self, key):
+            return "fallback"
+
+    handler = Handler()
+    assert handler.handle(1) == ("one", handler)
+    assert handler.handle(2) == "fallback"
+    assert Handler.handle(handler, 1) == ("one", handler)
+
+    # The method is bound once per instance, when the instance has a __dict__
+    cached = CachedHandler()
+    assert cached.handle is cached.handle
+    assert cached.handle(1) == "fallback"
+
+
+def test_map_groups_calls_by_key() -> None:
+    dispatch = make_dispatcher()
+    dispatch.register("double")(lambda key, value: 2 * value)
+    batches = []
+
+    @dispatch.register_batch("square")
+    def square_all(calls):
+        batches.append(len(calls))
+        return [value**2 for (_, value), _ in calls]
+
+    calls = [(("double", 1), {}), (("square", 2), {}), (("other", 3), {}), (("square", 4), {}), (("double", 5), {})]
+    assert dispatch.map(calls) == [2, 4, "fallback", 16, 10]
+    assert batches == [2]
+    assert dispatch.map([]) == []
+
+    # A function registered for the key replaces its batch handler
+    dispatch.register("square")(lambda key, value: -value)
+    assert dispatch.map([(("square", 2), {})]) == [-2]
+
+
+def test_map_resolves_batch_handlers_by_type() -> None:
+    dispatch = make_dispatcher(by_type=True)
+    dispatch.register_batch(int)(lambda calls: ["ints"] * len(calls))
+    dispatch.register(str)(lambda obj: "str")
+
+    calls = [((True,), {}), ((1,), {}), (("a",), {}), ((1.5,), {})]
+    assert dispatch.map(calls) == ["ints", "ints", "str", "fallback"]
+
+    # A function registered for a subclass takes precedence over the batch handler of its base
+    dispatch.register(bool)(lambda obj: "bool")
+    assert dispatch.map(calls) == ["bool", "ints", "str", "fallback"]
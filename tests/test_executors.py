@@ -0,0 +1,112 @@
+import asyncio
+import multiprocessing
+import threading
+
+import pytest
+
+from pymaestro.executors import AsyncioExecutor, InlineExecutor, create_executor
+from pymaestro.jobs import JobPool, create_job, preload_modules
+from tests.helper_scripts.functions import FactorialJob, cook_vegetables, sum_of_squares
+
+
+def current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+async def async_current_thread_name() -> str:
+    await asyncio.sleep(0)
+    return threading.current_thread().name
+
+
+@pytest.mark.parametrize(
+    "backend, executor_type", [("inline", InlineExecutor), ("asyncio", AsyncioExecutor), ("thread", object)]
+)
+def test_create_executor(backend, executor_type) -> None:
+    with create_executor(backend, max_workers=2) as executor:
+        assert isinstance(executor, executor_type)
+        assert executor.submit(sum_of_squares, 3).result() == 14
+
+
+def test_create_executor_raise_value_error_for_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="Invalid 'executor': unknown"):
+        create_executor("unknown")
+
+
+def test_inline_executor_runs_in_calling_thread() -> None:
+    with InlineExecutor() as executor:
+        assert executor.submit(current_thread_name).result() == threading.current_thread().name
+
+
+def test_inline_executor_stores_exceptions() -> None:
+    with InlineExecutor() as executor:
+        future = executor.submit(int, "not a number")
+
+    with pytest.raises(ValueError):
+        future.result()
+
+
+def test_asyncio_executor_runs_coroutines_on_one_loop() -> None:
+    with AsyncioExecutor() as executor:
+        futures = [executor.submit(async_current_thread_name) for _ in range(5)]
+        assert {future.result() for future in futures} == {"maestro-asyncio"}
+
+
+def test_executor_raise_runtime_error_after_shutdown() -> None:
+    for executor in (InlineExecutor(), AsyncioExecutor()):
+        executor.shutdown()
+        with pytest.raises(RuntimeError, match="cannot schedule new futures after shutdown"):
+            executor.submit(sum_of_squares, 3)
+
+
+@pytest.mark.parametrize("backend", ["inline", "thread", "asyncio"])
+def test_job_pool_with_executor_backend(backend) -> None:
+    pool = JobPool(
+        create_job(
+            "callable", name="squares", executable=sum_of_squares, args=(3,), parallel_group="g", executor=backend
+        ),
+        create_job("async_callable", name="cook", executable=cook_vegetables, parallel_group="g", executor=backend),
+    )
+    assert pool.backend == backend
+    assert list(pool.execute()) == [14, ["Boiled water ready", "Vegetables ready"]]
+
+
+def test_job_pool_raise_value_error_for_mixed_executors() -> None:
+    with pytest.raises(ValueError, match="All jobs in a JobPool must share the same executor"):
+        JobPool(
+            create_job("callable", name="a", executable=sum_of_squares, parallel_group="g", executor="thread"),
+            create_job("callable", name="b", executable=sum_of_squares, parallel_group="g", executor="inline"),
+        )
+
+
+def test_job_raise_value_error_for_unknown_executor() -> None:
+    with pytest.raises(ValueError, match="Invalid 'executor': unknown"):
+        create_job("callable", name="a", executable=sum_of_squares, executor="unknown")
+
+
+def test_preload_modules() -> None:
+    jobs = [
+        create_job("callable", name="function", executable=sum_of_squares, parallel_group="group"),
+        create_job("callable", name="callable_object", executable=FactorialJob(), parallel_group="group"),
+        create_job("callable", name="builtin", executable=len, args=([],), parallel_group="group"),
+        create_job("script", name="module", executable="tests.helper_scripts.script_with_exit_code_zero"),
+        create_job("script", name="path", executable="tests/helper_scripts/script_with_exit_code_zero.py"),
+    ]
+    assert preload_modules(jobs) == ["tests.helper_scripts", "tests.helper_scripts.functions"]
+
+
+@pytest.mark.skipif("forkserver" not in multiprocessing.get_all_start_methods(), reason="forkserver is not supported")
+def test_job_pool_with_forkserver_preloads_modules() -> None:
+    pool = JobPool(
+        *(
+            create_job(
+                "callable",
+                name=f"preloaded_{i}",
+                executable="tests.helper_scripts.functions.imported_before_fork",
+                parallel_group="forkserver",
+                args=(i,),
+                executor="forkserver",
+            )
+            for i in range(2)
+        )
+    )
+    assert list(pool.execute(max_workers=2)) == [True, True]
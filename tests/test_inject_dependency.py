@@ -1,8 +1,19 @@
+import asyncio
+import concurrent.futures
+import copy
+import gc
+import json
 import os
+import pickle
+import warnings
 from tempfile import NamedTemporaryFile
 
-from pymaestro import Resource
-from pymaestro.jobs import create_job
+import pytest
+
+from pymaestro import Broadcast, Maestro, Resource, deserialize, serialize
+from pymaestro.cache import ResultCache
+from pymaestro.jobs import CallableJob, Job, JobPool, create_job
+from tests.helper_scripts.functions import logged_resource, lookup, materialized_broadcasts, worker_pid
 
 
 def open_file(mode="w"):
@@ -33,3 +44,246 @@ def test_inject_file_as_resource():
         assert first_line.strip() == "This is the first line"
 
     os.remove(f.name)
+
+
+def counter():
+    state = {"open": True}
+    try:
+        yield state
+    finally:
+        state["open"] = False
+
+
+async def read_after_await(state):
+    await asyncio.sleep(0)
+    return dict(state)
+
+
+def test_inject_resource_into_async_execute():
+    job = create_job("async_callable", name="read_state", executable=read_after_await, args=(Resource(counter),))
+    assert asyncio.run(job.async_execute()) == {"open": True}
+    assert isinstance(job.args[0], Resource)
+
+
+def arguments(*args, **kwargs):
+    return copy.deepcopy((args, kwargs))
+
+
+def test_arguments_are_not_copied_without_resources():
+    job = create_job("callable", name="job", executable=arguments, args=(1,), kwargs={})
+    args, kwargs = job.args, job.kwargs
+    assert job.execute() == ((1,), {})
+    assert job.args is args and job.kwargs is kwargs
+
+    # The positions of the resources follow the arguments assigned to the job
+    job.args = [Resource(counter)]
+    assert job._injected_args == (0,)
+    job.is_completed = False
+    assert job.execute() == (({"open": True},), {})
+    assert isinstance(job.args[0], Resource)
+
+    # Keyword arguments are checked on every execution, as they may be changed in place
+    job.args = ()
+    job.kwargs["state"] = Resource(counter)
+    job.is_completed = False
+    assert job.execute() == ((), {"state": {"open": True}})
+
+
+def test_jobs_with_or_without_plain_wrappers_behave_the_same():
+    class PlainJob(Job, plain_wrappers=True):
+        def __init__(self, name, args):
+            super().__init__(name, None)
+            self.args, self.kwargs = args, {}
+
+        def execute(self):
+            return dict(self.args[0])
+
+    class WraptJob(PlainJob, plain_wrappers=False):
+        pass
+
+    class InheritedJob(CallableJob):
+        pass
+
+    assert InheritedJob.plain_wrappers and not WraptJob.plain_wrappers
+    for job_class in (PlainJob, WraptJob):
+        job = job_class("job", (Resource(counter),))
+        assert job.execute() == {"open": True}
+        assert isinstance(job.args[0], Resource)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert job.execute() == {"open": True}
+        assert "already been completed" in str(caught[0].message)
+        assert caught[0].filename == __file__
+
+
+class RecordingCache:
+    def __init__(self):
+        self.keyed_args = []
+
+    def key(self, job):
+        self.keyed_args.append(job.args)
+        return "key"
+
+    def get(self, key):
+        return False, None
+
+    def put(self, key, value):
+        pass
+
+
+def test_async_jobs_are_keyed_on_their_resources():
+    job = create_job("async_callable", name="read_state", executable=read_after_await, args=(Resource(counter),))
+    job.cache = RecordingCache()
+    assert job.execute() == {"open": True}
+    job.is_completed = False
+    assert asyncio.run(job.async_execute()) == {"open": True}
+
+    # Resources are injected after the key is computed, whether `execute` or `async_execute` is called
+    assert len(job.cache.keyed_args) == 2
+    assert all(isinstance(args[0], Resource) for args in job.cache.keyed_args)
+
+
+def test_broadcast_is_replaced_by_its_value():
+    table = {"a": 1}
+    job = create_job("callable", name="lookup", executable=lookup, args=(Broadcast(table), "a"))
+    _, identity, value = job.execute()
+    assert (identity, value) == (id(table), 1)
+    assert isinstance(job.args[0], Broadcast)
+
+
+def test_broadcast_is_written_once_and_pickled_by_reference(tmp_path):
+    broadcast = Broadcast({str(i): i for i in range(100_000)}, directory=tmp_path)
+    payloads = [pickle.dumps(broadcast) for _ in range(3)]
+    assert len(list(tmp_path.iterdir())) == 1
+    assert all(len(payload) < 500 for payload in payloads)
+
+    del broadcast, payloads
+    gc.collect()
+    assert list(tmp_path.iterdir()) == []  # removed with the Broadcast that wrote it
+
+
+def test_broadcast_is_loaded_once_per_worker(tmp_path):
+    table = Broadcast({str(i): i for i in range(10_000)}, directory=tmp_path)
+    pool = JobPool(
+        *(
+            create_job(
+                "callable", name=f"lookup_{i}", executable=lookup, args=(table, str(i)), parallel_group="lookups"
+            )
+            for i in range(4)
+        )
+    )
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+        results = list(pool.execute(executor=executor))
+
+    assert [value for _, _, value in results] == [0, 1, 2, 3]
+    assert len({(pid, identity) for pid, identity, _ in results}) == 1  # one worker, one copy of the table
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_workers_drop_the_values_of_released_broadcasts(tmp_path):
+    def pool(table):
+        job = create_job(
+            "callable", name="count", executable=materialized_broadcasts, args=(table,), parallel_group="p"
+        )
+        return JobPool(job)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+        executor.submit(os.getpid).result()  # the worker starts before the broadcasts are shared
+        first = Broadcast({"a": 1}, directory=tmp_path)
+        assert list(pool(first).execute(executor=executor)) == [1]
+
+        del first
+        gc.collect()
+        second = Broadcast({"b": 2}, directory=tmp_path)
+        assert list(pool(second).execute(executor=executor)) == [1]
+
+
+def test_cache_key_does_not_share_the_broadcast(tmp_path):
+    def job(value):
+        return create_job("callable", name="lookup", executable=lookup, args=(Broadcast(value, tmp_path), "a"))
+
+    cache = ResultCache(tmp_path / "cache")
+    key = cache.key(job({"a": 1}))
+    assert key == cache.key(job({"a": 1})) != cache.key(job({"a": 2}))
+    assert not any(tmp_path.iterdir())
+
+
+def test_broadcast_round_trips_through_serialize():
+    job = create_job("callable", name="lookup", executable=lookup, args=(Broadcast({"a": 1}), "a"))
+    restored = json.loads(json.dumps(job, default=serialize), object_hook=deserialize)
+    assert isinstance(restored.args[0], Broadcast)
+    assert restored.args[0].value == {"a": 1}
+
+
+def read_log(path) -> list[str]:
+    return [line.rsplit(" ", 1)[0] for line in path.read_text().splitlines()]
+
+
+def test_run_scoped_resources_are_shared_by_the_run(tmp_path):
+    log = tmp_path / "resources.log"
+    maestro = Maestro()
+    for i, name in enumerate(["a", "b", "a"]):
+        maestro.add(worker_pid, name=f"job_{i}", args=(Resource(logged_resource, (str(log), name), scope="run"),))
+    maestro.add(worker_pid, name="job_3", args=(Resource(logged_resource, (str(log), "c")),))
+
+    maestro.execute()
+    assert read_log(log) == ["open a", "open b", "open c", "close c", "close b", "close a"]
+    Maestro()
+
+
+def test_group_scoped_resources_are_shared_by_the_group(tmp_path):
+    log = tmp_path / "resources.log"
+    maestro = Maestro()
+    for group in ("first", "second"):
+        for i in range(3):
+            resource = Resource(logged_resource, (str(log), group), scope="group")
+            maestro.add(worker_pid, name=f"{group}_{i}", args=(resource,), parallel_group=group, executor="thread")
+
+    maestro.execute()
+    assert read_log(log) == ["open first", "close first", "open second", "close second"]
+    assert all(job.resource_scopes is None for job in maestro.registry)
+    Maestro()
+
+
+@pytest.mark.parametrize("scope", ["run", "group"])
+def test_process_pools_reject_run_and_group_scoped_resources(tmp_path, scope):
+    log = tmp_path / "resources.log"
+    maestro = Maestro()
+    maestro.add(worker_pid, name="first", args=(Resource(logged_resource, (str(log), "job")),))
+    for i in range(2):
+        resource = Resource(logged_resource, (str(log), scope), scope=scope)
+        maestro.add(worker_pid, name=f"job_{i}", args=(resource,), parallel_group="workers")
+
+    with pytest.raises(ValueError, match=f"Job 'job_0' runs on a process pool .* scope '{scope}'"):
+        maestro.execute()
+    assert not log.exists()  # rejected before the run starts
+
+    with pytest.raises(ValueError, match="cannot close"):
+        list(JobPool(*maestro.registry[1:]).execute(max_workers=1))
+    assert list(JobPool(*maestro.registry[1:]).execute(executor="thread")) == [os.getpid()] * 2
+    Maestro()
+
+
+def test_worker_scoped_resources_are_set_up_once_per_worker(tmp_path):
+    log = tmp_path / "resources.log"
+    resource = Resource(logged_resource, (str(log), "worker"), scope="worker")
+    pool = JobPool(
+        *(
+            create_job("callable", name=f"job_{i}", executable=worker_pid, args=(resource,), parallel_group="workers")
+            for i in range(4)
+        )
+    )
+    [pid] = set(pool.execute(max_workers=1))
+    assert log.read_text().splitlines() == [f"open worker {pid}", f"close worker {pid}"]
+
+
+def test_resource_scope_round_trips_through_serialize():
+    job = create_job(
+        "callable", name="job", executable=worker_pid, args=(Resource(logged_resource, ("log", "a"), scope="run"),)
+    )
+    restored = json.loads(json.dumps(job, default=serialize), object_hook=deserialize)
+    assert restored.args[0].scope == "run"
+    assert Resource(logged_resource, ("log", "a")).key == restored.args[0].key
+
+    with pytest.raises(ValueError, match="Invalid 'scope'"):
+        Resource(logged_resource, scope="session")
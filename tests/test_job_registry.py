@@ -155,3 +155,86 @@ def test_swap_mix_idx_name(all_jobs: list[Job]) -> None:
         job_j = registry[j]
         registry.swap(i, job_name_j)
         assert registry[i] == job_j
+
+
+def assert_positions_indexed(registry: JobRegistry) -> None:
+    assert [registry.index(job.name) for job in registry] == list(range(len(registry)))
+
+
+def test_index_after_mutations(all_jobs: list[Job], download_images_script_job: Job) -> None:
+    registry = JobRegistry(all_jobs[1:])
+    registry.insert(0, all_jobs[0])
+    assert_positions_indexed(registry)
+    registry.swap(0, -1)
+    assert_positions_indexed(registry)
+    registry.pop(1)
+    assert_positions_indexed(registry)
+    registry.remove(registry[0].name)
+    assert_positions_indexed(registry)
+
+
+def test_setitem_releases_replaced_name(simple_math_jobs: list[Job], download_images_script_job: Job) -> None:
+    registry = JobRegistry(simple_math_jobs)
+    replaced_job = registry[0]
+    registry[0] = download_images_script_job
+    assert replaced_job.name not in registry
+    assert registry.index(download_images_script_job.name) == 0
+
+    registry[0] = replaced_job
+    assert registry.index(replaced_job.name) == 0
+
+
+def test_group_members(simple_math_jobs: list[Job], advance_math_jobs: list[Job]) -> None:
+    registry = JobRegistry([*simple_math_jobs, *advance_math_jobs])
+    group = simple_math_jobs[0].parallel_group
+    assert registry.group_members(group) == simple_math_jobs
+
+    registry.swap(0, 1)
+    assert registry.group_members(group) == [simple_math_jobs[1], simple_math_jobs[0], *simple_math_jobs[2:]]
+
+    for job in simple_math_jobs:
+        registry.remove(job.name)
+    assert registry.group_members(group) == []
+
+
+def test_append_extends_cached_grouped_jobs(all_jobs: list[Job]) -> None:
+    registry = JobRegistry()
+    for job in all_jobs:
+        registry.append(job)
+        incremental = dict(registry.grouped_jobs)
+        registry.reset_cached()
+        assert incremental == dict(registry.grouped_jobs)
+        assert list(incremental) == list(registry.grouped_jobs)
+
+
+def test_grouped_jobs_is_not_changed_by_later_appends(all_jobs: list[Job]) -> None:
+    registry = JobRegistry(all_jobs[:1])
+    plan = registry.grouped_jobs
+    for _ in plan:
+        for other in all_jobs[1:]:
+            registry.append(other)  # does not change the size of the plan being iterated
+
+    assert list(plan) == all_jobs[:1]
+    assert dict(registry.grouped_jobs) == dict(JobRegistry(all_jobs).grouped_jobs)
+
+
+def test_extend_bulk(all_jobs: list[Job]) -> None:
+    registry = JobRegistry(all_jobs[:1])
+    cached = registry.grouped_jobs
+    registry.extend_bulk(all_jobs[1:])
+    assert registry.jobs == all_jobs
+    assert registry.grouped_jobs is not cached
+    assert dict(registry.grouped_jobs) == dict(JobRegistry(all_jobs).grouped_jobs)
+    assert all(registry.index(job.name) == position for position, job in enumerate(all_jobs))
+
+
+def test_extend_bulk_adds_nothing_when_a_job_is_invalid(simple_math_jobs: list[Job]) -> None:
+    registry = JobRegistry(simple_math_jobs[:1])
+    with pytest.raises(ValueError, match=f"Job with name '{simple_math_jobs[0].name}' already exists"):
+        registry.extend_bulk(simple_math_jobs)
+    with pytest.raises(ValueError, match=f"Job with name '{simple_math_jobs[1].name}' already exists"):
+        registry.extend_bulk([simple_math_jobs[1], simple_math_jobs[1]])
+    with pytest.raises(TypeError, match="must be instances of 'Job'"):
+        registry.extend_bulk([*simple_math_jobs[1:], "a"])
+
+    assert registry.jobs == simple_math_jobs[:1]
@@ -3,12 +3,24 @@ import asyncio
 import os
 import pickle
 import re
+import sys
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
 import pytest
 
-from pymaestro.jobs import AsyncCallableJob, CallableJob, Job, JobPool, ScriptJob, create_job
+from pymaestro import jobs
+from pymaestro.jobs import (
+    AsyncCallableJob,
+    CallableJob,
+    Job,
+    JobPool,
+    ScriptJob,
+    create_job,
+    create_jobs,
+    preload_modules,
+)
+from pymaestro.utils import lazy_executables
 from tests.helper_scripts.functions import cook_vegetables, sum_of_squares
 
 
@@ -47,6 +59,35 @@ def test_create_async_callable_using_positional_arguments() -> None:
     assert cook_vegetables_job.args == ()
 
 
+def test_create_jobs() -> None:
+    rows = [{"name": f"job_{i}", "executable": sum_of_squares, "args": (i,)} for i in range(3)]
+    jobs = create_jobs("callable", rows)
+    assert [type(job) for job in jobs] == [CallableJob] * 3
+    assert [job.execute() for job in jobs] == [0, 1, 5]
+
+    [job] = create_jobs("async_callable", [{"name": "cook", "executable": cook_vegetables, "max_concurrency": 2}])
+    assert isinstance(job, AsyncCallableJob) and job.max_concurrency == 2
+
+    [job] = create_jobs("script", [{"name": "script", "executable": "tests.helper_scripts.script_with_result"}])
+    assert isinstance(job, ScriptJob)
+
+    with pytest.raises(ValueError, match="Invalid 'task_type'"):
+        create_jobs("unknown", rows)
+
+
+def test_create_jobs_uses_the_registered_factory() -> None:
+    rows = [{"name": "job", "executable": sum_of_squares, "args": (2,), "parallel_group": "p"}]
+    assert repr(create_jobs("callable", rows)) == repr([create_job("callable", **row) for row in rows])
+
+    original = create_job.get_function("callable")
+    try:
+        create_job.register("callable")(lambda job_type, **row: original(job_type, **row, executor="thread"))
+        [job] = create_jobs("callable", rows)
+        assert job.executor == "thread"
+    finally:
+        create_job.register("callable")(original)
+
+
 def test_create_script_job(download_images_script_job) -> None:
     assert isinstance(download_images_script_job, Job)
     assert isinstance(download_images_script_job, ScriptJob)
@@ -115,14 +156,52 @@ def test_script_job_pickling(download_images_script_job):
 
 
 def test_script_job_execute_with_no_exit_code(script_job_with_no_exit_code) -> None:
-    result = script_job_with_no_exit_code.execute()
-    for k, v in {"a": "this if my first variable", "b": "this is my second variable"}.items():
-        assert result[k] == v
+    # Without declared outputs, a script returns nothing instead of its whole namespace
+    assert script_job_with_no_exit_code.execute() is None
+
+
+def test_script_job_execute_with_outputs() -> None:
+    script_path = Path(__file__).resolve().parent / "helper_scripts" / "script_with_no_exit_code.py"
+    job = create_job("script", name="no_exit_code", executable=str(script_path), outputs=["a", "b"])
+    assert job.execute() == {"a": "this if my first variable", "b": "this is my second variable"}
+
+
+def test_script_job_execute_with_missing_outputs() -> None:
+    script_path = Path(__file__).resolve().parent / "helper_scripts" / "script_with_no_exit_code.py"
+    job = create_job("script", name="no_exit_code", executable=str(script_path), outputs=["a", "c"])
+    with pytest.raises(RuntimeError, match=re.escape("did not define the outputs ['c']")):
+        job.execute()
+
+
+def test_script_job_execute_with_maestro_result() -> None:
+    job = create_job("script", name="with_result", executable="./tests/helper_scripts/script_with_result.py")
+    assert job.execute() == 285
+
+
+def test_script_job_outputs_take_precedence_over_maestro_result() -> None:
+    job = create_job(
+        "script", name="with_result", executable="./tests/helper_scripts/script_with_result.py", outputs=["numbers"]
+    )
+    assert job.execute() == {"numbers": list(range(10))}
+
+
+def test_script_job_rejects_invalid_outputs() -> None:
+    with pytest.raises(TypeError, match="'outputs' must be an iterable of variable names"):
+        create_job("script", name="with_result", executable="./tests/helper_scripts/script_with_result.py", outputs="a")
+
+    with pytest.raises(ValueError, match="Isolated scripts run in another interpreter"):
+        create_job(
+            "script",
+            name="with_result",
+            executable="./tests/helper_scripts/script_with_result.py",
+            isolated=True,
+            outputs=["numbers"],
+        )
 
 
 def test_script_job_execute_with_exit_code_zero(script_job_with_exit_code_zero) -> None:
     result = script_job_with_exit_code_zero.execute()
-    assert result == {}
+    assert result is None
 
 
 def test_script_job_execute_with_exit_code_other_than_zero(script_job_with_exit_code_other_than_zero) -> None:
@@ -135,7 +214,12 @@ def test_script_job_execute_with_exit_code_other_than_zero(script_job_with_exit_
 
 
 def test_script_job_with_relative_path() -> None:
-    script_job = create_job("script", name="script_job", executable=str(Path("./tests/helper_scripts/functions.py")))
+    script_job = create_job(
+        "script",
+        name="script_job",
+        executable=str(Path("./tests/helper_scripts/functions.py")),
+        outputs=["sum_of_squares"],
+    )
     result = script_job.execute()
     assert "sum_of_squares" in result
 
@@ -152,7 +236,9 @@ def test_script_with_not_existing_file() -> None:
     "ignore:'tests.helper_scripts.functions' found in sys.modules after import of package 'tests.helper_scripts'"
 )
 def test_script_job_provided_as_module() -> None:
-    script_job = create_job("script", name="script_job", executable="tests.helper_scripts.functions")
+    script_job = create_job(
+        "script", name="script_job", executable="tests.helper_scripts.functions", outputs=["sum_of_squares"]
+    )
     result = script_job.execute()
     assert "sum_of_squares" in result
 
@@ -160,7 +246,7 @@ def test_script_job_provided_as_module() -> None:
 def test_script_job_as_module_with_exit_code_zero() -> None:
     script_job = create_job("script", name="script_job", executable="tests.helper_scripts.script_with_exit_code_zero")
     result = script_job.execute()
-    assert result == {}
+    assert result is None
 
 
 def test_script_job_as_module_with_exit_code_other_than_zero() -> None:
@@ -244,3 +330,213 @@ def test_result_property() -> None:
         args=(2,),
     )
     assert job.result == 5
+
+
+class ConcurrencyProbe:
+    """Async callable that records how many calls are awaited at the same time."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, value: int) -> int:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.05)
+        self.active -= 1
+        return value
+
+
+def make_async_pool(probe: ConcurrencyProbe, size: int, max_concurrency: int | None = None) -> JobPool:
+    jobs = [
+        AsyncCallableJob(
+            f"probe_{i}", probe.__call__, parallel_group="probes", args=(i,), max_concurrency=max_concurrency
+        )
+        for i in range(size)
+    ]
+    return JobPool(*jobs)
+
+
+def test_async_job_pool_gathers_on_one_event_loop() -> None:
+    probe = ConcurrencyProbe()
+    pool = make_async_pool(probe, 10)
+    assert pool.backend == "asyncio"
+    assert list(pool.execute()) == list(range(10))
+    assert probe.peak == 10
+
+
+def test_async_job_pool_with_max_concurrency() -> None:
+    probe = ConcurrencyProbe()
+    pool = make_async_pool(probe, 6, max_concurrency=2)
+    assert pool.max_concurrency == 2
+    assert sorted(pool.execute(mode="as_completed")) == list(range(6))
+    assert probe.peak == 2
+
+
+def test_mixed_job_pool_defaults_to_process_backend(simple_math_jobs) -> None:
+    async_job = AsyncCallableJob("cook", cook_vegetables, parallel_group="simple_math")
+    assert JobPool(*simple_math_jobs, async_job).backend == "process"
+
+
+def test_async_execute_marks_job_as_completed(cook_vegetables_async_callable_job) -> None:
+    result = asyncio.run(cook_vegetables_async_callable_job.async_execute())
+    assert cook_vegetables_async_callable_job.is_completed
+    assert cook_vegetables_async_callable_job.result is result
+
+
+def test_async_callable_job_raise_value_error_for_invalid_max_concurrency() -> None:
+    with pytest.raises(ValueError, match="'max_concurrency' must be a positive integer"):
+        AsyncCallableJob("cook", cook_vegetables, max_concurrency=0)
+
+
+def test_pickling_does_not_execute_pending_job():
+    job = create_job("callable", name="sum of square to 5", executable=sum_of_squares, args=(5,))
+    job = pickle.loads(pickle.dumps(job))
+    assert job.is_completed is None
+    assert job.result == sum_of_squares(5)
+
+
+def isolated_script(name: str, script: str, **options) -> ScriptJob:
+    executable = str(Path(__file__).resolve().parent / "helper_scripts" / script)
+    return create_job("script", name=name, executable=executable, isolated=True, **options)
+
+
+def test_isolated_script_job_streams_output(capsys) -> None:
+    job = isolated_script("isolated", "script_with_exit_code_zero.py")
+    assert job.is_async
+    assert job.execute() is None
+    assert job.is_completed
+
+    output = capsys.readouterr().out
+    assert "[isolated] a='this if my first variable', b='this is my second variable'" in output
+
+
+def test_isolated_script_job_with_exit_code_other_than_zero(capsys) -> None:
+    job = isolated_script("isolated", "script_with_exit_code_other_than_zero.py")
+    with pytest.raises(
+        RuntimeError, match=re.escape(f"Module or script '{job.executable_path}' exited with non-zero code 1")
+    ):
+        job.execute()
+
+    assert "[isolated] a=" in capsys.readouterr().out
+
+
+def test_isolated_script_job_provided_as_module(capsys) -> None:
+    job = create_job(
+        "script", name="module", executable="tests.helper_scripts.script_with_exit_code_zero", isolated=True
+    )
+    assert job.execute() is None
+    assert "[module] a=" in capsys.readouterr().out
+
+
+def test_isolated_script_job_extends_the_pythonpath(monkeypatch, capsys) -> None:
+    monkeypatch.setenv("PYTHONPATH", "/existing/path")
+    job = create_job("script", name="module", executable="tests.helper_scripts.script_with_result", isolated=True)
+    assert job._source_paths()[-1] == str(Path(__file__).resolve().parents[1])
+
+    env = {}
+
+    async def create_subprocess_exec(*args, **kwargs):
+        env.update(kwargs["env"])
+        raise RuntimeError("not started")
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", create_subprocess_exec)
+    with pytest.raises(RuntimeError, match="not started"):
+        job.execute()
+
+    pythonpath = env["PYTHONPATH"].split(os.pathsep)
+    assert pythonpath[-1] == "/existing/path"
+    assert pythonpath[:-1] == list(dict.fromkeys(job._source_paths()))
+
+
+def test_isolated_script_job_is_killed_on_errors(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(jobs, "_SUBPROCESS_LINE_LIMIT", 10)
+    monkeypatch.setenv("PID_FILE", str(tmp_path / "pid"))
+    job = isolated_script("long_line", "script_with_long_line.py")
+    with pytest.raises(ValueError):
+        job.execute()
+
+    with pytest.raises(ProcessLookupError):  # killed and reaped
+        os.kill(int((tmp_path / "pid").read_text()), 0)
+
+
+def test_isolated_script_jobs_run_concurrently_on_the_event_loop(capsys) -> None:
+    pool = JobPool(
+        *(isolated_script(f"isolated_{i}", "script_with_exit_code_zero.py", parallel_group="scripts") for i in range(3))
+    )
+    assert pool.backend == "asyncio"
+    assert pool.max_concurrency == (os.cpu_count() or 1)
+    assert list(pool.execute()) == [None, None, None]
+
+    output = capsys.readouterr().out
+    assert all(f"[isolated_{i}] a=" in output for i in range(3))
+
+
+def test_isolated_script_job_concurrency_cap() -> None:
+    jobs = [
+        isolated_script(f"isolated_{i}", "script_with_exit_code_zero.py", parallel_group="scripts") for i in range(2)
+    ]
+    jobs.append(isolated_script("capped", "script_with_exit_code_zero.py", parallel_group="scripts", max_concurrency=1))
+    assert JobPool(*jobs).max_concurrency == 1
+
+    with pytest.raises(ValueError, match="'max_concurrency' must be a positive integer"):
+        isolated_script("invalid", "script_with_exit_code_zero.py", max_concurrency=0)
+
+
+def test_isolated_script_job_pickling() -> None:
+    job = pickle.loads(pickle.dumps(isolated_script("isolated", "script_with_exit_code_zero.py", max_concurrency=2)))
+    assert job.isolated
+    assert job.max_concurrency == 2
+
+
+@pytest.fixture
+def lazy_package(tmp_path, monkeypatch) -> str:
+    """An importable package that is not imported yet, with a function and a coroutine function."""
+    name = f"lazy_package_{tmp_path.name}"
+    package = tmp_path / name
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "tasks.py").write_text("def double(x):\n    return 2 * x\n\n\nasync def adouble(x):\n    return 2 * x\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    for module in [module for module in sys.modules if module.startswith(name)]:
+        del sys.modules[module]
+
+
+def test_lazy_callable_job_imports_its_executable_on_first_execute(lazy_package) -> None:
+    with lazy_executables():
+        job = create_job("callable", name="double", executable=f"{lazy_package}.tasks.double", args=(2,))
+
+    assert lazy_package not in sys.modules
+    assert not job.is_resolved
+    assert str(job) == "double(2)"
+    assert preload_modules([job]) == [f"{lazy_package}.tasks"]
+    assert pickle.loads(pickle.dumps(job)).execute() == 4  # the worker resolves the import path
+    assert not job.is_resolved
+
+    assert job.execute() == 4
+    assert job.is_resolved
+    assert job.import_path == f"{lazy_package}.tasks.double"
+
+
+def test_lazy_async_callable_job_checks_its_executable_when_resolved(lazy_package) -> None:
+    job = create_job("async_callable", name="adouble", executable=f"{lazy_package}.tasks.adouble", args=(2,), lazy=True)
+    assert asyncio.run(job.async_execute()) == 4
+
+    job = create_job("async_callable", name="double", executable=f"{lazy_package}.tasks.double", lazy=True)
+    with pytest.raises(TypeError, match="must be an async function"):
+        job.execute()
+
+
+def test_lazy_jobs_check_that_the_package_exists() -> None:
+    with pytest.raises(ModuleNotFoundError, match="not_installed_package.tasks"):
+        create_job("callable", name="missing", executable="not_installed_package.tasks.double", lazy=True)
+
+    with pytest.raises(ModuleNotFoundError, match="not_installed_package.tasks"):
+        create_job("script", name="missing", executable="not_installed_package.tasks", lazy=True)
+
+
+def test_lazy_script_job_does_not_import_parent_packages(lazy_package) -> None:
+    job = create_job("script", name="tasks", executable=f"{lazy_package}.tasks", lazy=True)
+    assert lazy_package not in sys.modules
+    assert job.execute() is None
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from pymaestro import Maestro
+from pymaestro.jobs import create_job
+from pymaestro.journal import RegistryJournal
+from tests.helper_scripts.functions import sum_of_squares
+
+
+def make_job(name: str, n: int = 1):
+    return create_job("callable", name=name, executable=sum_of_squares, kwargs={"n": n})
+
+
+def test_each_change_appends_one_record(tmp_path) -> None:
+    registry = RegistryJournal(tmp_path).load()
+    for i in range(3):
+        registry.append(make_job(f"job_{i}"))
+
+    lines = (tmp_path / "journal-0.jsonl").read_text().splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[-1])["op"] == "append"
+    assert json.loads(lines[-1])["job"]["name"] == "job_2"
+    assert ", " not in lines[-1]
+    assert not list(tmp_path.glob("snapshot-*"))
+
+
+def test_journal_replays_every_change(tmp_path) -> None:
+    registry = RegistryJournal(tmp_path).load()
+    registry.extend([make_job(f"job_{i}", i) for i in range(5)])
+    registry.extend_bulk([make_job(f"bulk_{i}", i) for i in range(3)])
+    registry.insert(1, make_job("inserted"))
+    registry[0] = make_job("replaced")
+    registry.pop()
+    registry.remove("job_2")
+    registry.swap("replaced", "job_3")
+    registry.journal.close()
+
+    replayed = RegistryJournal(tmp_path).load()
+    assert [job.name for job in replayed] == [job.name for job in registry]
+    assert [job.kwargs for job in replayed] == [job.kwargs for job in registry]
+
+    replayed.clear()
+    replayed.journal.close()
+    assert len(RegistryJournal(tmp_path).load()) == 0
+
+
+def test_bulk_extend_is_one_record(tmp_path) -> None:
+    registry = RegistryJournal(tmp_path).load()
+    registry.extend_bulk([make_job(f"job_{i}") for i in range(100)])
+    assert registry.journal.records == 1
+    assert len((tmp_path / "journal-0.jsonl").read_text().splitlines()) == 1
+
+
+def test_job_that_cannot_be_recorded_is_not_added(tmp_path) -> None:
+    registry = RegistryJournal(tmp_path).load()
+    registry.append(make_job("job_0"))
+    with pytest.raises(TypeError):
+        registry.append(create_job("callable", name="broken", executable=sum_of_squares, kwargs={"n": object()}))
+
+    assert [job.name for job in registry] == ["job_0"]
+    assert [job.name for job in RegistryJournal(tmp_path).load()] == ["job_0"]
+
+
+def test_journal_is_compacted_into_a_snapshot(tmp_path) -> None:
+    journal = RegistryJournal(tmp_path, compact_every=4)
+    registry = journal.load()
+    for i in range(10):
+        registry.append(make_job(f"job_{i}"))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["journal-2.jsonl", "snapshot-2.jsonl"]
+    assert journal.records == 2
+    assert [job.name for job in RegistryJournal(tmp_path).load()] == [f"job_{i}" for i in range(10)]
+
+
+def test_interrupted_record_is_dropped(tmp_path) -> None:
+    registry = RegistryJournal(tmp_path).load()
+    registry.append(make_job("job_0"))
+    registry.journal.close()
+    with open(tmp_path / "journal-0.jsonl", "a") as f:
+        f.write('{"op":"append","job":{"type":"call')
+
+    registry = RegistryJournal(tmp_path).load()
+    registry.append(make_job("job_1"))
+    registry.journal.close()
+    assert [job.name for job in RegistryJournal(tmp_path).load()] == ["job_0", "job_1"]
+
+
+def test_maestro_with_journal(tmp_path) -> None:
+    maestro = Maestro(journal=RegistryJournal(tmp_path))
+    maestro.add(sum_of_squares, name="job_0", args=(3,))
+    maestro.add(sum_of_squares, name="job_1", args=(4,))
+    maestro.dump(tmp_path / "registry.jsonl")
+
+    maestro = Maestro(journal=RegistryJournal(tmp_path))
+    assert [job.name for job in maestro.registry] == ["job_0", "job_1"]
+    assert maestro.execute() == [14, 30]
+
+    # A deserialized registry replaces the contents of the journal
+    maestro.registry.clear()
+    maestro.deserialize(tmp_path / "registry.jsonl")
+    maestro.registry.pop()
+    assert [job.name for job in Maestro(journal=RegistryJournal(tmp_path)).registry] == ["job_0"]
+    Maestro()
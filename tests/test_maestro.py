@@ -1,11 +1,17 @@
 import asyncio
+import json
+import multiprocessing
 import re
+import threading
+import time
 from pathlib import Path
 
 import pytest
 
 from pymaestro import DependsOn, Maestro
 from pymaestro.jobs import AsyncCallableJob, CallableJob
+from pymaestro.metrics import Metrics, _current_metrics
+from pymaestro.tracing import Tracer, current_context
 
 maestro = Maestro()
 
@@ -148,3 +154,253 @@ def test_dependency_resolution_raise_key_error():
         maestro.execute()
 
     maestro.registry.clear()
+
+
+def test_execute_with_graph_schedule():
+    @maestro.add(args=(DependsOn("five"),), kwargs={"b": DependsOn("four")})
+    def add(a, b):
+        return a + b
+
+    @maestro.add
+    def five():
+        return 5
+
+    @maestro.add
+    def four():
+        return 4
+
+    results = maestro.execute(schedule="graph", max_workers=2)
+    assert results == [9, 5, 4]
+    maestro.registry.clear()
+
+
+def test_execute_with_graph_schedule_and_parallel_groups():
+    maestro.add(
+        "tests.helper_scripts.functions.sum_of_squares",
+        job_type="callable",
+        name="sum_of_squares",
+        parallel_group="math",
+        args=(3,),
+    )
+    maestro.add(
+        "tests.helper_scripts.functions.approximate_pi",
+        job_type="callable",
+        name="approximate_pi",
+        parallel_group="math",
+        args=(10,),
+    )
+
+    @maestro.add(args=(DependsOn("sum_of_squares"),))
+    def double(value):
+        return 2 * value
+
+    results = maestro.execute(schedule="graph")
+    assert results[0][0] == 14
+    assert results[1] == 28
+    maestro.registry.clear()
+
+
+def test_execute_raise_value_error_for_invalid_schedule():
+    with pytest.raises(ValueError, match="'schedule' must be 'priority' or 'graph'"):
+        maestro.execute(schedule="unknown")
+
+
+def register_worker_pid_jobs():
+    for i in range(2):
+        maestro.add(
+            "tests.helper_scripts.functions.worker_pid",
+            job_type="callable",
+            name=f"worker_pid_{i}",
+            parallel_group="pids",
+            args=(i,),
+        )
+
+
+def test_worker_pool_is_closed_after_execute():
+    register_worker_pid_jobs()
+    maestro.execute()
+    assert not maestro._worker_pools
+    maestro.registry.clear()
+
+
+def test_worker_pool_is_reused_across_executions():
+    with Maestro(pool_size=1, reuse_pool=True) as reusable_maestro:
+        register_worker_pid_jobs()
+        [first_run_pids] = reusable_maestro.execute()
+        reusable_maestro.registry.clear()
+
+        register_worker_pid_jobs()
+        [second_run_pids] = reusable_maestro.execute()
+        assert "process" in reusable_maestro._worker_pools
+
+    assert not reusable_maestro._worker_pools
+    assert len(set(first_run_pids + second_run_pids)) == 1
+
+    Maestro()  # restore the default options of the singleton
+
+
+@pytest.mark.skipif("forkserver" not in multiprocessing.get_all_start_methods(), reason="forkserver is not supported")
+def test_forkserver_worker_pool_preloads_registry_modules():
+    for i in range(2):
+        maestro.add(
+            "tests.helper_scripts.functions.imported_before_fork",
+            job_type="callable",
+            name=f"preloaded_{i}",
+            parallel_group="forkserver",
+            args=(i,),
+            executor="forkserver",
+        )
+    assert maestro.execute() == [[True, True]]
+    maestro.registry.clear()
+
+
+def test_serialize_round_trips_executor(tmp_path):
+    maestro.add(
+        "tests.helper_scripts.functions.sum_of_squares",
+        job_type="callable",
+        name="sum_of_squares",
+        parallel_group="math",
+        args=(3,),
+        executor="thread",
+    )
+    maestro.serialize(tmp_path / "registry.json")
+    maestro.registry.clear()
+
+    maestro.deserialize(tmp_path / "registry.json")
+    assert maestro.registry[0].executor == "thread"
+    assert maestro.execute() == [14]
+    maestro.registry.clear()
+
+
+def test_lazy_deserialize_does_not_import_executables(tmp_path):
+    maestro.add("tests.helper_scripts.functions.sum_of_squares", job_type="callable", name="sum_of_squares", args=(3,))
+    maestro.add("tests.helper_scripts.functions.cut_vegetables", job_type="async_callable", name="cut_vegetables")
+    maestro.serialize(tmp_path / "registry.json")
+    maestro.registry.clear()
+
+    maestro.deserialize(tmp_path / "registry.json", lazy=True)
+    assert not any(job.is_resolved for job in maestro.registry)
+    # Lazy jobs serialize their import paths, and keep their types
+    assert json.loads(maestro.serialize())["value"][1]["type"] == "async_callable"
+    assert maestro.execute() == [14, "Vegetables ready"]
+    assert all(job.is_resolved for job in maestro.registry)
+    maestro.registry.clear()
+
+
+def test_isolated_scripts_round_trip_and_execute(tmp_path, capsys):
+    for i in range(2):
+        maestro.add(
+            "tests.helper_scripts.script_with_exit_code_zero",
+            job_type="script",
+            name=f"isolated_{i}",
+            parallel_group="scripts",
+            isolated=True,
+            max_concurrency=1,
+        )
+    maestro.serialize(tmp_path / "registry.json")
+    maestro.registry.clear()
+
+    maestro.deserialize(tmp_path / "registry.json")
+    assert all(job.isolated and job.max_concurrency == 1 for job in maestro.registry)
+    assert maestro.execute() == [[None, None]]
+    assert "[isolated_1] a=" in capsys.readouterr().out
+    maestro.registry.clear()
+
+
+def test_script_outputs_round_trip_and_return_from_workers(tmp_path):
+    maestro.add(
+        "./tests/helper_scripts/script_with_no_exit_code.py",
+        job_type="script",
+        name="outputs",
+        parallel_group="scripts",
+        outputs=["a"],
+    )
+    maestro.add(
+        "./tests/helper_scripts/script_with_result.py", job_type="script", name="result", parallel_group="scripts"
+    )
+    maestro.serialize(tmp_path / "registry.json")
+    maestro.registry.clear()
+
+    maestro.deserialize(tmp_path / "registry.json")
+    assert maestro.registry[0].outputs == ["a"]
+    assert maestro.execute() == [[{"a": "this if my first variable"}, 285]]
+    maestro.registry.clear()
+
+
+def test_execute_iter_yields_each_job_of_parallel_groups():
+    register_worker_pid_jobs()
+
+    @maestro.add
+    def three():
+        return 3
+
+    events = list(maestro.execute_iter())
+    assert [name for name, _ in events] == ["worker_pid_0", "worker_pid_1", "three"]
+    assert events[-1] == ("three", 3)
+    maestro.registry.clear()
+
+
+def test_execute_iter_with_graph_schedule_yields_in_completion_order():
+    @maestro.add
+    def slow():
+        time.sleep(0.3)
+        return "slow"
+
+    @maestro.add
+    def fast():
+        return "fast"
+
+    @maestro.add(args=(DependsOn("fast"),))
+    def after_fast(value):
+        return f"after {value}"
+
+    events = list(maestro.execute_iter(schedule="graph", mode="as_completed"))
+    assert events == [("fast", "fast"), ("after_fast", "after fast"), ("slow", "slow")]
+    maestro.registry.clear()
+
+
+def test_execute_iter_closed_early_stops_the_graph():
+    started = []
+    for i in range(5):
+
+        @maestro.add(name=f"job_{i}", args=(i,))
+        def job(i):
+            started.append(i)
+            time.sleep(0.05)
+            return i
+
+    events = maestro.execute_iter(schedule="graph", max_workers=1)
+    assert next(events) == ("job_0", 0)
+    events.close()
+
+    # The graph thread is joined before the run is closed: no job starts afterwards
+    assert not any(thread.name == "maestro-graph" for thread in threading.enumerate())
+    count = len(started)
+    time.sleep(0.2)
+    assert len(started) == count < 5
+    maestro.registry.clear()
+
+
+def test_execute_iter_does_not_leak_its_context():
+    maestro = Maestro(tracer=Tracer(), metrics=Metrics())
+
+    @maestro.add
+    def one():
+        return 1
+
+    for _ in maestro.execute_iter():
+        assert current_context() is None
+        assert _current_metrics.get() is None
+
+    Maestro()
+
+
+def test_execute_iter_with_graph_schedule_raises_job_errors():
+    @maestro.add
+    def failing():
+        raise ZeroDivisionError("boom")
+
+    with pytest.raises(ZeroDivisionError, match="boom"):
+        list(maestro.execute_iter(schedule="graph"))
+
+    maestro.registry.clear()
@@ -0,0 +1,120 @@
+# tests/test_metrics.py
+import socket
+
+import pytest
+
+from pymaestro import Maestro
+from pymaestro.metrics import Metrics, PoolMeter, StatsdSink, measure
+from tests.helper_scripts.functions import worker_pid
+
+
+@pytest.fixture
+def metered_maestro():
+    metrics = Metrics()
+    maestro = Maestro(metrics=metrics)
+    yield maestro, metrics
+    maestro.registry.clear()
+    Maestro()  # restore the default options of the singleton
+
+
+def test_histogram_and_prometheus_export(tmp_path):
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.observe("job_duration_seconds", 0.05, job_type="CallableJob", parallel_group="")
+    metrics.observe("job_duration_seconds", 0.5, job_type="CallableJob", parallel_group="")
+    metrics.increment("job_failures_total", job_type="ScriptJob", parallel_group='say "hi"')
+
+    counts, total = metrics.get("job_duration_seconds", job_type="CallableJob", parallel_group="")
+    assert counts == [1, 2, 2]  # cumulative, the last bucket is +Inf
+    assert total == pytest.approx(0.55)
+
+    text = metrics.export_prometheus(tmp_path / "metrics.prom").read_text()
+    assert "# TYPE pymaestro_job_duration_seconds histogram" in text
+    assert 'pymaestro_job_duration_seconds_bucket{job_type="CallableJob",parallel_group="",le="0.1"} 1' in text
+    assert 'pymaestro_job_duration_seconds_bucket{job_type="CallableJob",parallel_group="",le="+Inf"} 2' in text
+    assert 'pymaestro_job_duration_seconds_count{job_type="CallableJob",parallel_group=""} 2' in text
+    assert 'pymaestro_job_failures_total{job_type="ScriptJob",parallel_group="say \\"hi\\""} 1' in text
+
+
+def test_disabled_metrics_are_noops():
+    assert PoolMeter.start(None, "process", None) is None
+    with measure(None) as measurement:
+        assert measurement is None
+
+
+def test_maestro_collects_metrics(metered_maestro):
+    maestro, metrics = metered_maestro
+    maestro.add("tests.helper_scripts.functions.sum_of_squares", job_type="callable", name="single", args=(3,))
+    for i in range(2):
+        maestro.add(
+            "tests.helper_scripts.functions.worker_pid",
+            job_type="callable",
+            name=f"member_{i}",
+            parallel_group="pids",
+            args=(i,),
+        )
+    maestro.execute()
+
+    counts, _ = metrics.get("job_duration_seconds", job_type="CallableJob", parallel_group="")
+    assert counts[-1] == 1
+    counts, _ = metrics.get("job_duration_seconds", job_type="CallableJob", parallel_group="pids")
+    assert counts[-1] == 2
+    counts, total_wait = metrics.get("queue_wait_seconds", parallel_group="pids", backend="process")
+    assert counts[-1] == 2 and total_wait >= 0
+    assert metrics.get("result_bytes_total", parallel_group="pids", backend="process") > 0
+    assert 0 < metrics.get("pool_utilization_ratio", parallel_group="pids") <= 1
+    assert metrics.get("worker_busy_seconds_total", backend="process") <= metrics.get(
+        "worker_capacity_seconds_total", backend="process"
+    )
+
+
+def test_maestro_counts_failures(metered_maestro):
+    maestro, metrics = metered_maestro
+
+    @maestro.add(name="failing", parallel_group="failures", executor="thread")
+    def failing():
+        raise ValueError("boom")
+
+    @maestro.add(name="succeeding", parallel_group="failures", executor="thread")
+    def succeeding():
+        return 1
+
+    with pytest.raises(ValueError, match="boom"):
+        maestro.execute()
+
+    assert metrics.get("job_failures_total", job_type="CallableJob", parallel_group="failures") == 1
+
+
+def test_statsd_sink():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.settimeout(5)
+        sink = StatsdSink("127.0.0.1", server.getsockname()[1])
+        metrics = Metrics(sinks=[sink])
+
+        metrics.observe("job_duration_seconds", 0.25, job_type="CallableJob", parallel_group="")
+        metrics.increment("result_bytes_total", 128, parallel_group="pids", backend="process")
+        metrics.set("pool_utilization_ratio", 0.5, parallel_group="pids")
+        received = [server.recv(1024).decode() for _ in range(3)]
+        metrics.close()
+        assert sink._socket is None
+
+        # Closed by Maestro after each run, and opened again by the next observation
+        with sink:
+            metrics.increment("job_failures_total", job_type="CallableJob", parallel_group="")
+            assert server.recv(1024).decode().startswith("pymaestro.job_failures_total:1|c")
+        assert sink._socket is None
+
+    assert received == [
+        "pymaestro.job_duration_seconds:250|ms|#job_type:CallableJob,parallel_group:",
+        "pymaestro.result_bytes_total:128|c|#backend:process,parallel_group:pids",
+        "pymaestro.pool_utilization_ratio:0.5|g|#parallel_group:pids",
+    ]
+
+
+def test_maestro_closes_the_sinks_of_its_metrics():
+    sink = StatsdSink("127.0.0.1", 9)
+    maestro = Maestro(metrics=Metrics(sinks=[sink]))
+    maestro.add(worker_pid, name="pid")
+    maestro.execute()
+    assert sink._socket is None
+    maestro.registry.clear()
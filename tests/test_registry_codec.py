@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from pymaestro import DependsOn, Maestro, Resource
+from pymaestro.job_registry import JobRegistry
+from pymaestro.jobs import create_job
+from pymaestro.utils.deserialize import decode_object
+from pymaestro.utils.registry_codec import dump_registry, is_registry_stream, iter_registry, load_registry
+from tests.helper_scripts.functions import number_resource, sum_of_squares
+
+
+def make_jobs(n: int) -> list:
+    return [
+        create_job(
+            "callable",
+            name=f"job_{i}",
+            executable=sum_of_squares,
+            parallel_group=f"group_{i % 3}" if i % 2 else None,
+            kwargs={"n": i, "options": {"type": "user data", "nested": [1, 2]}},
+        )
+        for i in range(n)
+    ]
+
+
+def test_registry_is_written_one_compact_job_per_line(tmp_path) -> None:
+    path = dump_registry(make_jobs(100), tmp_path / "registry.jsonl")
+    lines = path.read_text().splitlines()
+    assert len(lines) == 101  # the header and one line per job
+    assert json.loads(lines[0])["format"] == "jsonl"
+    assert json.loads(lines[1])["name"] == "job_0"
+    assert ", " not in lines[1]
+    assert is_registry_stream(path)
+
+
+def test_registry_round_trips(tmp_path) -> None:
+    jobs = make_jobs(100)
+    jobs.append(
+        create_job(
+            "callable",
+            name="with_markers",
+            executable=sum_of_squares,
+            args=(DependsOn("job_0"), Resource(number_resource, (3,))),
+        )
+    )
+    registry = load_registry(dump_registry(jobs, tmp_path / "registry.jsonl"))
+
+    assert isinstance(registry, JobRegistry)
+    assert [job.name for job in registry] == [job.name for job in jobs]
+    assert registry[1].kwargs == {"n": 1, "options": {"type": "user data", "nested": [1, 2]}}
+    assert registry[1].parallel_group == "group_1"
+    depends_on, resource = registry[-1].args
+    assert isinstance(depends_on, DependsOn) and isinstance(resource, Resource)
+
+
+def test_iter_registry_decodes_one_job_at_a_time(tmp_path) -> None:
+    path = dump_registry(make_jobs(3), tmp_path / "registry.jsonl")
+    jobs = iter_registry(path)
+    assert next(jobs).name == "job_0"
+    assert [job.name for job in jobs] == ["job_1", "job_2"]
+
+    document = tmp_path / "registry.json"
+    document.write_text("{}\n")
+    assert not is_registry_stream(document)
+    with pytest.raises(ValueError, match="is not a registry written by 'dump_registry'"):
+        next(iter_registry(document))
+
+
+def test_failed_dump_keeps_the_previous_file(tmp_path) -> None:
+    path = dump_registry(make_jobs(2), tmp_path / "registry.jsonl")
+    broken = create_job("callable", name="broken", executable=sum_of_squares, kwargs={"n": object()})
+    with pytest.raises(TypeError):
+        dump_registry([*make_jobs(2), broken], path)
+
+    assert [job.name for job in iter_registry(path)] == ["job_0", "job_1"]
+    assert [p.name for p in tmp_path.iterdir()] == ["registry.jsonl"]
+
+
+def test_decode_object_only_dispatches_registered_tags() -> None:
+    assert decode_object({"type": "user data"}) == {"type": "user data"}
+    assert decode_object({"type": ["unhashable"]}) == {"type": ["unhashable"]}
+    assert decode_object({"n": 1}) == {"n": 1}
+    assert isinstance(decode_object({"type": "DependsOn", "value": "job_0"}), DependsOn)
+
+
+def test_maestro_dump_and_deserialize(tmp_path) -> None:
+    maestro = Maestro()
+    for i in range(10):
+        maestro.add(sum_of_squares, name=f"job_{i}", args=(i,))
+    maestro.dump(tmp_path / "registry.jsonl")
+    maestro.registry.clear()
+
+    maestro.deserialize(tmp_path / "registry.jsonl")
+    assert len(maestro.registry) == 10
+    assert maestro.execute()[0] == 0
+    maestro.registry.clear()
@@ -0,0 +1,99 @@
+import pytest
+
+from pymaestro import Broadcast, DependsOn, Maestro, Resource
+from pymaestro.jobs import AsyncCallableJob, ScriptJob, create_job
+from pymaestro.utils.registry_snapshot import RegistrySnapshot, dump_snapshot, is_registry_snapshot, load_snapshot
+from tests.helper_scripts.functions import boil_water, number_resource, sum_of_squares
+
+
+def make_jobs(n: int) -> list:
+    return [
+        create_job(
+            "callable",
+            name=f"job_{i}",
+            executable=sum_of_squares,
+            parallel_group=f"group_{i % 3}" if i % 2 else None,
+            kwargs={"n": i} if i % 4 else None,
+        )
+        for i in range(n)
+    ]
+
+
+def test_snapshot_is_indexed_without_building_jobs(tmp_path) -> None:
+    path = dump_snapshot(make_jobs(100), tmp_path / "registry.bin")
+    assert is_registry_snapshot(path)
+
+    registry = load_snapshot(path)
+    assert len(registry) == 100
+    assert registry.pending == 100
+    assert "job_42" in registry and registry.index("job_42") == 42
+    registry.swap("job_0", "job_1")
+    registry.remove("job_2")
+    assert registry.pending == 99
+
+    assert registry[0].name == "job_1"
+    assert registry.pending == 98
+    assert [job.name for job in registry.group_members("group_1")][:3] == ["job_1", "job_7", "job_13"]
+    assert len(registry.grouped_jobs) == 52
+    assert registry.pending == 0
+
+
+def test_snapshot_round_trips(tmp_path) -> None:
+    jobs = make_jobs(10)
+    jobs.append(
+        create_job(
+            "callable",
+            name="with_markers",
+            executable=sum_of_squares,
+            args=(DependsOn("job_0"), Resource(number_resource, (3,)), Broadcast([1, 2])),
+            kwargs={"options": {"type": "user data"}},
+        )
+    )
+    jobs.append(create_job("async_callable", name="async", executable=boil_water, max_concurrency=2))
+    jobs.append(
+        create_job("script", name="script", executable="tests.helper_scripts.script_with_result", outputs=["x"])
+    )
+    jobs.append(
+        create_job("script", name="isolated", executable="tests/helper_scripts/download_images.py", isolated=True)
+    )
+
+    registry = load_snapshot(dump_snapshot(jobs, tmp_path / "registry.bin"))
+    assert [job.name for job in registry] == [job.name for job in jobs]
+    assert [job.parallel_group for job in registry] == [job.parallel_group for job in jobs]
+    assert registry[1].kwargs == {"n": 1} and registry[0].kwargs == {}
+
+    depends_on, resource, broadcast = registry[10].args
+    assert isinstance(depends_on, DependsOn) and isinstance(resource, Resource) and broadcast.value == [1, 2]
+    assert registry[10].kwargs == {"options": {"type": "user data"}}
+    assert isinstance(registry[11], AsyncCallableJob) and registry[11].max_concurrency == 2
+    assert isinstance(registry[12], ScriptJob) and registry[12].outputs == ["x"] and not registry[12].isolated
+    assert registry[13].isolated
+
+
+def test_snapshot_loads_lazily(tmp_path) -> None:
+    path = dump_snapshot(make_jobs(2), tmp_path / "registry.bin")
+    job = load_snapshot(path, lazy=True)[1]
+    assert not job.is_resolved
+    assert job.execute() == 1
+    assert load_snapshot(path)[1].is_resolved
+
+
+def test_snapshot_rejects_other_files(tmp_path) -> None:
+    document = tmp_path / "registry.json"
+    document.write_text("{}\n")
+    assert not is_registry_snapshot(document)
+    with pytest.raises(ValueError, match="is not a registry snapshot"):
+        RegistrySnapshot(document)
+
+
+def test_maestro_dump_binary_and_deserialize(tmp_path) -> None:
+    maestro = Maestro()
+    for i in range(10):
+        maestro.add(sum_of_squares, name=f"job_{i}", args=(i,))
+    maestro.dump(tmp_path / "registry.bin", binary=True)
+    maestro.registry.clear()
+
+    maestro.deserialize(tmp_path / "registry.bin")
+    assert maestro.registry.pending == 10
+    assert maestro.execute()[3] == 14
+    maestro.registry.clear()
@@ -0,0 +1,92 @@
+import re
+import threading
+
+import pytest
+
+from pymaestro import DependsOn
+from pymaestro.job_registry import JobRegistry
+from pymaestro.jobs import create_job
+from pymaestro.scheduler import DependencyGraph, run_graph, upstream_names
+
+
+def identity(value):
+    return value
+
+
+def add(a, b):
+    return a + b
+
+
+def make_registry(*specs) -> JobRegistry:
+    registry = JobRegistry()
+    for name, args, kwargs, parallel_group in specs:
+        registry.append(
+            create_job("callable", name=name, executable=add, args=args, kwargs=kwargs, parallel_group=parallel_group)
+        )
+    return registry
+
+
+def test_upstream_names() -> None:
+    job = create_job("callable", name="sum", executable=add, args=(DependsOn("a"),), kwargs={"b": DependsOn("b")})
+    assert upstream_names(job) == {"a", "b"}
+
+
+def test_graph_edges_between_units() -> None:
+    registry = make_registry(
+        ("a", (1, 2), None, None),
+        ("b", (1, 2), None, "group"),
+        ("c", (DependsOn("a"), 2), None, "group"),
+        ("d", (DependsOn("b"),), {"b": DependsOn("a")}, None),
+    )
+    graph = DependencyGraph(registry)
+    a, pool, d = graph.units
+
+    assert graph.roots() == [a]
+    assert graph.upstream[pool] == {a}
+    assert graph.upstream[d] == {a, pool}
+    assert list(graph.topological_order()) == [a, pool, d]
+
+
+def test_graph_topological_order_ignores_insertion_order() -> None:
+    registry = make_registry(("sum", (DependsOn("one"), DependsOn("two")), None, None))
+    registry.append(create_job("callable", name="one", executable=identity, args=(1,)))
+    registry.append(create_job("callable", name="two", executable=identity, args=(2,)))
+    graph = DependencyGraph(registry)
+    assert [unit.name for unit in graph.topological_order()] == ["one", "two", "sum"]
+
+
+def test_graph_raise_key_error_for_unknown_dependency() -> None:
+    registry = make_registry(("a", (DependsOn("missing"), 1), None, None))
+    with pytest.raises(KeyError, match="Job with name 'missing' not found in registry"):
+        DependencyGraph(registry)
+
+
+def test_graph_raise_value_error_for_cycle() -> None:
+    registry = make_registry(("a", (DependsOn("b"), 1), None, None), ("b", (DependsOn("a"), 1), None, None))
+    with pytest.raises(ValueError, match="Circular dependency detected between jobs"):
+        DependencyGraph(registry)
+
+
+def test_graph_raise_value_error_for_dependency_in_same_parallel_group() -> None:
+    registry = make_registry(("a", (1, 1), None, "group"), ("b", (DependsOn("a"), 1), None, "group"))
+    with pytest.raises(ValueError, match=re.escape("is a dependency of a job in the same parallel group 'group'")):
+        DependencyGraph(registry)
+
+
+def test_run_graph_overlaps_independent_units() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait_for_sibling():
+        barrier.wait()
+        return True
+
+    registry = JobRegistry(
+        [
+            create_job("callable", name="first", executable=wait_for_sibling),
+            create_job("callable", name="second", executable=wait_for_sibling),
+        ]
+    )
+    graph = DependencyGraph(registry)
+    # Would raise threading.BrokenBarrierError if the two jobs did not run at the same time
+    results = run_graph(graph, lambda job: job.execute(), max_workers=2)
+    assert list(results.values()) == [True, True]
@@ -0,0 +1,112 @@
+# tests/test_tracing.py
+import json
+import os
+
+import pytest
+
+from pymaestro import Maestro, Resource
+from pymaestro.tracing import Tracer, span
+from tests.helper_scripts.functions import number_resource
+
+
+@pytest.fixture
+def traced_maestro():
+    tracer = Tracer()
+    maestro = Maestro(tracer=tracer)
+    maestro.add(
+        "tests.helper_scripts.functions.sum_of_squares",
+        job_type="callable",
+        name="single",
+        args=(Resource(number_resource, (3,)),),
+    )
+    for i in range(2):
+        maestro.add(
+            "tests.helper_scripts.functions.worker_pid",
+            job_type="callable",
+            name=f"member_{i}",
+            parallel_group="pids",
+            args=(i,),
+        )
+    yield maestro, tracer
+    maestro.registry.clear()
+    Maestro()  # restore the default options of the singleton
+
+
+def spans_by_category(tracer: Tracer) -> dict[str, list]:
+    categories = {}
+    for record in tracer.spans:
+        categories.setdefault(record.category, []).append(record)
+    return categories
+
+
+def test_span_is_noop_without_tracer():
+    assert span("phase", "execute") is span("other", "execute")
+    with span("phase", "execute") as record:
+        assert record is None
+
+
+def test_maestro_records_spans(traced_maestro):
+    maestro, tracer = traced_maestro
+    results = maestro.execute()
+    categories = spans_by_category(tracer)
+
+    [run] = categories["run"]
+    [job] = categories["job"]
+    [pool] = categories["pool"]
+    assert job.name == "single" and job.parent_id == run.span_id
+    assert pool.name == "pids" and pool.parent_id == run.span_id
+    assert {record.trace_id for record in tracer.spans} == {tracer.trace_id}
+    assert len(categories["dependencies"]) == 2
+
+    # Each job of the parallel group has a span in the worker that ran it, and a transfer span
+    members = {record.name: record for record in categories["member"]}
+    assert set(members) == {"member_0", "member_1"}
+    assert {record.pid for record in members.values()} == set(results[1])
+    assert all(record.pid != os.getpid() and record.parent_id == pool.span_id for record in members.values())
+    transfers = categories["transfer"]
+    assert {record.name for record in transfers} == set(members)
+    assert all(record.attributes["worker.pid"] == members[record.name].pid for record in transfers)
+
+    # The resource of the single job is set up and torn down inside its execution
+    [job_execute] = [record for record in categories["execute"] if record.parent_id == job.span_id]
+    assert [record.name for record in categories["resource"]] == ["resource.setup", "resource.teardown"]
+    assert all(record.parent_id == job_execute.span_id for record in categories["resource"])
+
+
+def test_graph_schedule_records_spans_under_run(traced_maestro):
+    maestro, tracer = traced_maestro
+    maestro.execute(schedule="graph")
+    categories = spans_by_category(tracer)
+
+    [run] = categories["run"]
+    assert all(record.parent_id == run.span_id for record in categories["job"] + categories["pool"])
+
+
+def test_span_records_errors():
+    tracer = Tracer()
+    with pytest.raises(ValueError):
+        with tracer.span("failing", "execute"):
+            raise ValueError("boom")
+
+    [record] = tracer.spans
+    assert record.error == "ValueError: boom"
+    assert record.end_ns >= record.start_ns
+
+
+def test_export(traced_maestro, tmp_path):
+    maestro, tracer = traced_maestro
+    maestro.execute()
+
+    chrome = json.loads(tracer.export_chrome(tmp_path / "run.trace.json").read_text())
+    events = [event for event in chrome["traceEvents"] if event["ph"] == "X"]
+    assert len(events) == len(tracer)
+    assert {event["pid"] for event in events} == {event["pid"] for event in chrome["traceEvents"] if event["ph"] == "M"}
+
+    otlp = json.loads(tracer.export_otlp(tmp_path / "run.otlp.json").read_text())
+    [resource_spans] = otlp["resourceSpans"]
+    [scope_spans] = resource_spans["scopeSpans"]
+    spans = scope_spans["spans"]
+    assert len(spans) == len(tracer)
+    span_ids = {otlp_span["spanId"] for otlp_span in spans}
+    assert all(otlp_span.get("parentSpanId", next(iter(span_ids))) in span_ids for otlp_span in spans)
+    assert all(otlp_span["status"] == {"code": 1} for otlp_span in spans)
@@ -0,0 +1,96 @@
+import pickle
+
+import pytest
+
+from pymaestro.jobs import JobPool, create_job
+from pymaestro.utils.transport import EncodedResult, SharedMemoryTransport, dump_segment, load_segment
+from tests.helper_scripts.functions import large_payload
+
+
+@pytest.fixture(scope="function")
+def transport(tmp_path) -> SharedMemoryTransport:
+    return SharedMemoryTransport(threshold=1024, directory=tmp_path)
+
+
+def test_large_bytes_are_moved_to_a_segment_and_received_as_views(transport, tmp_path) -> None:
+    payload = large_payload(4096)
+    encoded = transport.encode(payload)
+    assert isinstance(encoded.buffers[0], tuple)
+    assert encoded.nbytes < 1024
+
+    result = transport.decode(encoded)
+    assert isinstance(result, memoryview)
+    assert result.readonly
+    assert result == payload
+    assert list(tmp_path.iterdir()) == []  # the segment is unlinked as soon as it is mapped
+
+
+def test_large_bytes_are_copied_back_on_request(tmp_path) -> None:
+    transport = SharedMemoryTransport(threshold=1024, directory=tmp_path, copy_bytes=True)
+    payload = large_payload(4096)
+    result = transport.decode(transport.encode(payload))
+    assert type(result) is bytes
+    assert result == payload
+    assert type(transport.decode(transport.encode(bytearray(payload)))) is bytearray
+
+
+def test_large_out_of_band_buffers_are_received_as_views(transport) -> None:
+    result = transport.decode(transport.encode({"payload": pickle.PickleBuffer(large_payload(4096))}))
+    assert isinstance(result["payload"], memoryview)
+    assert result["payload"].readonly
+    assert result["payload"] == large_payload(4096)
+
+
+def test_small_buffers_are_sent_inline(transport, tmp_path) -> None:
+    encoded = transport.encode(b"small")
+    assert encoded.buffers == [b"small"]
+    assert transport.decode(encoded) == b"small"
+    assert type(transport.decode(transport.encode(bytearray(b"small")))) is bytearray
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_objects_without_buffers_round_trip(transport) -> None:
+    value = {"numbers": [1, 2, 3], "text": "abc"}
+    encoded = transport.encode(value)
+    assert isinstance(encoded, EncodedResult)
+    assert encoded.buffers == []
+    assert transport.decode(encoded) == value
+
+
+def test_job_pool_with_transport(transport, tmp_path) -> None:
+    pool = JobPool(
+        *(
+            create_job("callable", name=f"payload_{i}", executable=large_payload, args=(size,), parallel_group="p")
+            for i, size in enumerate((256, 8192))
+        )
+    )
+    small, large = pool.execute(max_workers=2, transport=transport)
+    assert small == large_payload(256)
+    assert isinstance(large, memoryview)
+    assert large == large_payload(8192)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_segments_of_results_not_consumed_are_removed(transport, tmp_path) -> None:
+    pool = JobPool(
+        *(
+            create_job("callable", name=f"payload_{i}", executable=large_payload, args=(8192,), parallel_group="p")
+            for i in range(4)
+        )
+    )
+    results = pool.execute(max_workers=2, transport=transport)
+    assert next(results) == large_payload(8192)
+    results.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_segments_round_trip_and_are_shared_by_equal_values(tmp_path) -> None:
+    value = {"payload": pickle.PickleBuffer(large_payload(4096)), "numbers": [1, 2, 3]}
+    path, digest = dump_segment(value, tmp_path)
+    assert dump_segment(value, tmp_path) == (path, digest)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    loaded = load_segment(path)
+    assert loaded["numbers"] == [1, 2, 3]
+    assert isinstance(loaded["payload"], memoryview)  # a view on the mapped segment, not a copy
+    assert loaded["payload"] == large_payload(4096)